@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from evo.grading import grade_results_root
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Grade every run/seed_* in a results root")
+    p.add_argument("results_root", type=Path)
+    p.add_argument("--workers", type=int, default=None, help="Process count (default: CPUs)")
+    p.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Constant-memory journal scan instead of array loading",
+    )
+    p.add_argument("--cache-dir", type=Path, default=None, help="Shared fitness cache directory")
+    p.add_argument("--cache-max-mb", type=int, default=256)
+    args = p.parse_args()
+
+    table = grade_results_root(
+        args.results_root,
+        workers=args.workers,
+        streaming=args.streaming,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+    )
+    print(f"Wrote {table}")
+
+
+if __name__ == "__main__":
+    main()
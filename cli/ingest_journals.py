@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from evo.grading import ingest_results_root
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Convert run/seed_*/journal.csv to columnar sidecars")
+    p.add_argument("results_root", type=Path)
+    p.add_argument("--workers", type=int, default=None, help="Process count (default: CPUs)")
+    args = p.parse_args()
+
+    written = ingest_results_root(args.results_root, workers=args.workers)
+    print(f"Wrote {len(written)} journal sidecars")
+
+
+if __name__ == "__main__":
+    main()
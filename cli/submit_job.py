@@ -11,19 +11,22 @@ def main() -> None:
     p.add_argument("bundle", type=Path)
     p.add_argument("--generation", required=True)
     p.add_argument("--seed", type=int, required=True)
-    p.add_argument("--mode", choices=["file", "http"], default="file")
+    p.add_argument("--mode", choices=["file", "http", "local"], default="file")
     p.add_argument("--jobs-dir", default="jobs")
     p.add_argument("--http-base", default="http://localhost:8080")
+    p.add_argument("--local-dir", default="local_runs")
     p.add_argument("--timeout-s", type=int, default=3600)
+    p.add_argument("--max-rolls", type=int, default=None, help="Roll budget per seed")
     args = p.parse_args()
 
     cfg = {
         "mode": args.mode,
         "jobs_dir": args.jobs_dir,
         "http_base": args.http_base,
+        "local_dir": args.local_dir,
         "poll_interval_ms": 500,
     }
-    handle = submit_job(cfg, args.bundle, args.generation, args.seed, {})
+    handle = submit_job(cfg, args.bundle, args.generation, args.seed, {}, max_rolls=args.max_rolls)
     rec = await_completion(cfg, handle, args.timeout_s)
     print(rec)
 
@@ -0,0 +1,91 @@
+"""
+Per-run evolution state: adaptive policy, top-k history and other caches, RNG streams.
+
+``evolve``/``breed_generation`` and the mutation operators take an ``EvolutionContext``;
+without one they use ``GLOBAL_CONTEXT``, which wraps the legacy ``ADAPTIVE`` and
+``METRICS_CACHE`` singletons so existing callers behave as before. Independent runs in one
+process each hold their own context. Contexts round-trip through JSON (``to_dict`` /
+``save``), so a run can be checkpointed and resumed.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from .dna import make_rng_subseed
+from .policy.adaptive import ADAPTIVE, AdaptiveState
+from .rng import make_subseed
+
+CONTEXT_VERSION = 1
+
+# Legacy process-wide cache ("prev_topk": previous generation's top-k scores).
+METRICS_CACHE: Dict[str, Any] = {}
+
+
+@dataclass
+class EvolutionContext:
+    adaptive: AdaptiveState = field(default_factory=AdaptiveState)
+    # Cross-generation history; values must be JSON-serializable.
+    metrics_cache: Dict[str, Any] = field(default_factory=dict)
+    root_seed: Optional[int] = None
+
+    def _seed(self, root_seed: Optional[int]) -> int:
+        seed = self.root_seed if root_seed is None else root_seed
+        if seed is None:
+            raise ValueError("EvolutionContext has no root_seed for RNG streams")
+        return seed
+
+    def stream(self, name: str, root_seed: Optional[int] = None) -> random.Random:
+        """Independent, reproducible ``random.Random`` for ``name`` under the run's seed."""
+        return random.Random(make_subseed(name, self._seed(root_seed)))
+
+    def slot_stream(self, label: str, index: int, root_seed: Optional[int] = None) -> random.Random:
+        """
+        The stream offspring slot ``index`` of generation ``label`` breeds from; its seed
+        is the ``rng_subseed`` recorded in the child's DNA.
+        """
+        return random.Random(make_rng_subseed(label, index, self._seed(root_seed)))
+
+    def reset(self) -> None:
+        """Back to a fresh run, in place (objects shared with other holders stay shared)."""
+        self.adaptive.__dict__.update(AdaptiveState().__dict__)
+        self.metrics_cache.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        adaptive = asdict(self.adaptive)
+        adaptive["meh_band"] = list(adaptive["meh_band"])
+        return {
+            "context_version": CONTEXT_VERSION,
+            "adaptive": adaptive,
+            "metrics_cache": json.loads(json.dumps(self.metrics_cache)),
+            "root_seed": self.root_seed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "EvolutionContext":
+        if data.get("context_version") != CONTEXT_VERSION:
+            raise ValueError(f"Unsupported context_version {data.get('context_version')!r}")
+        known = {f.name for f in fields(AdaptiveState)}
+        adaptive = {k: v for k, v in data.get("adaptive", {}).items() if k in known}
+        if "meh_band" in adaptive:
+            adaptive["meh_band"] = tuple(adaptive["meh_band"])
+        return cls(
+            adaptive=AdaptiveState(**adaptive),
+            metrics_cache=dict(data.get("metrics_cache", {})),
+            root_seed=data.get("root_seed"),
+        )
+
+    def save(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "EvolutionContext":
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+GLOBAL_CONTEXT = EvolutionContext(adaptive=ADAPTIVE, metrics_cache=METRICS_CACHE)
@@ -3,11 +3,16 @@ from __future__ import annotations
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .rng import make_subseed
 
+if TYPE_CHECKING:
+    from .io.lineage import LineageStore
+
 DNA_SCHEMA_VERSION = "0.2"
+# dna.json whose ops_log is only the local delta; the rest lives in a lineage store.
+DELTA_DNA_SCHEMA_VERSION = "0.3"
 
 
 def load_spec(path: Path) -> Dict[str, Any]:
@@ -50,9 +55,14 @@ def build_parent_hashes(parents: Iterable[Tuple[str, Path]]) -> Dict[str, str]:
     parents: iterable of (seed_id, spec_path)
     Returns mapping seed_id -> sha256(spec.json bytes), sorted by seed_id for stability.
     """
+    return parent_hashes_from_bytes((seed_id, path.read_bytes()) for seed_id, path in parents)
+
+
+def parent_hashes_from_bytes(parents: Iterable[Tuple[str, bytes]]) -> Dict[str, str]:
+    """Like ``build_parent_hashes`` for spec.json contents already held in memory."""
     pairs = []
-    for seed_id, spec_path in parents:
-        pairs.append((seed_id, spec_hash_from_file(spec_path)))
+    for seed_id, data in parents:
+        pairs.append((seed_id, spec_hash_from_bytes(data)))
     return {k: v for k, v in sorted(pairs, key=lambda x: x[0])}
 
 
@@ -65,18 +75,56 @@ def update_dna(
     parent_hashes: Dict[str, str],
     rng_subseed: int,
     op_entries: List[Dict[str, Any]],
+    lineage: Optional[LineageStore] = None,
+    parent_refs: Sequence[Optional[str]] = (),
+    elite_of: Optional[str] = None,
 ) -> Dict[str, Any]:
+    """
+    Stamp lineage fields onto a copy of ``dna``. Without ``lineage`` the inherited
+    ops_log is carried in full; with a store, ``dna`` keeps only the ops added since its
+    source's own record plus a ``lineage`` pointer, and the record is appended to the
+    store. ``parent_refs`` are the parents' ``lineage_ref`` values, aligned with ``parents``.
+    ``elite_of`` is the seed id an elite copy had in the previous generation.
+    """
     out = dict(dna) if dna else {}
     out["evo_schema_version"] = DNA_SCHEMA_VERSION
     out["parents"] = list(parents)
+    if elite_of is None:
+        out.pop("elite_of", None)
+    else:
+        out["elite_of"] = elite_of
     out["parent_hashes"] = {k: parent_hashes[k] for k in sorted(parent_hashes.keys())}
     out["rng_subseed"] = int(rng_subseed)
     ident = dict(out.get("identity", {}))
     ident.update({"source": "evolver", "gen_id": gen_id, "candidate_id": candidate_id})
     out["identity"] = ident
     legacy = normalize_ops_log(out.get("ops_log", []))
+    if lineage is None:
+        out.pop("lineage", None)
+    else:
+        # The source's own delta was already recorded under its ref; keep what came after.
+        legacy = legacy[int((out.get("lineage") or {}).get("ops", 0)) :]
     seq = list(legacy) + list(op_entries)
     for i, ent in enumerate(seq):
         ent["t"] = i
     out["ops_log"] = seq
+    if lineage is not None:
+        ref = lineage.append(
+            {
+                "gen_id": gen_id,
+                "candidate_id": candidate_id,
+                "parents": out["parents"],
+                "parent_refs": list(parent_refs),
+                "parent_hashes": out["parent_hashes"],
+                "rng_subseed": out["rng_subseed"],
+                "ops": [{k: v for k, v in ent.items() if k != "t"} for ent in seq],
+            }
+        )
+        out["evo_schema_version"] = DELTA_DNA_SCHEMA_VERSION
+        out["lineage"] = {"ref": ref, "ops": len(seq)}
     return out
+
+
+def lineage_ref(dna: Dict[str, Any]) -> Optional[str]:
+    """Pointer into the lineage store, or None for DNA that carries its full ops_log."""
+    return (dna.get("lineage") or {}).get("ref")
@@ -1,42 +1,255 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import math
 import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
-from .dna import build_parent_hashes, make_rng_subseed, update_dna
-from .io.export import write_generation_folder
+import numpy as np
+
+from .context import GLOBAL_CONTEXT, METRICS_CACHE, EvolutionContext
+from .dna import lineage_ref, make_rng_subseed, parent_hashes_from_bytes, update_dna
+from .genome import GenomeSchema, vary
+from .io.bundles import open_bundle_root
+from .io.eval_memo import MemoOptions, plan_folder
+from .io.export import render_generation_folder, write_rendered_folder
+from .io.fitness_table import FITNESS_TABLE_NAME, read_fitness_table, read_spec_hashes
+from .io.lineage import LineageStore
+from .io.lineage_db import LineageDB
 from .metrics.diversity import diversity_index
-from .mutation import crossover_individuals, mutate_individual
-from .policy.adaptive import ADAPTIVE
-from .population import Individual, load_individual_from_run
-from .rng import rng_context
-from .selection import elitism, tournament
+from .mutation import crossover_individuals, mutate_individual, record_op
+from .population import Individual, LazyIndividual, load_individual_from_run, numeric_fields
+from .rng import make_subseed
+from .selection import (
+    DEFAULT_OBJECTIVES,
+    PARENT_SELECTIONS,
+    elite_indices,
+    nsga2_key,
+    score_array,
+    select_parents,
+    tournament,
+)
+from .surrogate import Surrogate
+
+__all__ = [
+    "METRICS_CACHE",
+    "VARIATIONS",
+    "BredGeneration",
+    "SpecSource",
+    "breed_child",
+    "breed_generation",
+    "evolve",
+    "load_population",
+]
+
+# spec_source(seed_id) -> bytes of that parent's spec.json, or None if unavailable.
+SpecSource = Callable[[str], Optional[bytes]]
+
+# "dict": per-slot operators on spec dicts (see ``_BreedPlan``); "matrix": whole-generation
+# batch operators on an ``evo.genome`` encoding (see ``_vary_matrix``).
+VARIATIONS = ("dict", "matrix")
+
+
+@dataclass
+class BredGeneration:
+    label: str
+    individuals: List[Individual]
+    elite_ids: set[str]
+    manifest_overrides: Dict[str, Any]
+
 
-METRICS_CACHE: Dict[str, Any] = {}
+@dataclass
+class _BreedPlan:
+    """Everything one offspring slot needs; picklable for process pools."""
+
+    population: List[Individual]
+    scores: Dict[str, Any]
+    label: str
+    root_seed: int
+    cx_prob: float
+    mut_prob: float
+    mode: str
+    # Pre-drawn (a, b) parent indices per slot from the array engine; None = tournaments.
+    parents: Optional[np.ndarray] = None
+    first_slot: int = 1
+    tournament_size: int = 3
+    # Source of the per-slot RNG streams (a pickled copy in pool workers).
+    context: EvolutionContext = field(default_factory=EvolutionContext)
+
+    def breed(self, idx: int) -> tuple[Individual, list[dict[str, Any]]]:
+        rng = self.context.slot_stream(self.label, idx, self.root_seed)
+        drawn = None if self.parents is None else self.parents[idx - self.first_slot]
+        child, op_entries = breed_child(
+            self.population,
+            rng,
+            self.cx_prob,
+            self.mut_prob,
+            self.mode,
+            key=lambda ind: self.scores[ind.seed_id],
+            tournament_size=self.tournament_size,
+            drawn=drawn,
+        )
+        child.seed_id = "TBD"
+        child.generation = int(self.label.strip("g") or "0")
+        child.fitness = 0.0
+        child.metrics = {}
+        return child, op_entries
+
+
+def breed_child(
+    population: List[Individual],
+    rng: random.Random,
+    cx_prob: float,
+    mut_prob: float,
+    mode: str,
+    key: Optional[Callable[[Individual], Any]] = None,
+    tournament_size: int = 3,
+    drawn: Optional[Sequence[int]] = None,
+) -> tuple[Individual, list[dict[str, Any]]]:
+    """
+    One offspring and its structured op entries, drawing only from ``rng``: crossover of
+    two tournament winners with probability ``cx_prob``, otherwise a mutant (nudge 0.1
+    below ``cx_prob + mut_prob``, else 0.05). ``drawn`` (a, b) population indices replace
+    the tournaments. Shared by generational breeding and steady-state births.
+    """
+    roll = rng.random()
+    if len(population) >= 2 and roll < cx_prob:
+        if drawn is not None:
+            a, b = population[drawn[0]], population[drawn[1]]
+        else:
+            a = tournament(population, k=tournament_size, key=key, rng=rng)
+            b = tournament(population, k=tournament_size, key=key, rng=rng)
+            if a.seed_id == b.seed_id:
+                b = tournament(population, k=tournament_size, key=key, rng=rng)
+        child = crossover_individuals(a, b, rng=rng)
+        return child, [{"type": "crossover", "mode": "blocks"}]
+    if drawn is not None:
+        parent = population[drawn[0]]
+    else:
+        parent = tournament(population, k=tournament_size, key=key, rng=rng)
+    base_nudge = 0.1 if roll < cx_prob + mut_prob else 0.05
+    child = mutate_individual(parent, nudge_frac=base_nudge, rng=rng, mode=mode)
+    actual_nudge = base_nudge * 2.5 if mode == "WILDCARD" else base_nudge
+    return child, [{"type": "mutation", "nudge_frac": actual_nudge, "mode": mode}]
+
+
+def _vary_matrix(
+    current: List[Individual],
+    parents: np.ndarray,
+    label: str,
+    root_seed: int,
+    cx_prob: float,
+    mut_prob: float,
+    mode: str,
+) -> List[tuple[Individual, list[dict[str, Any]]]]:
+    """
+    One offspring per row of ``parents`` from a single ``genome.vary`` call: the population
+    is encoded once, crossover flags and nudges come from one generator seeded with
+    ``make_subseed("<label>:variation", root_seed)``, and the batch is decoded in one pass.
+    Children keep parent a's other top-level spec blocks, as ``mutate_spec`` does.
+    """
+    specs = [ind.spec for ind in current]
+    schema = GenomeSchema.from_specs(specs)
+    rng = np.random.default_rng(make_subseed(f"{label}:variation", root_seed))
+    roll = rng.random(len(parents))
+    cx = (roll < cx_prob) & (len(current) >= 2)
+    nudge = np.where(roll < cx_prob + mut_prob, 0.1, 0.05)
+    actual = nudge * 2.5 if mode == "WILDCARD" else nudge
+    batch = vary(schema.encode(specs), parents[:, 0], parents[:, 1], cx, actual, rng)
+    generation = int(label.strip("g") or "0")
+    offspring: List[tuple[Individual, list[dict[str, Any]]]] = []
+    for spec, (ia, ib), crossed, step in zip(
+        schema.decode(batch), parents.tolist(), cx.tolist(), actual.tolist()
+    ):
+        a = current[ia]
+        if crossed:
+            ids = list(dict.fromkeys([a.seed_id, current[ib].seed_id]))
+            dna = record_op(a.dna, "crossover(uniform)")
+            op_entries = [{"type": "crossover", "mode": "uniform"}]
+        else:
+            ids = [a.seed_id]
+            dna = record_op(a.dna, f"mutate(nudge={step})")
+            op_entries = [{"type": "mutation", "nudge_frac": step, "mode": mode}]
+        child = Individual("TBD", generation, {**a.spec, **spec}, dna, 0.0, parents=ids)
+        offspring.append((child, op_entries))
+    return offspring
+
+
+_WORKER_PLAN: Optional[_BreedPlan] = None
+
+
+def _init_breeder(plan: _BreedPlan) -> None:
+    global _WORKER_PLAN
+    _WORKER_PLAN = plan
+
+
+def _breed_in_worker(idx: int) -> tuple[Individual, list[dict[str, Any]]]:
+    return _WORKER_PLAN.breed(idx)
+
+
+def _fitness_key(ind: Individual) -> float:
+    return ind.fitness
 
 
 def _make_fitness_snapshot(pop: List[Individual]) -> list[dict[str, Any]]:
     snapshot: list[dict[str, Any]] = []
     for ind in pop:
-        spec_blob = json.dumps(ind.spec, sort_keys=True)
-        spec_hash = hashlib.sha1(spec_blob.encode("utf-8")).hexdigest()
-        snapshot.append({"fitness_score": ind.fitness, "spec_hash": spec_hash})
+        snapshot.append({"fitness_score": ind.fitness, "spec_hash": ind.spec_hash})
     return snapshot
 
 
-def load_population(results_root: Path, generation: int) -> List[Individual]:
-    """Load individuals from /run/<seed_id>/ subfolders."""
+def load_population(results_root: Path, generation: int, lazy: bool = False) -> List[Individual]:
+    """
+    Load individuals from /run/<seed_id>/ subfolders.
+    ``results_root`` may be a results bundle (.zip); members are read without extraction.
+    ``lazy`` builds the population from fitness alone (``run/fitness_table.csv`` if present,
+    else each fitness.json) as ``LazyIndividual``s; spec.json/dna.json are read only for
+    the individuals breeding touches. Bundles are always loaded eagerly.
+    """
+    if lazy and isinstance(results_root, Path) and not results_root.is_file():
+        return _load_lazy(results_root, generation)
+    if results_root.is_file() and results_root.suffix == ".zip":
+        root = open_bundle_root(results_root)
+        try:
+            return load_population(root, generation)
+        finally:
+            root.root.close()
     pop: List[Individual] = []
     run_dir = results_root / "run"
-    for seed_dir in sorted(p for p in run_dir.iterdir() if p.is_dir()):
+    seed_dirs = [p for p in run_dir.iterdir() if p.is_dir()]
+    for seed_dir in sorted(seed_dirs, key=lambda p: p.name):
         pop.append(load_individual_from_run(seed_dir, generation))
     return pop
 
 
+def _load_lazy(results_root: Path, generation: int) -> List[Individual]:
+    run_dir = results_root / "run"
+    hashes: Dict[str, str] = {}
+    if (run_dir / FITNESS_TABLE_NAME).exists():
+        index = read_fitness_table(run_dir)
+        hashes = read_spec_hashes(run_dir)
+    else:
+        index = {}
+        for seed_dir in run_dir.iterdir():
+            path = seed_dir / "fitness.json"
+            if path.exists():
+                index[seed_dir.name] = numeric_fields(json.loads(path.read_text()))
+    return [
+        LazyIndividual(
+            seed_id,
+            generation,
+            results_root / seed_id,
+            index[seed_id].get("fitness_score", 0.0),
+            index[seed_id],
+            hashes.get(seed_id),
+        )
+        for seed_id in sorted(index)
+    ]
+
+
 def evolve(
     results_root: Path,
     out_dir: Path,
@@ -46,14 +259,181 @@ def evolve(
     elite_ratio: float = 0.1,
     cx_prob: float = 0.7,
     mut_prob: float = 0.3,
+    selection: str = "fitness",
+    objectives: Sequence[str] = DEFAULT_OBJECTIVES,
+    workers: Optional[int] = None,
+    lineage: Optional[LineageStore] = None,
+    lineage_db: Optional[LineageDB] = None,
+    parent_selection: str = "tournament",
+    lazy: bool = False,
+    context: Optional[EvolutionContext] = None,
+    tournament_size: int = 3,
+    surrogate: Optional[Surrogate] = None,
+    variation: str = "dict",
+    memo: Optional[MemoOptions] = None,
 ) -> List[Individual]:
-    """Perform one evolutionary step to produce the next generation."""
-    current = load_population(results_root, generation=int(gen_id.strip("g") or "0"))
+    """
+    Perform one evolutionary step to produce the next generation.
+    ``results_root`` may be a results bundle (.zip), read in place without extraction.
+    ``selection="nsga2"`` ranks by Pareto front and crowding distance over ``objectives``
+    (fitness.json fields) instead of the scalar ``fitness_score``. ``workers`` breeds
+    offspring in a process pool without changing the output. With a ``lineage`` store,
+    dna.json carries only each individual's local ops plus a pointer into the store.
+    ``lineage_db`` indexes the written generation in one transaction. ``parent_selection``
+    picks the parent-selection scheme (``selection.PARENT_SELECTIONS``). ``lazy`` loads
+    the population fitness-first (see ``load_population``). ``context`` carries the run's
+    adaptive state and top-k history (default: the process-wide ``GLOBAL_CONTEXT``).
+    ``tournament_size`` sets how many contestants each tournament draws. A ``surrogate``
+    (kept by the caller across generations) pre-screens offspring before they are written.
+    ``variation="matrix"`` breeds all offspring as one ``evo.genome`` batch (see
+    ``breed_generation``). With ``memo`` the written generation is also planned against
+    the evaluation memo: submit ``submission_dir(out_dir)`` instead of ``out_dir`` and,
+    once graded, pass its ``submission_plan.json`` to ``attach_memo_results``.
+    """
+    if results_root.is_file() and results_root.suffix == ".zip":
+        root = open_bundle_root(results_root)
+        try:
+            return evolve(
+                root,
+                out_dir,
+                gen_id,
+                root_seed,
+                pop_size=pop_size,
+                elite_ratio=elite_ratio,
+                cx_prob=cx_prob,
+                mut_prob=mut_prob,
+                selection=selection,
+                objectives=objectives,
+                workers=workers,
+                lineage=lineage,
+                lineage_db=lineage_db,
+                parent_selection=parent_selection,
+                lazy=lazy,
+                context=context,
+                tournament_size=tournament_size,
+                surrogate=surrogate,
+                variation=variation,
+                memo=memo,
+            )
+        finally:
+            root.root.close()
+    current = load_population(results_root, generation=int(gen_id.strip("g") or "0"), lazy=lazy)
+    bred = breed_generation(
+        current,
+        gen_id,
+        root_seed,
+        spec_source=_spec_files(results_root),
+        pop_size=pop_size,
+        elite_ratio=elite_ratio,
+        cx_prob=cx_prob,
+        mut_prob=mut_prob,
+        selection=selection,
+        objectives=objectives,
+        workers=workers,
+        lineage=lineage,
+        parent_selection=parent_selection,
+        context=context,
+        tournament_size=tournament_size,
+        surrogate=surrogate,
+        variation=variation,
+    )
+    if not bred.individuals:
+        return []
+    files = render_generation_folder(
+        bred.label, bred.individuals, bred.elite_ids, bred.manifest_overrides
+    )
+    write_rendered_folder(out_dir, files)
+    if lineage_db is not None:
+        lineage_db.add_generation(files)
+    if memo is not None:
+        plan_folder(out_dir, memo)
+    return bred.individuals
+
+
+def _spec_files(results_root: Path) -> SpecSource:
+    def _read(seed_id: str) -> Optional[bytes]:
+        path = results_root / seed_id / "spec.json"
+        return path.read_bytes() if path.exists() else None
+
+    return _read
+
+
+def _draw_parents(method: str, scores: np.ndarray, n: int, seed: int, k: int = 3) -> np.ndarray:
+    # One generator per generation: column 0 is parent a, column 1 parent b (redrawn once
+    # where it repeats a, as the tournament path does).
+    rng = np.random.default_rng(seed)
+    a = select_parents(method, scores, n, rng, k=k)
+    b = select_parents(method, scores, n, rng, k=k)
+    same = np.flatnonzero(a == b)
+    if len(same) and len(scores) > 1:
+        b[same] = select_parents(method, scores, len(same), rng, k=k)
+    return np.stack([a, b], axis=1)
+
+
+def _parent_refs(
+    candidate: Individual,
+    elite_ids: set[str],
+    by_id: Dict[str, Individual],
+    refs: Dict[str, Optional[str]],
+) -> List[Optional[str]]:
+    # An elite copy descends from its own record; offspring from their tournament parents.
+    # ``refs`` caches lookups so only parents actually used have their DNA read.
+    ids = [candidate.seed_id] if candidate.seed_id in elite_ids else candidate.parents or []
+    for pid in ids:
+        if pid not in refs and pid in by_id:
+            refs[pid] = lineage_ref(by_id[pid].dna)
+    return [refs.get(pid) for pid in ids]
+
+
+def breed_generation(
+    current: List[Individual],
+    gen_id: str,
+    root_seed: int,
+    spec_source: SpecSource,
+    pop_size: int | None = None,
+    elite_ratio: float = 0.1,
+    cx_prob: float = 0.7,
+    mut_prob: float = 0.3,
+    selection: str = "fitness",
+    objectives: Sequence[str] = DEFAULT_OBJECTIVES,
+    workers: Optional[int] = None,
+    lineage: Optional[LineageStore] = None,
+    parent_selection: str = "tournament",
+    context: Optional[EvolutionContext] = None,
+    tournament_size: int = 3,
+    surrogate: Optional[Surrogate] = None,
+    variation: str = "dict",
+) -> BredGeneration:
+    """
+    Breed the generation after ``gen_id`` from a scored population without touching disk.
+    Parent hashes in the DNA come from ``spec_source``; ``evolve`` reads them from
+    ``results_root/<seed_id>/spec.json``. ``workers > 1`` breeds offspring slots in a
+    process pool; the result is byte-identical to the serial run. Lineage records go to
+    ``lineage`` (flushed before returning) when given. ``parent_selection`` other than
+    "tournament" draws every slot's parents in one vectorized call (see ``selection``).
+    The adaptive mode and top-k history are read from and advanced in ``context``.
+    ``tournament_size`` applies to "tournament" and "batch_tournament". A ``surrogate``
+    first observes ``current``; once it is ready, oversampled offspring are screened by
+    predicted fitness (see ``evo.surrogate``) and each keeps its breeding slot's subseed.
+    ``variation="matrix"`` encodes ``current`` as an ``evo.genome`` batch and breeds every
+    offspring in one ``vary`` call ("tournament" parents become "batch_tournament");
+    ``workers`` is then unused. Its output differs from the "dict" path but is equally
+    reproducible from ``root_seed``.
+    """
+    if selection not in ("fitness", "nsga2"):
+        raise ValueError(f"Unknown selection {selection!r}")
+    if parent_selection not in PARENT_SELECTIONS:
+        raise ValueError(f"Unknown parent selection {parent_selection!r}")
+    if tournament_size < 1:
+        raise ValueError("tournament_size must be >= 1")
+    if variation not in VARIATIONS:
+        raise ValueError(f"Unknown variation {variation!r}")
     if pop_size is None:
         pop_size = len(current)
-
+    ctx = GLOBAL_CONTEXT if context is None else context
+    adaptive = ctx.adaptive
     fitness_results = _make_fitness_snapshot(current)
-    prev_topk = METRICS_CACHE.get("prev_topk", [])
+    prev_topk = ctx.metrics_cache.get("prev_topk", [])
     topk_limit = max(1, len(fitness_results) // 10) if fitness_results else 0
     curr_topk = (
         sorted((r["fitness_score"] for r in fitness_results), reverse=True)[:topk_limit]
@@ -61,62 +441,95 @@ def evolve(
         else []
     )
     diversity = diversity_index(fitness_results) if fitness_results else 0.0
-    ADAPTIVE.update(prev_topk, curr_topk, diversity)
-    METRICS_CACHE["prev_topk"] = curr_topk
-    mode_snapshot = ADAPTIVE.snapshot()
+    adaptive.update(prev_topk, curr_topk, diversity)
+    ctx.metrics_cache["prev_topk"] = curr_topk
+    mode_snapshot = adaptive.snapshot()
     grace_info = {
-        "enabled": ADAPTIVE.mode == "WILDCARD",
-        "grace_remaining": 2 if ADAPTIVE.mode == "WILDCARD" else 0,
+        "enabled": adaptive.mode == "WILDCARD",
+        "grace_remaining": 2 if adaptive.mode == "WILDCARD" else 0,
     }
 
+    next_gen_label = f"g{int(gen_id.strip('g') or '0')+1}"
     if pop_size == 0:
-        return []
+        return BredGeneration(next_gen_label, [], set(), {})
 
     elite_k = max(1, math.floor(pop_size * elite_ratio))
-    elites = elitism(current, elite_k)
+    key = nsga2_key(current, objectives) if selection == "nsga2" else None
+    scores = score_array(current, key or _fitness_key)
+    elites = [current[i] for i in elite_indices(scores, elite_k)]
     elite_ids = {e.seed_id for e in elites}
 
     elite_info: list[tuple[Individual, list[dict[str, Any]]]] = [(elite, []) for elite in elites]
-    offspring: list[tuple[Individual, list[dict[str, Any]]]] = []
-    with rng_context("evolution", root_seed):
-        while len(offspring) < (pop_size - elite_k):
-            roll = random.random()
-            if len(current) >= 2 and roll < cx_prob:
-                a = tournament(current, k=3)
-                b = tournament(current, k=3)
-                if a.seed_id == b.seed_id:
-                    b = tournament(current, k=3)
-                child = crossover_individuals(a, b)
-                op_entries = [{"type": "crossover", "mode": "blocks"}]
-            else:
-                parent = tournament(current, k=3)
-                base_nudge = 0.1 if roll < cx_prob + mut_prob else 0.05
-                child = mutate_individual(parent, nudge_frac=base_nudge)
-                actual_nudge = base_nudge * 2.5 if ADAPTIVE.mode == "WILDCARD" else base_nudge
-                op_entries = [
-                    {
-                        "type": "mutation",
-                        "nudge_frac": actual_nudge,
-                        "mode": ADAPTIVE.mode,
-                    }
-                ]
-            child.seed_id = "TBD"
-            child.generation = int(gen_id.strip("g") or "0") + 1
-            child.fitness = 0.0
-            offspring.append((child, op_entries))
+    # Offspring slot idx (1-based, after the elites) draws only from its own stream seeded
+    # by make_rng_subseed(next_gen_label, idx, root_seed), so slots can run in any order
+    # or process and still give the same generation.
+    first_slot = len(elite_info) + 1
+    n_offspring = max(0, pop_size - elite_k)
+    screening = False
+    if surrogate is not None:
+        surrogate.observe(current)
+        screening = surrogate.ready
+    n_bred = n_offspring * surrogate.oversample if screening else n_offspring
+    slots = range(first_slot, first_slot + n_bred)
+    parents = None
+    if parent_selection != "tournament" or variation == "matrix":
+        parents = _draw_parents(
+            "batch_tournament" if parent_selection == "tournament" else parent_selection,
+            scores,
+            len(slots),
+            make_subseed(f"{next_gen_label}:parents", root_seed),
+            k=tournament_size,
+        )
+    plan = _BreedPlan(
+        population=current,
+        scores={ind.seed_id: (key or _fitness_key)(ind) for ind in current},
+        label=next_gen_label,
+        root_seed=root_seed,
+        cx_prob=cx_prob,
+        mut_prob=mut_prob,
+        mode=adaptive.mode,
+        parents=parents,
+        first_slot=first_slot,
+        tournament_size=tournament_size,
+        context=ctx,
+    )
+    if variation == "matrix":
+        offspring = _vary_matrix(
+            current, parents, next_gen_label, root_seed, cx_prob, mut_prob, adaptive.mode
+        )
+    elif not workers or workers <= 1 or len(slots) < 2:
+        offspring = [plan.breed(idx) for idx in slots]
+    else:
+        chunksize = max(1, len(slots) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_breeder, initargs=(plan,)
+        ) as pool:
+            offspring = list(pool.map(_breed_in_worker, slots, chunksize=chunksize))
+    # Breeding slot of every member, recorded as its rng_subseed (elites: their index).
+    bred_slots = list(range(1, first_slot)) + list(slots)
+    if screening and n_bred > n_offspring:
+        keep = surrogate.screen(
+            [child.spec for child, _ in offspring],
+            n_offspring,
+            make_subseed(f"{next_gen_label}:surrogate", root_seed),
+        )
+        offspring = [offspring[i] for i in keep]
+        bred_slots = list(range(1, first_slot)) + [slots[i] for i in keep]
 
-    next_gen_label = f"g{int(gen_id.strip('g') or '0')+1}"
     combined: list[tuple[Individual, list[dict[str, Any]]]] = elite_info + offspring
 
+    by_id = {ind.seed_id: ind for ind in current} if lineage else {}
+    # Elites get new DNA below; capture their refs before it is replaced.
+    refs = {e.seed_id: lineage_ref(e.dna) for e in elites} if lineage else {}
     next_pop: List[Individual] = []
     for idx, (candidate, op_entries) in enumerate(combined, start=1):
-        parent_specs: list[tuple[str, Path]] = []
+        parent_specs: list[tuple[str, bytes]] = []
         for pid in candidate.parents[:2] if candidate.parents else []:
-            ppath = results_root / pid / "spec.json"
-            if ppath.exists():
-                parent_specs.append((pid, ppath))
-        parent_hashes = build_parent_hashes(parent_specs)
-        rng_subseed = make_rng_subseed(next_gen_label, idx, root_seed)
+            data = spec_source(pid)
+            if data is not None:
+                parent_specs.append((pid, data))
+        parent_hashes = parent_hashes_from_bytes(parent_specs)
+        rng_subseed = make_rng_subseed(next_gen_label, bred_slots[idx - 1], root_seed)
         candidate_id = f"seed_{idx:04d}"
         candidate.dna = update_dna(
             candidate.dna,
@@ -126,17 +539,29 @@ def evolve(
             parent_hashes=parent_hashes,
             rng_subseed=rng_subseed,
             op_entries=op_entries,
+            lineage=lineage,
+            parent_refs=_parent_refs(candidate, elite_ids, by_id, refs),
+            elite_of=candidate.seed_id if candidate.seed_id in elite_ids else None,
         )
         if candidate.seed_id not in elite_ids:
             candidate.seed_id = candidate_id
         next_pop.append(candidate)
 
+    if lineage is not None:
+        lineage.flush()
     manifest_overrides = {"adaptive": mode_snapshot, "grace": grace_info}
-    write_generation_folder(
-        out_dir,
-        gen_id=next_gen_label,
-        individuals=next_pop,
-        elite_ids=elite_ids,
-        manifest_overrides=manifest_overrides,
-    )
-    return next_pop
+    if selection == "nsga2":
+        manifest_overrides["selection"] = {"method": "nsga2", "objectives": list(objectives)}
+    if parent_selection != "tournament":
+        manifest_overrides["parent_selection"] = parent_selection
+    if tournament_size != 3:
+        manifest_overrides["tournament_size"] = tournament_size
+    if variation != "dict":
+        manifest_overrides["variation"] = variation
+    if surrogate is not None:
+        manifest_overrides["surrogate"] = {
+            **surrogate.snapshot(),
+            "screened": screening,
+            "bred": n_bred,
+        }
+    return BredGeneration(next_gen_label, next_pop, elite_ids, manifest_overrides)
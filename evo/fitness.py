@@ -1,11 +1,36 @@
 from __future__ import annotations
 
 import json
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+
+import numpy as np
 
 from evo.io import report_parser
+from evo.io.fitness_cache import FitnessCache, cache_key, input_hashes
 from evo.metrics import registry
 
+# Journal columns the registered metrics read; everything else in journal.csv is skipped.
+JOURNAL_COLUMNS = ("bankroll_after", "hand_id", "pso_flag")
+# csv.DictReader + row.get("bankroll_after", 0) treated a missing column as all-zero bankrolls.
+_JOURNAL_DEFAULTS = {"bankroll_after": 0}
+# Bump whenever the scoring formula or fitness.json layout changes; part of the cache key.
+FITNESS_VERSION = "1"
+METRICS_USED = ["roi", "drawdown", "pso_rate"]
+# Graph nodes evaluated on the default (array) grading path to fill a JournalSummary.
+SUMMARY_NODES = (
+    "rolls_played",
+    "hands_played",
+    "pso_count",
+    "bankroll_first",
+    "bankroll_last",
+    "drawdown",
+)
+
 
 @registry.register("roi")
 def metric_roi(start: float, final: float) -> float:
@@ -32,28 +57,365 @@ def metric_pso_rate(journal_rows: list[dict[str, str]]) -> float:
     return pso / hands if hands else 0.0
 
 
-def compute_fitness(run_dir: Path, seed_id: str) -> Path:
-    """Compute fitness.json from report.json or journal.csv."""
-    report = report_parser.read_report_json(run_dir)
-    journal = report_parser.read_journal_csv(run_dir)
+# Array-native graph: shared intermediates are materialized once per evaluation, however
+# many metrics require them.
+
+
+@registry.intermediate("bankroll_series", requires=("bankroll_after",))
+def bankroll_series(bankroll_after: np.ndarray) -> np.ndarray:
+    """Parseable bankrolls in roll order (NaN rows dropped, as the list metrics skip them)."""
+    return bankroll_after[~np.isnan(bankroll_after)]
+
+
+@registry.intermediate("running_peak", requires=("bankroll_series",))
+def running_peak(bankroll_series: np.ndarray) -> np.ndarray:
+    return np.maximum.accumulate(bankroll_series) if bankroll_series.size else bankroll_series
+
+
+@registry.intermediate("hand_starts", requires=("hand_id",))
+def hand_starts(hand_id: np.ndarray) -> np.ndarray:
+    """Row index of the first roll of each hand (runs of equal hand_id)."""
+    if not hand_id.size:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.r_[True, hand_id[1:] != hand_id[:-1]])
+
+
+@registry.intermediate("hand_pnl", requires=("bankroll_after", "hand_starts"))
+def hand_pnl(bankroll_after: np.ndarray, hand_starts: np.ndarray) -> np.ndarray:
+    """
+    Bankroll change per hand, measured between hand-closing bankrolls (unparseable rows
+    carry the previous value). The first hand is measured from the first parseable roll;
+    hands closing before any parseable bankroll count as flat, so the result has no NaN.
+    """
+    n = bankroll_after.size
+    valid = ~np.isnan(bankroll_after)
+    if not valid.any():
+        return np.zeros(hand_starts.size)
+    idx = np.where(valid, np.arange(n), int(valid.argmax()))
+    filled = bankroll_after[np.maximum.accumulate(idx)]
+    closes = filled[np.r_[hand_starts[1:] - 1, n - 1]]
+    return np.diff(closes, prepend=filled[0])
+
+
+@registry.register("drawdown", requires=("bankroll_series", "running_peak"))
+def array_drawdown(bankroll_series: np.ndarray, running_peak: np.ndarray) -> float:
+    if not bankroll_series.size:
+        return 0.0
+    return float((bankroll_series - running_peak).min())
+
+
+@registry.register("rolls_played", requires=("bankroll_after",))
+def array_rolls(bankroll_after: np.ndarray) -> int:
+    return int(bankroll_after.size)
+
+
+@registry.register("hands_played", requires=("hand_id",))
+def array_hands(hand_id: np.ndarray) -> int:
+    """Distinct hand ids; they arrive factorized (codes 0..k-1), so k is the max plus one."""
+    return int(hand_id.max()) + 1 if hand_id.size else 0
+
+
+@registry.register("pso_count", requires=("pso_flag",))
+def array_pso_count(pso_flag: np.ndarray) -> int:
+    return int(np.count_nonzero(pso_flag))
+
+
+@registry.register("pso_rate", requires=("pso_count", "hands_played"))
+def array_pso_rate(pso_count: int, hands_played: int) -> float:
+    return pso_count / hands_played if hands_played else 0.0
+
+
+@registry.register("bankroll_first", requires=("bankroll_series",))
+def array_bankroll_first(bankroll_series: np.ndarray) -> Optional[float]:
+    return float(bankroll_series[0]) if bankroll_series.size else None
+
+
+@registry.register("bankroll_last", requires=("bankroll_series",))
+def array_bankroll_last(bankroll_series: np.ndarray) -> Optional[float]:
+    return float(bankroll_series[-1]) if bankroll_series.size else None
+
+
+@dataclass
+class JournalSummary:
+    """Constant-size aggregate of a journal; everything fitness.json needs from the rolls."""
+
+    rolls: int = 0
+    hands: int = 0
+    pso_count: int = 0
+    bankroll_first: Optional[float] = None
+    bankroll_last: Optional[float] = None
+    drawdown: float = 0.0
+
+    @property
+    def pso_rate(self) -> float:
+        return self.pso_count / self.hands if self.hands else 0.0
+
+
+def summarize_journal(rows: Iterable[tuple[Any, Any, Any]]) -> JournalSummary:
+    """
+    Single pass over (bankroll_after, hand_id, pso_flag) tuples.
+
+    Hands are distinct ``hand_id`` values, as in ``metric_pso_rate`` (an O(hands) set).
+    Unparseable bankrolls are skipped, as in the list-based metrics.
+    """
+    rolls = pso = 0
+    first: Optional[float] = None
+    last: Optional[float] = None
+    peak = drawdown = 0.0
+    hands: set[Any] = set()
+    for bankroll_raw, hand_id, pso_flag in rows:
+        rolls += 1
+        hands.add(hand_id)
+        if pso_flag == "1":
+            pso += 1
+        try:
+            bankroll = float(bankroll_raw)
+        except (TypeError, ValueError):
+            continue
+        if first is None:
+            first = peak = bankroll
+        last = bankroll
+        if bankroll > peak:
+            peak = bankroll
+        elif bankroll - peak < drawdown:
+            drawdown = bankroll - peak
+    return JournalSummary(
+        rolls=rolls,
+        hands=len(hands),
+        pso_count=pso,
+        bankroll_first=first,
+        bankroll_last=last,
+        drawdown=drawdown,
+    )
+
 
-    bankrolls: list[float] = []
-    for row in journal:
+def scan_journal(run_dir: Path) -> JournalSummary:
+    """Stream journal.csv once, reading only ``JOURNAL_COLUMNS``."""
+    rows = report_parser.iter_journal_columns(run_dir, JOURNAL_COLUMNS, _JOURNAL_DEFAULTS)
+    return summarize_journal(rows)
+
+
+@dataclass
+class JournalPartial:
+    """
+    Mergeable aggregate of one byte range of a journal.
+
+    Drawdown cannot be merged from a single number once an earlier chunk carries a higher
+    peak, so each partial keeps its running-max records: ``record_peaks[j]`` is the j-th new
+    high, ``prefix_low[j]`` the lowest bankroll before record j+1 (cumulative), and
+    ``suffix_drawdown[j]`` the best in-chunk drawdown from record j on. Record counts are
+    small in practice (a random walk sets O(sqrt n) new highs). ``hand_ids`` is the set of
+    ids seen, so hands split across chunks or revisited later are counted once.
+    """
+
+    rolls: int = 0
+    pso_count: int = 0
+    hand_ids: set[Any] = field(default_factory=set)
+    bankroll_first: Optional[float] = None
+    bankroll_last: Optional[float] = None
+    record_peaks: np.ndarray = field(default_factory=lambda: np.empty(0))
+    prefix_low: np.ndarray = field(default_factory=lambda: np.empty(0))
+    suffix_drawdown: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def drawdown_after(self, carried_peak: Optional[float]) -> float:
+        """Worst drawdown inside this chunk given the peak carried in from earlier rows."""
+        if not self.record_peaks.size:
+            return 0.0
+        k = (
+            0
+            if carried_peak is None
+            else int(np.searchsorted(self.record_peaks, carried_peak, "right"))
+        )
+        worst = float(self.suffix_drawdown[k]) if k < self.record_peaks.size else 0.0
+        if k:
+            worst = min(worst, float(self.prefix_low[k - 1]) - carried_peak)
+        return worst
+
+    @property
+    def hands(self) -> int:
+        return len(self.hand_ids)
+
+
+def summarize_partial(rows: Iterable[tuple[Any, Any, Any]]) -> JournalPartial:
+    """Like ``summarize_journal`` but keeps what ``merge_partials`` needs at chunk edges."""
+    rolls = pso = 0
+    first: Optional[float] = None
+    last: Optional[float] = None
+    hand_ids: set[Any] = set()
+    peaks, lows = array("d"), array("d")
+    peak = low = 0.0
+    for bankroll_raw, hand_id, pso_flag in rows:
+        rolls += 1
+        hand_ids.add(hand_id)
+        if pso_flag == "1":
+            pso += 1
         try:
-            bankrolls.append(float(row.get("bankroll_after", 0)))
+            bankroll = float(bankroll_raw)
         except (TypeError, ValueError):
             continue
+        if first is None:
+            first = peak = low = bankroll
+        elif bankroll > peak:
+            peaks.append(peak)
+            lows.append(low)
+            peak = low = bankroll
+        elif bankroll < low:
+            low = bankroll
+        last = bankroll
+    if first is not None:
+        peaks.append(peak)
+        lows.append(low)
+    record_peaks = np.frombuffer(peaks, dtype=np.float64)
+    segment_low = np.frombuffer(lows, dtype=np.float64)
+    suffix = np.minimum.accumulate((segment_low - record_peaks)[::-1])[::-1]
+    return JournalPartial(
+        rolls=rolls,
+        pso_count=pso,
+        hand_ids=hand_ids,
+        bankroll_first=first,
+        bankroll_last=last,
+        record_peaks=record_peaks,
+        prefix_low=np.minimum.accumulate(segment_low),
+        suffix_drawdown=suffix,
+    )
+
+
+def merge_partials(partials: Iterable[JournalPartial]) -> JournalSummary:
+    """Fold per-chunk partials (in file order) into the exact serial ``JournalSummary``."""
+    out = JournalSummary()
+    peak: Optional[float] = None
+    hand_ids: set[Any] = set()
+    for part in partials:
+        if not part.rolls:
+            continue
+        out.rolls += part.rolls
+        out.pso_count += part.pso_count
+        hand_ids |= part.hand_ids
+        out.hands = len(hand_ids)
+        if part.bankroll_first is None:
+            continue
+        if out.bankroll_first is None:
+            out.bankroll_first = part.bankroll_first
+        out.bankroll_last = part.bankroll_last
+        out.drawdown = min(out.drawdown, part.drawdown_after(peak))
+        top = float(part.record_peaks[-1])
+        peak = top if peak is None else max(peak, top)
+    return out
+
+
+def _summarize_range(journal_path: Path, start: int, end: int, header: list[str]):
+    rows = report_parser.iter_journal_range(
+        journal_path, start, end, header, JOURNAL_COLUMNS, _JOURNAL_DEFAULTS
+    )
+    return summarize_partial(rows)
+
+
+def scan_journal_parallel(
+    run_dir: Path,
+    workers: Optional[int] = None,
+    chunk_bytes: int = 64 * 1024 * 1024,
+) -> JournalSummary:
+    """
+    Parse journal.csv as newline-aligned byte ranges across a process pool.
+
+    Per-range partials are merged in order (peaks carried, hand-id sets unioned), so
+    the result equals ``scan_journal`` exactly.
+    """
+    journal_path = run_dir / "journal.csv"
+    if not isinstance(journal_path, Path) or not journal_path.exists():
+        return scan_journal(run_dir)
+    header, ranges = report_parser.split_journal_ranges(journal_path, chunk_bytes)
+    workers = min(workers or os.cpu_count() or 1, max(len(ranges), 1))
+    if workers == 1:
+        partials = [_summarize_range(journal_path, a, b, header) for a, b in ranges]
+    else:
+        n = len(ranges)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(
+                pool.map(
+                    _summarize_range,
+                    [journal_path] * n,
+                    [a for a, _ in ranges],
+                    [b for _, b in ranges],
+                    [header] * n,
+                )
+            )
+    return merge_partials(partials)
 
+
+def summarize_arrays(arrays: Mapping[str, np.ndarray]) -> JournalSummary:
+    """Vectorized equivalent of ``summarize_journal`` over typed journal columns."""
+    values = registry.evaluate(SUMMARY_NODES, arrays)
+    return JournalSummary(
+        rolls=values["rolls_played"],
+        hands=values["hands_played"],
+        pso_count=values["pso_count"],
+        bankroll_first=values["bankroll_first"],
+        bankroll_last=values["bankroll_last"],
+        drawdown=values["drawdown"],
+    )
+
+
+def load_journal_arrays(run_dir: Path) -> dict[str, np.ndarray]:
+    """Load each column the summary graph needs, once, as a typed array."""
+    columns = registry.columns_for(SUMMARY_NODES)
+    return report_parser.read_journal_arrays(run_dir, columns, _JOURNAL_DEFAULTS)
+
+
+def _write_fitness(out_dir: Path, data: dict[str, Any]) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / "fitness.json"
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return out_path
+
+
+def compute_fitness(
+    run_dir: Path,
+    seed_id: str,
+    streaming: bool = False,
+    cache: Optional[FitnessCache] = None,
+    out_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Path:
+    """
+    Compute fitness.json from report.json or journal.csv.
+
+    Uses the array-native metrics by default; ``streaming=True`` keeps memory constant
+    for journals too large to hold three columns in RAM. With ``cache``, unchanged inputs
+    (by SHA-256) reuse the stored payload without parsing report or journal.
+    ``run_dir`` may be a ``zipfile.Path`` inside a bundle; fitness.json then goes to
+    ``out_dir``, which defaults to ``run_dir``. ``workers`` > 1 with ``streaming`` parses
+    one very large journal in parallel byte ranges.
+    """
+    out_dir = run_dir if out_dir is None else out_dir
+    key = None
+    if cache is not None:
+        key = cache_key(input_hashes(run_dir), METRICS_USED, FITNESS_VERSION)
+        hit = cache.get(key)
+        if hit is not None:
+            hit["seed_id"] = seed_id
+            return _write_fitness(out_dir, hit)
+
+    report = report_parser.read_report_json(run_dir)
+    if streaming and workers and workers > 1:
+        summary = scan_journal_parallel(run_dir, workers=workers)
+    elif streaming:
+        summary = scan_journal(run_dir)
+    else:
+        summary = summarize_arrays(load_journal_arrays(run_dir))
+
+    first, last = summary.bankroll_first, summary.bankroll_last
     start_bankroll = float(
-        report.get("bankroll_start", bankrolls[0] if bankrolls else 1000),
+        report.get("bankroll_start", first if first is not None else 1000),
     )
     final_bankroll = float(
-        report.get("bankroll_final", bankrolls[-1] if bankrolls else start_bankroll),
+        report.get("bankroll_final", last if last is not None else start_bankroll),
     )
 
     roi = registry.get("roi")(start_bankroll, final_bankroll)
-    drawdown = registry.get("drawdown")(bankrolls) if bankrolls else 0.0
-    pso = registry.get("pso_rate")(journal)
+    drawdown = summary.drawdown
+    pso = summary.pso_rate
     drawdown_penalty = abs(drawdown) / start_bankroll if start_bankroll else 0.0
     fitness_score = 0.5 * roi - 0.3 * drawdown_penalty + 0.2 * (1 - pso)
 
@@ -63,14 +425,12 @@ def compute_fitness(run_dir: Path, seed_id: str) -> Path:
         "bankroll_final": round(final_bankroll, 4),
         "roi": round(roi, 4),
         "drawdown_max": round(drawdown, 4),
-        "hands_played": len({row.get("hand_id") for row in journal}) if journal else 0,
-        "rolls_played": len(journal),
+        "hands_played": summary.hands,
+        "rolls_played": summary.rolls,
         "pso_rate": round(pso, 4),
         "fitness_score": round(fitness_score, 4),
-        "metrics_used": ["roi", "drawdown", "pso_rate"],
+        "metrics_used": list(METRICS_USED),
     }
-
-    out_path = run_dir / "fitness.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    return out_path
+    if cache is not None:
+        cache.put(key, data)
+    return _write_fitness(out_dir, data)
@@ -0,0 +1,263 @@
+"""
+Compiled genome layout: a population of specs as NumPy matrices.
+
+``GenomeSchema`` is derived from spec params/toggles. ``encode`` turns specs into a
+``GenomeBatch`` (struct of arrays); mutation and crossover then act on whole offspring
+batches at once, and ``decode`` materializes spec dicts only at export.
+
+Layout: one float64 column per param (NaN = key absent; non-numeric params hold category
+codes), one int8 column per toggle (-1 absent, 0/1), and int32 codes for ``profile_id``
+and ``schema_version`` (-1 absent). Quantization and bounds follow ``mutate_spec``.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+# Table-friendly steps and bounds for the params ``mutate_spec`` nudges; others are carried.
+PARAM_RULES: Dict[str, Dict[str, float]] = {
+    "place_6_8": {"step": 6.0},
+    "place_5_9": {"step": 5.0},
+    "odds_multiple": {"step": 1.0, "lower": 1.0},
+    "regress_pct": {"lower": 0.0, "upper": 1.0},
+}
+
+CROSSOVER_MODES = ("uniform", "block")
+
+
+@dataclass(frozen=True)
+class ParamGene:
+    name: str
+    kind: str = "float"  # "int" | "float" | "category"
+    step: Optional[float] = None
+    lower: float = -math.inf
+    upper: float = math.inf
+    mutable: bool = False
+    values: tuple = ()  # category code -> value
+
+    def repair(self, col: np.ndarray) -> np.ndarray:
+        """Snap to ``step`` then clamp to bounds (NaN passes through)."""
+        if self.step:
+            col = np.round(col / self.step) * self.step
+        return np.clip(col, self.lower, self.upper)
+
+
+@dataclass(frozen=True)
+class GenomeSchema:
+    params: tuple[ParamGene, ...]
+    toggles: tuple[str, ...]
+    profiles: tuple = ()
+    versions: tuple = ()
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[Mapping[str, Any]]) -> "GenomeSchema":
+        """Columns for every param/toggle seen; a param is "int" if every value is an int."""
+        kinds: Dict[str, str] = {}
+        categories: Dict[str, Dict[Any, Any]] = {}
+        toggles: Dict[str, None] = {}
+        profiles: Dict[Any, None] = {}
+        versions: Dict[Any, None] = {}
+        for spec in specs:
+            for key, value in spec.get("params", {}).items():
+                kind = _value_kind(value)
+                prev = kinds.get(key)
+                if prev is None or prev == kind:
+                    kinds[key] = kind
+                elif {prev, kind} == {"int", "float"}:
+                    kinds[key] = "float"
+                else:
+                    kinds[key] = "category"
+                categories.setdefault(key, {}).setdefault(_hashable(value), value)
+            toggles.update(dict.fromkeys(spec.get("toggles", {})))
+            if "profile_id" in spec:
+                profiles[spec["profile_id"]] = None
+            if "schema_version" in spec:
+                versions[spec["schema_version"]] = None
+        genes = []
+        for key in sorted(kinds):
+            kind = kinds[key]
+            if kind == "category":
+                genes.append(ParamGene(key, kind, values=tuple(categories[key].values())))
+                continue
+            rules = PARAM_RULES.get(key)
+            genes.append(ParamGene(key, kind, mutable=rules is not None, **(rules or {})))
+        return cls(tuple(genes), tuple(sorted(toggles)), tuple(profiles), tuple(versions))
+
+    def encode(self, specs: Sequence[Mapping[str, Any]]) -> "GenomeBatch":
+        """Specs -> matrices. Raises ValueError for keys or categories the schema lacks."""
+        n = len(specs)
+        params = np.full((n, len(self.params)), np.nan)
+        toggles = np.full((n, len(self.toggles)), -1, dtype=np.int8)
+        profile = np.full(n, -1, dtype=np.int32)
+        version = np.full(n, -1, dtype=np.int32)
+        pcol = {gene.name: j for j, gene in enumerate(self.params)}
+        codes = [
+            {_hashable(v): c for c, v in enumerate(gene.values)} if gene.values else None
+            for gene in self.params
+        ]
+        tcol = {name: j for j, name in enumerate(self.toggles)}
+        profile_codes = {v: c for c, v in enumerate(self.profiles)}
+        version_codes = {v: c for c, v in enumerate(self.versions)}
+        try:
+            for i, spec in enumerate(specs):
+                for key, value in spec.get("params", {}).items():
+                    j = pcol[key]
+                    params[i, j] = codes[j][_hashable(value)] if codes[j] else float(value)
+                for key, value in spec.get("toggles", {}).items():
+                    toggles[i, tcol[key]] = 1 if value else 0
+                if "profile_id" in spec:
+                    profile[i] = profile_codes[spec["profile_id"]]
+                if "schema_version" in spec:
+                    version[i] = version_codes[spec["schema_version"]]
+        except KeyError as exc:
+            raise ValueError(f"Spec value {exc} is not in the genome schema") from None
+        return GenomeBatch(self, params, toggles, profile, version)
+
+    def decode(self, batch: "GenomeBatch") -> List[Dict[str, Any]]:
+        """Matrices -> spec dicts (schema_version, profile_id, params, toggles)."""
+        param_cols = [
+            _decode_param(gene, batch.params[:, j].tolist()) for j, gene in enumerate(self.params)
+        ]
+        toggle_cols = [batch.toggles[:, j].tolist() for j in range(len(self.toggles))]
+        specs: List[Dict[str, Any]] = []
+        for i, (pcode, vcode) in enumerate(zip(batch.profile.tolist(), batch.version.tolist())):
+            spec: Dict[str, Any] = {}
+            if vcode >= 0:
+                spec["schema_version"] = self.versions[vcode]
+            if pcode >= 0:
+                spec["profile_id"] = self.profiles[pcode]
+            spec["params"] = {
+                gene.name: col[i]
+                for gene, col in zip(self.params, param_cols)
+                if col[i] is not _ABSENT
+            }
+            spec["toggles"] = {
+                name: bool(col[i]) for name, col in zip(self.toggles, toggle_cols) if col[i] >= 0
+            }
+            specs.append(spec)
+        return specs
+
+
+@dataclass
+class GenomeBatch:
+    schema: GenomeSchema
+    params: np.ndarray
+    toggles: np.ndarray
+    profile: np.ndarray
+    version: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.profile)
+
+    def take(self, rows: Union[Sequence[int], np.ndarray]) -> "GenomeBatch":
+        rows = np.asarray(rows, dtype=np.intp)
+        return GenomeBatch(
+            self.schema,
+            self.params[rows],
+            self.toggles[rows],
+            self.profile[rows],
+            self.version[rows],
+        )
+
+
+def mutate_batch(
+    batch: GenomeBatch, nudge_frac: Union[float, np.ndarray], rng: np.random.Generator
+) -> GenomeBatch:
+    """
+    Nudge every mutable param of every row by ``base * nudge * U(-1, 1)`` and repair, as
+    ``mutate_spec`` does per dict. ``nudge_frac`` may be a scalar or one value per row.
+    """
+    out = batch.take(np.arange(len(batch)))
+    genes = [j for j, gene in enumerate(batch.schema.params) if gene.mutable]
+    if not genes or not len(batch):
+        return out
+    nudge = np.broadcast_to(np.asarray(nudge_frac, dtype=np.float64), (len(batch),))
+    base = out.params[:, genes]
+    noise = rng.random(base.shape) * 2 - 1
+    moved = base + base * nudge[:, None] * noise
+    for k, j in enumerate(genes):
+        out.params[:, j] = batch.schema.params[j].repair(moved[:, k])
+    return out
+
+
+def crossover_batch(
+    a: GenomeBatch, b: GenomeBatch, rng: np.random.Generator, mode: str = "uniform"
+) -> GenomeBatch:
+    """
+    Cross row i of ``a`` with row i of ``b``. ``uniform`` picks each param/toggle from either
+    parent; ``block`` takes the whole params block and the whole toggles block from one
+    parent each. A key only one parent has is always inherited; ``schema_version`` follows
+    ``a`` and ``profile_id`` is picked from either parent.
+    """
+    if mode not in CROSSOVER_MODES:
+        raise ValueError(f"Unknown crossover mode {mode!r}")
+    if len(a) != len(b):
+        raise ValueError("Crossover parents must be paired row for row")
+    n = len(a)
+    p, t = a.params.shape[1], a.toggles.shape[1]
+    if mode == "uniform":
+        pick_p = rng.random((n, p)) < 0.5
+        pick_t = rng.random((n, t)) < 0.5
+    else:
+        blocks = rng.random((n, 2)) < 0.5
+        pick_p = np.broadcast_to(blocks[:, :1], (n, p))
+        pick_t = np.broadcast_to(blocks[:, 1:], (n, t))
+    pick_profile = rng.random(n) < 0.5
+
+    params = np.where(pick_p, a.params, b.params)
+    params = np.where(np.isnan(params), np.where(pick_p, b.params, a.params), params)
+    toggles = np.where(pick_t, a.toggles, b.toggles)
+    toggles = np.where(toggles < 0, np.where(pick_t, b.toggles, a.toggles), toggles)
+    profile = np.where(pick_profile, a.profile, b.profile)
+    return GenomeBatch(a.schema, params, toggles.astype(np.int8), profile, a.version.copy())
+
+
+def vary(
+    batch: GenomeBatch,
+    parents_a: np.ndarray,
+    parents_b: np.ndarray,
+    do_crossover: np.ndarray,
+    nudge_frac: Union[float, np.ndarray],
+    rng: np.random.Generator,
+    mode: str = "uniform",
+) -> GenomeBatch:
+    """
+    One offspring per row: crossover of ``batch[parents_a[i]]`` x ``batch[parents_b[i]]``
+    where ``do_crossover[i]``, otherwise a mutant of ``batch[parents_a[i]]``.
+    """
+    a = batch.take(parents_a)
+    crossed = crossover_batch(a, batch.take(parents_b), rng, mode)
+    mutated = mutate_batch(a, nudge_frac, rng)
+    cx = np.asarray(do_crossover, dtype=bool)
+    return GenomeBatch(
+        batch.schema,
+        np.where(cx[:, None], crossed.params, mutated.params),
+        np.where(cx[:, None], crossed.toggles, mutated.toggles).astype(np.int8),
+        np.where(cx, crossed.profile, mutated.profile),
+        np.where(cx, crossed.version, mutated.version),
+    )
+
+
+_ABSENT = object()
+
+
+def _decode_param(gene: ParamGene, col: List[float]) -> List[Any]:
+    if gene.kind == "category":
+        return [_ABSENT if v != v else gene.values[int(v)] for v in col]
+    if gene.kind == "int":
+        return [_ABSENT if v != v else int(v) for v in col]
+    return [_ABSENT if v != v else v for v in col]
+
+
+def _value_kind(value: Any) -> str:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return "category"
+    return "int" if isinstance(value, int) else "float"
+
+
+def _hashable(value: Any) -> Any:
+    return value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
@@ -0,0 +1,210 @@
+"""
+Batch grading of a results root: fan compute_fitness out over run/seed_* directories.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .fitness import compute_fitness
+from .io.bundles import open_bundle_root
+from .io.fitness_cache import DEFAULT_MAX_BYTES, FitnessCache
+from .io.fitness_table import write_fitness_table
+from .io.lineage_db import LineageDB, results_generation
+from .io.report_parser import write_journal_sidecar
+from .population import canonical_spec_hash
+
+
+def iter_run_seed_dirs(results_root: Path) -> List[Path]:
+    """Return results_root/run/seed_* directories in stable order."""
+    run_dir = results_root / "run"
+    if not run_dir.exists():
+        return []
+    return sorted(p for p in run_dir.glob("seed_*") if p.is_dir())
+
+
+def iter_bundle_run_seeds(root: zipfile.Path) -> List[str]:
+    """Seed ids with a run/seed_*/ folder inside an opened bundle."""
+    run_dir = root / "run"
+    if not run_dir.exists():
+        return []
+    return sorted(p.name for p in run_dir.iterdir() if p.is_dir() and p.name.startswith("seed_"))
+
+
+_WORKER_CACHE: Optional[FitnessCache] = None
+_WORKER_BUNDLE: Optional[zipfile.Path] = None
+
+
+def _init_worker(
+    cache_dir: Optional[Path],
+    cache_max_bytes: int,
+    bundle_path: Optional[Path] = None,
+) -> None:
+    global _WORKER_CACHE, _WORKER_BUNDLE
+    _WORKER_CACHE = FitnessCache(cache_dir, cache_max_bytes) if cache_dir else None
+    # Each worker holds its own handle on the archive; members are read as streams.
+    _WORKER_BUNDLE = open_bundle_root(bundle_path) if bundle_path else None
+
+
+def _grade_seed(
+    run_seed_dir: Path,
+    streaming: bool,
+    cache: Optional[FitnessCache],
+    out_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    out_path = compute_fitness(
+        run_seed_dir, run_seed_dir.name, streaming=streaming, cache=cache, out_dir=out_dir
+    )
+    return json.loads(out_path.read_text(encoding="utf-8"))
+
+
+def _grade_seed_in_worker(run_seed_dir: Path, streaming: bool) -> Dict[str, Any]:
+    return _grade_seed(run_seed_dir, streaming, _WORKER_CACHE)
+
+
+def _grade_bundle_seed_in_worker(seed_id: str, streaming: bool, out_root: Path) -> Dict[str, Any]:
+    run_seed_dir = _WORKER_BUNDLE / "run" / seed_id
+    return _grade_seed(run_seed_dir, streaming, _WORKER_CACHE, out_root / "run" / seed_id)
+
+
+def grade_seed_dirs(
+    seed_dirs: List[Path],
+    workers: Optional[int] = None,
+    streaming: bool = False,
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = DEFAULT_MAX_BYTES,
+) -> List[Dict[str, Any]]:
+    """
+    Grade each seed dir, writing its fitness.json; results keep the input order.
+    ``workers=1`` grades in-process; otherwise a process pool (default: CPU count).
+    ``cache_dir`` enables the shared content-addressed fitness cache.
+    """
+    if not seed_dirs:
+        return []
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(seed_dirs) == 1:
+        cache = FitnessCache(cache_dir, cache_max_bytes) if cache_dir else None
+        return [_grade_seed(d, streaming, cache) for d in seed_dirs]
+    workers = min(workers, len(seed_dirs))
+    chunksize = max(1, len(seed_dirs) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(cache_dir, cache_max_bytes),
+    ) as pool:
+        return list(
+            pool.map(
+                _grade_seed_in_worker,
+                seed_dirs,
+                [streaming] * len(seed_dirs),
+                chunksize=chunksize,
+            )
+        )
+
+
+def grade_results_root(
+    results_root: Path,
+    workers: Optional[int] = None,
+    streaming: bool = False,
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    lineage_db: Optional[LineageDB] = None,
+) -> Path:
+    """
+    Grade every results_root/run/seed_* and write run/fitness_table.csv; return its path.
+    ``lineage_db`` also gets the fitness rows, in one transaction.
+    """
+    seed_dirs = iter_run_seed_dirs(results_root)
+    rows = grade_seed_dirs(
+        seed_dirs,
+        workers=workers,
+        streaming=streaming,
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_bytes,
+    )
+    run_dir = results_root / "run"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    if lineage_db is not None:
+        lineage_db.add_results(results_root, {row["seed_id"]: row for row in rows})
+    return write_fitness_table(run_dir, rows)
+
+
+def grade_bundle(
+    bundle_path: Path,
+    out_root: Path,
+    workers: Optional[int] = None,
+    streaming: bool = False,
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    lineage_db: Optional[LineageDB] = None,
+) -> Path:
+    """
+    Grade every run/seed_* of a results bundle straight from the zip.
+
+    Only fitness outputs are written: out_root/run/<seed_id>/fitness.json and
+    out_root/run/fitness_table.csv. Workers share the archive, each with its own handle.
+    ``lineage_db`` also gets the fitness rows, in one transaction.
+    """
+    root = open_bundle_root(bundle_path)
+    try:
+        seed_ids = iter_bundle_run_seeds(root)
+        generation = results_generation(root) if lineage_db is not None else None
+        # out_root holds no spec.json, so the table's spec hashes come from the archive.
+        spec_hashes = {
+            sid: canonical_spec_hash(json.loads((root / sid / "spec.json").read_text()))
+            for sid in seed_ids
+            if (root / sid / "spec.json").exists()
+        }
+    finally:
+        root.root.close()
+    workers = min(workers or os.cpu_count() or 1, max(len(seed_ids), 1))
+    if workers == 1:
+        _init_worker(cache_dir, cache_max_bytes, bundle_path)
+        try:
+            rows = [_grade_bundle_seed_in_worker(s, streaming, out_root) for s in seed_ids]
+        finally:
+            _WORKER_BUNDLE.root.close()
+            _init_worker(None, cache_max_bytes)
+    else:
+        chunksize = max(1, len(seed_ids) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(cache_dir, cache_max_bytes, bundle_path),
+        ) as pool:
+            rows = list(
+                pool.map(
+                    _grade_bundle_seed_in_worker,
+                    seed_ids,
+                    [streaming] * len(seed_ids),
+                    [out_root] * len(seed_ids),
+                    chunksize=chunksize,
+                )
+            )
+    run_dir = out_root / "run"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    if lineage_db is not None:
+        payloads = {row["seed_id"]: row for row in rows}
+        lineage_db.add_results(out_root, payloads, generation=generation)
+    rows = [
+        {**row, "spec_hash": spec_hashes[row["seed_id"]]} if row["seed_id"] in spec_hashes else row
+        for row in rows
+    ]
+    return write_fitness_table(run_dir, rows)
+
+
+def ingest_results_root(results_root: Path, workers: Optional[int] = None) -> List[Path]:
+    """Write a journal.evcol sidecar for every run/seed_* journal; return sidecar paths."""
+    seed_dirs = iter_run_seed_dirs(results_root)
+    workers = min(workers or os.cpu_count() or 1, max(len(seed_dirs), 1))
+    if workers == 1:
+        written = [write_journal_sidecar(d) for d in seed_dirs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            written = list(pool.map(write_journal_sidecar, seed_dirs))
+    return [p for p in written if p is not None]
@@ -0,0 +1,319 @@
+"""
+Vectorized craps engine for the spec families Evo breeds.
+
+Every strategy bets the pass line with ``odds_multiple`` x odds once a point is set, and
+places 6/8 (``place_6_8`` each) and 5/9 (``place_5_9`` each) while a point is on, skipping
+the point number. After the first place hit of a hand, place bets regress to
+``1 - regress_pct`` of their size (rounded to the table unit). Place bets pay 7:6 (6/8) and
+7:5 (5/9); odds pay 2:1, 3:2 and 6:5. Other spec fields are carried but not simulated.
+
+A run is ``shoes`` blocks of ``rolls`` dice each, played back to back as one session: a
+hand still open when its shoe ends (point, regression, pending PSO) continues into the
+next shoe. Dice come from ``default_rng([seed, shoe])`` and are shared by every spec, so
+strategies in one job face the same rolls. All shoes of a chunk of specs are played at
+once, one roll step at a time, each from a come-out; a shoe entered mid-hand is then
+replayed from the carried state only until it rejoins that play, which takes a hand or two.
+The bankroll runs through the shoes, and play stops at the first come-out that cannot
+cover the table.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Sequence
+
+import numpy as np
+
+ENGINE_NAME = "evo-local-dice"
+ENGINE_VERSION = "2"
+
+# Spec-rolls played per chunk of specs; bounds the working set beyond the journals
+# (about 10 bytes per spec-roll).
+CHUNK_SPEC_ROLLS = 1 << 23
+
+# Odds payout per point total (index = dice total).
+_ODDS_PAY = np.array([0, 0, 0, 0, 2.0, 1.5, 1.2, 0, 1.2, 1.5, 2.0, 0, 0])
+
+
+@dataclass(frozen=True)
+class TableRules:
+    bankroll: float = 1000.0
+    line_bet: float = 10.0
+
+
+@dataclass
+class DiceRun:
+    """Per-spec journals, all ``(n_specs, rolls_total)`` and valid up to ``stops[i]``."""
+
+    dice: np.ndarray  # (rolls_total, 2) int8, shared by every spec
+    shoe: np.ndarray  # (rolls_total,) int32
+    roll: np.ndarray  # (rolls_total,) int32, index within the shoe
+    hand_id: np.ndarray
+    point: np.ndarray  # point on before the roll (0 = come-out)
+    bankroll_after: np.ndarray
+    pso_flag: np.ndarray
+    stops: np.ndarray  # rolls played per spec
+    early_stop: list  # per spec: None | "bankrupt" | "min_bet_unaffordable"
+    bankroll_start: float
+
+    def journal(self, i: int) -> dict[str, np.ndarray]:
+        n = int(self.stops[i])
+        return {
+            "hand_id": self.hand_id[i, :n],
+            "shoe": self.shoe[:n],
+            "roll": self.roll[:n],
+            "die1": self.dice[:n, 0],
+            "die2": self.dice[:n, 1],
+            "total": self.dice[:n].sum(axis=1),
+            "point": self.point[i, :n],
+            "bankroll_after": self.bankroll_after[i, :n],
+            "pso_flag": self.pso_flag[i, :n],
+        }
+
+
+def _param(spec: Mapping[str, Any], name: str) -> float:
+    value = spec.get("params", {}).get(name, 0)
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def roll_dice(seed: int, shoes: int, rolls: int) -> np.ndarray:
+    """``(shoes, rolls, 2)`` dice; shoe ``k`` depends only on ``(seed, k)``."""
+    return np.stack(
+        [
+            np.random.default_rng([int(seed) & 0xFFFFFFFF, k]).integers(
+                1, 7, size=(rolls, 2), dtype=np.int8
+            )
+            for k in range(shoes)
+        ]
+    )
+
+
+@dataclass
+class _Bets:
+    """Per-spec bet sizes, each ``(specs, 1)`` so they broadcast over shoes."""
+
+    line: float
+    b68: np.ndarray
+    b59: np.ndarray
+    odds: np.ndarray
+    r68: np.ndarray
+    r59: np.ndarray
+    regresses: np.ndarray
+
+    @classmethod
+    def of(cls, specs: Sequence[Mapping[str, Any]], line: float) -> "_Bets":
+        b68 = np.array([_param(s, "place_6_8") for s in specs])[:, None]
+        b59 = np.array([_param(s, "place_5_9") for s in specs])[:, None]
+        odds = line * np.array([_param(s, "odds_multiple") for s in specs])[:, None]
+        keep = 1.0 - np.clip([_param(s, "regress_pct") for s in specs], 0.0, 1.0)[:, None]
+        r68 = np.round(b68 * keep / 6.0) * 6.0
+        r59 = np.round(b59 * keep / 5.0) * 5.0
+        return cls(line, b68, b59, odds, r68, r59, keep < 1.0)
+
+    @property
+    def exposure(self) -> np.ndarray:
+        """Money on the table once a point is set, ``(specs,)``."""
+        return (self.line + self.odds + 2 * self.b68 + 2 * self.b59)[:, 0]
+
+
+@dataclass
+class _State:
+    """Table state before a roll, one entry per (spec, shoe)."""
+
+    point: np.ndarray  # 0 = come-out
+    regressed: np.ndarray  # place bets regressed for the rest of the hand
+    armed: np.ndarray  # point set on the previous roll (a seven now is a PSO)
+    hands: np.ndarray  # seven-outs so far in this shoe
+
+    @classmethod
+    def come_out(cls, shape: tuple[int, int]) -> "_State":
+        return cls(
+            np.zeros(shape, dtype=np.int8),
+            np.zeros(shape, dtype=bool),
+            np.zeros(shape, dtype=bool),
+            np.zeros(shape, dtype=np.int64),
+        )
+
+    def shoe(self, k: int) -> "_State":
+        return _State(*(a[:, k : k + 1] for a in self._arrays()))
+
+    def _arrays(self) -> tuple[np.ndarray, ...]:
+        return self.point, self.regressed, self.armed, self.hands
+
+
+@dataclass
+class _Logs:
+    """Per-roll outputs, each ``(specs, shoes, rolls)`` (mostly views of the journals)."""
+
+    pnl: np.ndarray
+    hand: np.ndarray
+    point: np.ndarray
+    pso: np.ndarray
+    regressed: np.ndarray
+    armed: np.ndarray
+
+    def at(self, k: int, t: int) -> "_Logs":
+        return _Logs(
+            *(
+                a[:, k : k + 1, t : t + 1]
+                for a in (self.pnl, self.hand, self.point, self.pso, self.regressed, self.armed)
+            )
+        )
+
+    def matches(self, state: _State, k: int, t: int) -> bool:
+        """Whether ``state`` (one shoe) equals the logged state before roll ``t`` of shoe ``k``."""
+        return (
+            np.array_equal(state.point[:, 0], self.point[:, k, t])
+            and np.array_equal(state.regressed[:, 0], self.regressed[:, k, t])
+            and np.array_equal(state.armed[:, 0], self.armed[:, k, t])
+        )
+
+
+def _play(totals: np.ndarray, bets: _Bets, state: _State, logs: _Logs) -> _State:
+    """
+    Advance ``state`` through ``totals`` ``(shoes, rolls)``, one roll step at a time for
+    every spec and shoe, logging each roll's PnL and pre-roll state; returns the end state.
+    """
+    line = bets.line
+    point, regressed, armed, hands = state.point, state.regressed, state.armed, state.hands
+    shape = point.shape
+    for t in range(totals.shape[1]):
+        s = np.broadcast_to(totals[:, t], shape)
+        on = point > 0
+        win_co = ~on & ((s == 7) | (s == 11))
+        lose_co = ~on & ((s == 2) | (s == 3) | (s == 12))
+        est = ~on & ~win_co & ~lose_co
+        seven = on & (s == 7)
+        made = on & (s == point)
+        a68 = np.where(regressed, bets.r68, bets.b68)
+        a59 = np.where(regressed, bets.r59, bets.b59)
+        on68 = (s == 6) | (s == 8)
+        on59 = (s == 5) | (s == 9)
+        hit = on & ~seven & ~made & ((on68 & (a68 > 0)) | (on59 & (a59 > 0)))
+        placed = a68 * ((point != 6).astype(int) + (point != 8)) + a59 * (
+            (point != 5).astype(int) + (point != 9)
+        )
+        logs.pnl[:, :, t] = (
+            line * win_co
+            - line * lose_co
+            + made * (line + bets.odds * _ODDS_PAY[point])
+            - seven * (line + bets.odds + placed)
+            + hit * np.where(on68, a68 * 7 / 6, a59 * 7 / 5)
+        )
+        logs.hand[:, :, t] = hands
+        logs.point[:, :, t] = point
+        logs.pso[:, :, t] = seven & armed
+        logs.regressed[:, :, t] = regressed
+        logs.armed[:, :, t] = armed
+        hands = hands + seven
+        regressed = (regressed | (hit & bets.regresses)) & ~seven
+        armed = est
+        point = np.where(est, s, np.where(seven | made, 0, point)).astype(np.int8)
+    return _State(point, regressed, armed, hands)
+
+
+def _play_shoes(totals: np.ndarray, bets: _Bets, logs: _Logs) -> None:
+    """
+    Play every shoe at once from a come-out, then carry each shoe's end state into the
+    next: shoe ``k`` is replayed from the carried state until it meets the parallel play
+    (by the first seven-out after the first seven at the latest), after which only its
+    hand count shifts. Finally hand ids are chained across the shoes.
+    """
+    n_specs = bets.odds.shape[0]
+    n_shoes, n_rolls = totals.shape
+    end = _play(totals, bets, _State.come_out((n_specs, n_shoes)), logs)
+    end_hands = end.hands.copy()
+    carried = end.shoe(0)
+    for k in range(1, n_shoes):
+        state = _State(carried.point, carried.regressed, carried.armed, 0 * carried.hands)
+        t = 0
+        while t < n_rolls and not logs.matches(state, k, t):
+            state = _play(totals[k : k + 1, t : t + 1], bets, state, logs.at(k, t))
+            t += 1
+        if t < n_rolls:
+            shift = state.hands[:, 0] - logs.hand[:, k, t]
+            logs.hand[:, k, t:] += shift[:, None]
+            end_hands[:, k] += shift
+            carried = end.shoe(k)
+        else:
+            end_hands[:, k] = state.hands[:, 0]
+            carried = state
+    logs.hand += (np.cumsum(end_hands, axis=1) - end_hands)[:, :, None]
+
+
+def simulate(
+    specs: Sequence[Mapping[str, Any]],
+    seed: int,
+    shoes: int = 10,
+    rolls: int = 1000,
+    rules: TableRules = TableRules(),
+    max_rolls: Optional[int] = None,
+    chunk_specs: Optional[int] = None,
+) -> DiceRun:
+    """
+    Play every spec over the same ``shoes`` x ``rolls`` dice (capped at ``max_rolls``;
+    shoes past the cap are not rolled). Specs are played ``chunk_specs`` at a time
+    (default: about ``CHUNK_SPEC_ROLLS`` spec-rolls per chunk), so working memory beyond
+    the returned journals stays bounded.
+    """
+    if shoes < 1 or rolls < 1:
+        raise ValueError("shoes and rolls must be >= 1")
+    if max_rolls is not None:
+        shoes = min(shoes, max(1, -(-int(max_rolls) // rolls)))
+    dice = roll_dice(seed, shoes, rolls)
+    totals = dice.sum(axis=2, dtype=np.int8)
+    n = len(specs)
+    size = shoes * rolls
+    total_rolls = size if max_rolls is None else min(size, int(max_rolls))
+    hand_id = np.empty((n, size), dtype=np.int64)
+    point = np.empty((n, size), dtype=np.int8)
+    bankroll_after = np.empty((n, size))
+    pso_flag = np.empty((n, size), dtype=bool)
+    stops = np.empty(n, dtype=np.int64)
+    early_stop: list = []
+    chunk = chunk_specs or max(1, CHUNK_SPEC_ROLLS // size)
+    for lo in range(0, n, chunk):
+        hi = min(n, lo + chunk)
+        bets = _Bets.of(specs[lo:hi], rules.line_bet)
+        cube = (hi - lo, shoes, rolls)
+        logs = _Logs(
+            bankroll_after[lo:hi].reshape(cube),
+            hand_id[lo:hi].reshape(cube),
+            point[lo:hi].reshape(cube),
+            pso_flag[lo:hi].reshape(cube),
+            np.empty(cube, dtype=bool),
+            np.empty(cube, dtype=bool),
+        )
+        _play_shoes(totals, bets, logs)
+        del logs
+        # PnL was logged in place; the bankroll runs through all the shoes.
+        bank = bankroll_after[lo:hi]
+        np.cumsum(bank, axis=1, out=bank)
+        bank += rules.bankroll
+        before = np.empty_like(bank)
+        before[:, 0] = rules.bankroll
+        before[:, 1:] = bank[:, :-1]
+        short = (point[lo:hi] == 0) & (before < bets.exposure[:, None])
+        short[:, total_rolls:] = False
+        chunk_stops = np.where(short.any(axis=1), short.argmax(axis=1), total_rolls)
+        stops[lo:hi] = chunk_stops
+        early_stop.extend(
+            (
+                None
+                if stop == total_rolls
+                else ("bankrupt" if before[i, stop] <= 0 else "min_bet_unaffordable")
+            )
+            for i, stop in enumerate(chunk_stops.tolist())
+        )
+    return DiceRun(
+        dice=dice.reshape(-1, 2),
+        shoe=np.repeat(np.arange(shoes, dtype=np.int32), rolls),
+        roll=np.tile(np.arange(rolls, dtype=np.int32), shoes),
+        hand_id=hand_id,
+        point=point,
+        bankroll_after=bankroll_after,
+        pso_flag=pso_flag,
+        stops=stops,
+        early_stop=early_stop,
+        bankroll_start=rules.bankroll,
+    )
@@ -0,0 +1,129 @@
+"""
+One evaluation round trip for a generation folder: bundle it, submit it to a lane, await
+the receipt and grade whatever the lane left ungraded.
+
+``LaneEvaluator`` is the picklable submit/await step over ``evo.interop`` lanes;
+``evaluate_folder`` wraps any evaluator of that shape with the bundling and grading that
+islands, racing, steady-state and sweeps all need, optionally through an ``EvalMemo``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from ..grading import grade_results_root
+from ..io.bundles import write_bundle_zip, write_interop_manifest
+from ..io.eval_memo import (
+    MemoOptions,
+    SubmissionPlan,
+    attach_memo_results,
+    plan_folder,
+    submission_dir,
+)
+from ..io.fitness_table import FITNESS_TABLE_NAME
+from .trigger import await_completion, submit_job
+
+# evaluate(bundle_path, job_label) -> results root holding run/seed_*/ (a ``LaneEvaluator``
+# or any picklable callable of that shape, e.g. a test double).
+BundleEvaluator = Callable[[Path, str], Path]
+
+
+@dataclass
+class LaneEvaluator:
+    """
+    Submit a bundle through ``evo.interop`` and await it; returns the receipt's results
+    root. Picklable, so process pools (islands, sweeps) can carry it.
+    """
+
+    cfg: Dict[str, Any]
+    seed: int
+    run_flags: Dict[str, Any] = field(default_factory=dict)
+    timeout_s: int = 3600
+
+    def __call__(self, bundle_path: Path, label: str, max_rolls: Optional[int] = None) -> Path:
+        handle = submit_job(self.cfg, bundle_path, label, self.seed, self.run_flags, max_rolls)
+        rec = await_completion(self.cfg, handle, self.timeout_s)
+        if rec.get("status") != "ok" or not rec.get("results_root"):
+            detail = rec.get("error_detail") or rec.get("error_code") or rec.get("status")
+            raise RuntimeError(f"Interop job {label} failed: {detail}")
+        return Path(rec["results_root"])
+
+
+def evaluate_folder(
+    evaluate: Callable[..., Path],
+    folder: Path,
+    bundle_path: Path,
+    label: str,
+    job_label: Optional[str] = None,
+    max_rolls: Optional[int] = None,
+    workers: Optional[int] = None,
+    memo: Optional[MemoOptions] = None,
+) -> Path:
+    """
+    Bundle the generation ``folder`` to ``bundle_path`` (deterministic zip plus interop
+    manifest for ``label``), evaluate it as ``job_label`` (default ``label``; ``max_rolls``
+    is passed on when given) and grade the results root unless every seed already has a
+    fitness.json or the root a fitness table. Returns the results root. With ``memo`` only
+    the seeds the memo cannot answer are submitted (see ``evaluate_memoized``).
+    """
+    if memo is not None:
+        return evaluate_memoized(
+            evaluate, folder, bundle_path, label, memo, job_label, max_rolls, workers
+        )[0]
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    write_bundle_zip(folder, bundle_path, deterministic=True)
+    write_interop_manifest(bundle_path, label, deterministic=True)
+    job_label = job_label or label
+    if max_rolls is None:
+        results_root = evaluate(bundle_path, job_label)
+    else:
+        results_root = evaluate(bundle_path, job_label, max_rolls)
+    run_dir = results_root / "run"
+    seed_ids = [p.name for p in folder.glob("seed_*") if p.is_dir()]
+    graded = (run_dir / FITNESS_TABLE_NAME).exists() or all(
+        (run_dir / sid / "fitness.json").exists() for sid in seed_ids
+    )
+    if not graded:
+        grade_results_root(results_root, workers=workers)
+    return results_root
+
+
+def evaluate_memoized(
+    evaluate: Callable[..., Path],
+    folder: Path,
+    bundle_path: Path,
+    label: str,
+    memo: MemoOptions,
+    job_label: Optional[str] = None,
+    max_rolls: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> tuple[Path, SubmissionPlan]:
+    """
+    ``evaluate_folder`` through an evaluation memo: ``plan_folder`` prunes memo hits and
+    duplicates into ``submission_dir(folder)``, only that folder is evaluated, and
+    ``attach_memo_results`` fills in the rest. When nothing needs submitting the results
+    root is ``<folder parent>/results/<folder name>``. Claims taken by the plan are
+    released however the evaluation ends. Returns (results root, plan).
+    """
+    plan = plan_folder(folder, memo, max_rolls)
+    store = memo.open()
+    try:
+        if plan.submit:
+            pruned = submission_dir(folder)
+            results_root = evaluate_folder(
+                evaluate, pruned, bundle_path, label, job_label, max_rolls, workers
+            )
+        else:
+            results_root = folder.parent / "results" / folder.name
+            (results_root / "run").mkdir(parents=True, exist_ok=True)
+        attach_memo_results(
+            results_root, plan, store, mean=memo.mean, wait_s=memo.wait_s if memo.claim else 0
+        )
+    finally:
+        # A failed evaluation must not leave other drivers waiting on our claims.
+        if memo.claim:
+            for sid in plan.submit:
+                store.release(plan.keys[sid])
+    return results_root, plan
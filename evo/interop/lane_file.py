@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from .types import JobPayload, read_json, stable_request_id
 from .util import atomic_write_json, compute_sha256, sleep_ms
@@ -19,6 +20,7 @@ def submit_file_job(
     generation: str,
     seed: int,
     run_flags: Dict[str, Any],
+    max_rolls: Optional[int] = None,
 ) -> str:
     bundle_path = bundle_path.resolve()
     interop = _load_interop_manifest(bundle_path)
@@ -26,7 +28,9 @@ def submit_file_job(
     # sanity: recompute hash
     assert compute_sha256(bundle_path) == bundle_id, "bundle_id hash mismatch"
 
-    request_id = stable_request_id(bundle_id, generation, seed)
+    # A roll cap changes the results, so a capped job gets its own request id and file.
+    capped = None if max_rolls is None else {"max_rolls": int(max_rolls)}
+    request_id = stable_request_id(bundle_id, generation, seed, capped)
     jobs_dir = Path(cfg.get("jobs_dir", "jobs"))
     incoming = jobs_dir / "incoming"
     incoming.mkdir(parents=True, exist_ok=True)
@@ -39,10 +43,11 @@ def submit_file_job(
         generation=generation,
         seed=int(seed),
         run_flags=dict(run_flags or {}),
-        max_rolls=None,
+        max_rolls=None if max_rolls is None else int(max_rolls),
         webhook_url=None,
     )
-    job_path = incoming / f"{bundle_id}.job.json"
+    stem = bundle_id if max_rolls is None else f"{bundle_id}.rolls{int(max_rolls)}"
+    job_path = incoming / f"{stem}.job.json"
     atomic_write_json(job_path, job.__dict__)
     return request_id
 
@@ -57,7 +62,10 @@ def wait_file_done(cfg: Dict[str, Any], request_id: str, timeout_s: int) -> Dict
 
     while True:
         for p in sorted(done_dir.glob("*.done.json")):
-            rec = read_json(p)
+            try:
+                rec = read_json(p)
+            except json.JSONDecodeError:
+                continue  # still being written; read it on the next poll
             if rec.get("request_id") == request_id:
                 return rec
         if timeout_s and (Path(".").stat().st_mtime > deadline):
@@ -4,7 +4,7 @@ import json
 import urllib.error
 import urllib.request
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from .types import stable_request_id
 from .util import compute_sha256, sleep_ms
@@ -36,6 +36,7 @@ def submit_http_job(
     generation: str,
     seed: int,
     run_flags: Dict[str, Any],
+    max_rolls: Optional[int] = None,
 ) -> str:
     bundle_path = bundle_path.resolve()
     base = cfg.get("http_base", "http://localhost:8080")
@@ -49,7 +50,7 @@ def submit_http_job(
         "generation": generation,
         "seed": int(seed),
         "run_flags": dict(run_flags or {}),
-        "max_rolls": None,
+        "max_rolls": None if max_rolls is None else int(max_rolls),
     }
     resp = _post(base, "/runs", payload, idem_key=request_id)
     if not resp.get("accepted"):
@@ -0,0 +1,240 @@
+"""
+Lane L (local): play a bundle in-process with the NumPy engine in ``evo.interop.dice``.
+
+``submit_local_job`` simulates every seed of the bundle before returning and writes a
+results root in the CSC output layout (``run/seed_*/journal.csv``, ``report.json``,
+``manifest.json`` plus a fresh ``journal.evcol`` sidecar), so grading runs unchanged. The
+receipt lands in ``<local_dir>/done/<request_id>.done.json``; a request that already has
+one is not simulated again. The request id covers ``max_rolls`` and the resolved table
+knobs, so changing either starts a new run.
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..io import columnar
+from ..io.bundles import write_bundle_manifest, write_checksums, write_contents_index
+from ..io.report_parser import JOURNAL_DTYPES, SIDECAR_NAME
+from . import dice
+from .types import DoneReceipt, read_json, stable_request_id
+from .util import atomic_write_json, compute_sha256
+
+JOURNAL_COLUMNS = (
+    "hand_id",
+    "shoe",
+    "roll",
+    "die1",
+    "die2",
+    "total",
+    "point",
+    "bankroll_after",
+    "pso_flag",
+)
+# Journal rows rendered per block, bounding the byte matrix ``_csv_rows`` builds.
+_CSV_CHUNK_ROWS = 1 << 16
+_ZERO = ord("0")
+# Simulation knobs: run_flags[name], else cfg[f"local_{name}"], else the default.
+LOCAL_KNOBS = {"shoes": 10, "rolls_per_shoe": 1000, "bankroll": 1000.0, "line_bet": 10.0}
+
+
+def _local_dir(cfg: Dict[str, Any]) -> Path:
+    return Path(cfg.get("local_dir", "local_runs"))
+
+
+def _knobs(cfg: Dict[str, Any], run_flags: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        name: type(default)(run_flags.get(name, cfg.get(f"local_{name}", default)))
+        for name, default in LOCAL_KNOBS.items()
+    }
+
+
+def _read_seeds(bundle_path: Path) -> List[tuple[str, Dict[str, bytes]]]:
+    seeds: Dict[str, Dict[str, bytes]] = {}
+    with zipfile.ZipFile(bundle_path) as zf:
+        for name in sorted(zf.namelist()):
+            parts = name.split("/")
+            if len(parts) == 2 and parts[0].startswith("seed_"):
+                seeds.setdefault(parts[0], {})[parts[1]] = zf.read(name)
+    return [(sid, files) for sid, files in sorted(seeds.items()) if "spec.json" in files]
+
+
+def _ascii_digits(magnitude: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Right-aligned ASCII digits of non-negative ints, (rows, width), and which are used.
+    width = len(str(int(magnitude.max()))) if magnitude.size else 1
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    chars = (magnitude[:, None] // powers % 10 + _ZERO).astype(np.uint8)
+    length = 1 + (magnitude[:, None] >= powers[None, :-1]).sum(axis=1)
+    return chars, np.arange(width)[None, :] >= width - length[:, None]
+
+
+def _csv_rows(columns: List[np.ndarray], cents: set[int]) -> bytes:
+    """
+    CSV rows exactly as ``np.savetxt`` writes them with ``%d`` (``%.2f`` for the columns
+    in ``cents``), rendered as one byte matrix: every field is laid out at full width and
+    a mask drops the padding, so no row is formatted in Python.
+    """
+    n = len(columns[0])
+    one = np.ones((n, 1), dtype=bool)
+    blocks: List[np.ndarray] = []
+    masks: List[np.ndarray] = []
+    for j, values in enumerate(columns):
+        if j:
+            blocks.append(np.full((n, 1), ord(","), dtype=np.uint8))
+            masks.append(one)
+        if j in cents:
+            scaled = np.rint(np.abs(values) * 100).astype(np.int64)
+            negative = np.signbit(values)
+            whole = scaled // 100
+        else:
+            whole = values.astype(np.int64)
+            negative = whole < 0
+            whole = np.abs(whole)
+        chars, used = _ascii_digits(whole)
+        blocks += [np.full((n, 1), ord("-"), dtype=np.uint8), chars]
+        masks += [negative[:, None], used]
+        if j in cents:
+            frac = scaled % 100
+            point = np.full(n, ord("."))
+            digits = np.stack([point, frac // 10 + _ZERO, frac % 10 + _ZERO], axis=1)
+            blocks.append(digits.astype(np.uint8))
+            masks.append(np.ones((n, 3), dtype=bool))
+    blocks.append(np.full((n, 1), ord("\n"), dtype=np.uint8))
+    masks.append(one)
+    return np.concatenate(blocks, axis=1)[np.concatenate(masks, axis=1)].tobytes()
+
+
+def _write_journal(run_dir: Path, journal: Dict[str, np.ndarray]) -> None:
+    # Cents, so the CSV and the sidecar written from the same arrays agree exactly.
+    journal["bankroll_after"] = np.round(journal["bankroll_after"], 2)
+    columns = [journal[name] for name in JOURNAL_COLUMNS]
+    cents = {JOURNAL_COLUMNS.index("bankroll_after")}
+    path = run_dir / "journal.csv"
+    with path.open("wb") as f:
+        f.write((",".join(JOURNAL_COLUMNS) + "\n").encode("utf-8"))
+        for lo in range(0, len(columns[0]), _CSV_CHUNK_ROWS):
+            f.write(_csv_rows([c[lo : lo + _CSV_CHUNK_ROWS] for c in columns], cents))
+    arrays = {name: journal[name].astype(dtype) for name, dtype in JOURNAL_DTYPES.items()}
+    columnar.write_columns(run_dir / SIDECAR_NAME, arrays, source=columnar.source_stamp(path))
+
+
+def run_local(
+    bundle_path: Path,
+    results_root: Path,
+    seed: int,
+    knobs: Dict[str, Any],
+    max_rolls: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Simulate every seed of ``bundle_path`` into ``results_root``; returns a summary."""
+    seeds = _read_seeds(bundle_path)
+    if not seeds:
+        raise ValueError(f"No seed_*/spec.json in {bundle_path}")
+    specs = [json.loads(files["spec.json"]) for _, files in seeds]
+    rules = dice.TableRules(bankroll=knobs["bankroll"], line_bet=knobs["line_bet"])
+    run = dice.simulate(
+        specs, seed, knobs["shoes"], knobs["rolls_per_shoe"], rules, max_rolls=max_rolls
+    )
+    for i, (sid, files) in enumerate(seeds):
+        for name, data in files.items():
+            (results_root / sid).mkdir(parents=True, exist_ok=True)
+            (results_root / sid / name).write_bytes(data)
+        run_dir = results_root / "run" / sid
+        run_dir.mkdir(parents=True, exist_ok=True)
+        journal = run.journal(i)
+        _write_journal(run_dir, journal)
+        rolls = len(journal["hand_id"])
+        report = {
+            "seed_id": sid,
+            "bankroll_start": rules.bankroll,
+            "bankroll_final": float(journal["bankroll_after"][-1]) if rolls else rules.bankroll,
+            "rolls": rolls,
+            "hands": int(journal["hand_id"][-1]) + 1 if rolls else 0,
+            "pso_count": int(journal["pso_flag"].sum()),
+            "early_stop_reason": run.early_stop[i],
+        }
+        (run_dir / "report.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+        manifest = {
+            "schema_version": "1.0",
+            "engine": dice.ENGINE_NAME,
+            "engine_version": dice.ENGINE_VERSION,
+            "seed": int(seed),
+            "shoes": knobs["shoes"],
+            "rolls_per_shoe": knobs["rolls_per_shoe"],
+            "line_bet": rules.line_bet,
+            "max_rolls": max_rolls,
+        }
+        (run_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    rel = [
+        f"run/{sid}/{name}"
+        for sid, _ in seeds
+        for name in ("journal.csv", "report.json", "manifest.json")
+    ]
+    write_checksums(results_root, rel)
+    write_contents_index(results_root)
+    write_bundle_manifest(results_root)
+    return {
+        "engine": dice.ENGINE_NAME,
+        "seeds": len(seeds),
+        "rolls": int(run.stops.sum()),
+        "early_stops": sum(reason is not None for reason in run.early_stop),
+    }
+
+
+def submit_local_job(
+    cfg: Dict[str, Any],
+    bundle_path: Path,
+    generation: str,
+    seed: int,
+    run_flags: Dict[str, Any],
+    max_rolls: Optional[int] = None,
+) -> str:
+    bundle_path = bundle_path.resolve()
+    bundle_id = compute_sha256(bundle_path)
+    flags = dict(run_flags or {})
+    try:
+        variant: Dict[str, Any] = _knobs(cfg, flags)
+    except ValueError:
+        variant = {"run_flags": flags}  # unusable flags fail below, in the receipt
+    # The same bundle at another roll budget or table setting is a different run.
+    request_id = stable_request_id(bundle_id, generation, seed, {**variant, "max_rolls": max_rolls})
+    done_path = _local_dir(cfg) / "done" / f"{request_id}.done.json"
+    if done_path.exists():
+        return request_id
+
+    results_root = (_local_dir(cfg) / request_id).resolve()
+    receipt = DoneReceipt(
+        schema_version="0.1",
+        request_id=request_id,
+        bundle_id=bundle_id,
+        generation=generation,
+        run_id=request_id,
+        results_root=str(results_root),
+        summary={},
+        status="ok",
+    ).__dict__
+    try:
+        knobs = _knobs(cfg, flags)
+        receipt["summary"] = run_local(bundle_path, results_root, seed, knobs, max_rolls)
+    except (ValueError, KeyError, OSError, zipfile.BadZipFile) as exc:
+        receipt.update(status="error", error_code="LOCAL_SIM_FAILED", error_detail=str(exc))
+    atomic_write_json(done_path, receipt)
+    return request_id
+
+
+def wait_local_done(cfg: Dict[str, Any], request_id: str, timeout_s: int) -> Dict[str, Any]:
+    # Local jobs finish inside submit; the receipt is either there or was never made.
+    done_path = _local_dir(cfg) / "done" / f"{request_id}.done.json"
+    if done_path.exists():
+        return read_json(done_path)
+    return {
+        "schema_version": "0.1",
+        "request_id": request_id,
+        "status": "error",
+        "error_code": "UNKNOWN_REQUEST",
+        "error_detail": "No local run for this request id",
+    }
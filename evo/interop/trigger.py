@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from .lane_file import submit_file_job, wait_file_done
 from .lane_http import submit_http_job, wait_http_done
+from .lane_local import submit_local_job, wait_local_done
 
 
 def submit_job(
@@ -13,12 +14,15 @@ def submit_job(
     generation: str,
     seed: int,
     run_flags: Dict[str, Any],
+    max_rolls: Optional[int] = None,
 ):
     mode = (cfg.get("mode") or "file").lower()
     if mode == "file":
-        return submit_file_job(cfg, Path(bundle_path), generation, seed, run_flags)
+        return submit_file_job(cfg, Path(bundle_path), generation, seed, run_flags, max_rolls)
     if mode == "http":
-        return submit_http_job(cfg, Path(bundle_path), generation, seed, run_flags)
+        return submit_http_job(cfg, Path(bundle_path), generation, seed, run_flags, max_rolls)
+    if mode == "local":
+        return submit_local_job(cfg, Path(bundle_path), generation, seed, run_flags, max_rolls)
     raise ValueError(f"Unknown interop mode: {mode}")
 
 
@@ -28,4 +32,6 @@ def await_completion(cfg: Dict[str, Any], handle: str, timeout_s: int) -> Dict[s
         return wait_file_done(cfg, handle, timeout_s)
     if mode == "http":
         return wait_http_done(cfg, handle, timeout_s)
+    if mode == "local":
+        return wait_local_done(cfg, handle, timeout_s)
     raise ValueError(f"Unknown interop mode: {mode}")
@@ -4,7 +4,7 @@ import json
 from dataclasses import dataclass
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 
 @dataclass(frozen=True)
@@ -35,9 +35,18 @@ class DoneReceipt:
     status: str
 
 
-def stable_request_id(bundle_id: str, generation: str, seed: int) -> str:
-    raw = f"{bundle_id}|{generation}|{seed}".encode("utf-8")
-    return f"evo-{sha256(raw).hexdigest()}"
+def stable_request_id(
+    bundle_id: str, generation: str, seed: int, variant: Optional[Mapping[str, Any]] = None
+) -> str:
+    """
+    ``sha256(bundle_id|generation|seed)``. ``variant`` holds whatever else changes the
+    results (roll budget, table settings); when given it is part of the hash, so one
+    bundle run two ways gets two request ids.
+    """
+    raw = f"{bundle_id}|{generation}|{seed}"
+    if variant:
+        raw += "|" + json.dumps(dict(variant), sort_keys=True, separators=(",", ":"))
+    return f"evo-{sha256(raw.encode('utf-8')).hexdigest()}"
 
 
 def read_json(path: Path) -> Dict[str, Any]:
@@ -47,6 +47,21 @@ def open_bundle(path: Path, staging_root: Optional[Path] = None) -> Path:
     return staging_dir
 
 
+def open_bundle_root(path: Path) -> zipfile.Path:
+    """
+    Read-only view of a bundle: a ``zipfile.Path`` whose members stream from the archive.
+    Nothing is extracted; close with ``root.root.close()`` when done.
+    """
+    if not path.exists():
+        raise FileNotFoundError(path)
+    zf = zipfile.ZipFile(path, "r")
+    for name in zf.namelist():
+        if name.startswith("/") or ".." in name.split("/"):
+            zf.close()
+            raise BundleError(f"Unsafe member path: {name}")
+    return zipfile.Path(zf)
+
+
 def validate_input_bundle(staging_dir: Path) -> None:
     """Ensure at least one seed_*/spec.json exists and no duplicates."""
     seeds = list(staging_dir.glob("seed_*/spec.json"))
@@ -98,6 +113,27 @@ def write_checksums(staging_dir: Path, rel_paths: list[str]) -> None:
     out.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
+def read_checksums(staging_dir: Path) -> Dict[str, str]:
+    """Parse run/checksums.txt into {relative_path: sha256}; {} if absent."""
+    path = staging_dir / "run" / "checksums.txt"
+    if not path.exists():
+        return {}
+    out: Dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        digest, sep, rel = line.partition("  ")
+        if sep and rel:
+            out[rel] = digest
+    return out
+
+
+def read_contents_index(staging_dir: Path) -> Dict[str, Dict]:
+    """Load run/CONTENTS.json keyed by relative path; {} if absent."""
+    path = staging_dir / "run" / "CONTENTS.json"
+    if not path.exists():
+        return {}
+    return {entry["path"]: entry for entry in json.loads(path.read_text(encoding="utf-8"))}
+
+
 def write_contents_index(staging_dir: Path) -> None:
     """Enumerate all files and write run/CONTENTS.json."""
     index = []
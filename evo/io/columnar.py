@@ -0,0 +1,101 @@
+"""
+Memory-mappable columnar sidecar for journal.csv.
+
+Layout (little-endian):
+  b"EVOCOL1\\n" | uint32 header length | JSON header | padding | column blocks
+The header lists ``rows``, the ``source`` journal's size/mtime (for freshness) and, per
+column, its ``name``, NumPy ``dtype`` string and byte ``offset`` from the first data block.
+Blocks are 64-byte aligned.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"EVOCOL1\n"
+SIDECAR_VERSION = 1
+_ALIGN = 64
+
+
+def _aligned(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def source_stamp(path: Path) -> Dict[str, int]:
+    st = path.stat()
+    return {"bytes": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def write_columns(
+    path: Path,
+    arrays: Mapping[str, np.ndarray],
+    source: Optional[Dict[str, int]] = None,
+) -> Path:
+    """Write equal-length 1-D ``arrays`` as a sidecar file (atomic replace)."""
+    lengths = {len(a) for a in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError("Sidecar columns must have equal length")
+    rows = lengths.pop() if lengths else 0
+    fixed = {
+        name: np.ascontiguousarray(a, dtype=a.dtype.newbyteorder("<")) for name, a in arrays.items()
+    }
+
+    columns = []
+    offset = 0
+    for name, a in fixed.items():
+        columns.append({"name": name, "dtype": a.dtype.str, "offset": offset})
+        offset = _aligned(offset + a.nbytes)
+    header = {
+        "version": SIDECAR_VERSION,
+        "rows": rows,
+        "source": dict(source or {}),
+        "columns": columns,
+    }
+    blob = json.dumps(header, sort_keys=True).encode("utf-8")
+    data_start = _aligned(len(MAGIC) + 4 + len(blob))
+
+    tmp = path.with_suffix(path.suffix + ".partial")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(blob)))
+        f.write(blob)
+        for col, a in zip(columns, fixed.values()):
+            f.seek(data_start + col["offset"])
+            f.write(a.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp, path)
+    return path
+
+
+def read_header(path: Path) -> Tuple[Dict[str, Any], int]:
+    """Return (header, data_start) or raise ValueError for a foreign/corrupt file."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a journal sidecar: {path}")
+        (length,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(length).decode("utf-8"))
+    if header.get("version") != SIDECAR_VERSION:
+        raise ValueError(f"Unsupported sidecar version: {header.get('version')}")
+    return header, _aligned(len(MAGIC) + 4 + length)
+
+
+def read_columns(path: Path) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """Memory-map every column read-only; slicing touches only the pages it needs."""
+    header, data_start = read_header(path)
+    rows = int(header["rows"])
+    arrays: Dict[str, np.ndarray] = {}
+    for col in header["columns"]:
+        dtype = np.dtype(col["dtype"])
+        if rows == 0:
+            arrays[col["name"]] = np.empty(0, dtype=dtype)
+        else:
+            arrays[col["name"]] = np.memmap(
+                path, dtype=dtype, mode="r", offset=data_start + col["offset"], shape=(rows,)
+            )
+    return header, arrays
@@ -0,0 +1,343 @@
+"""
+Content-addressed memo of CSC evaluations, keyed by canonical spec + run flags + seed.
+
+Before bundling, ``plan_submission`` drops seeds whose evaluation is already memoized (or
+that duplicate another seed of the same generation) from the submission set. After the
+pruned results are graded, ``attach_memo_results`` records the fresh results and writes
+fitness.json for every skipped seed from the memo, optionally as the running mean over
+replicate evaluations.
+
+Concurrent users of one memo (e.g. sweep arms) pass ``claim=True``: a key is submitted by
+whichever planner claims it first, and the others wait for its result when attaching. A
+claim lasts until its result is recorded or the claimant gives up (``release``); waiters
+stop as soon as a claim disappears without a result.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from .fitness_table import write_fitness_table
+
+# Spec blocks CSC ignores; they differ per candidate and must not split the memo key.
+_SPEC_IGNORED = ("identity",)
+
+PLAN_NAME = "submission_plan.json"
+
+
+def _digest(payload: Any) -> str:
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _canonical(spec: Mapping[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in spec.items() if k not in _SPEC_IGNORED}
+
+
+def memo_key(spec: Mapping[str, Any], run_flags: Mapping[str, Any], seed: Optional[int]) -> str:
+    """
+    SHA-256 over the canonical spec (sorted keys, ``identity`` dropped), run flags and seed.
+    ``seed=None`` pools replicate evaluations of a spec across seeds.
+    """
+    return _digest({"spec": _canonical(spec), "run_flags": dict(run_flags), "seed": seed})
+
+
+def spec_digest(spec: Mapping[str, Any]) -> str:
+    """SHA-256 of the canonical spec alone, canonicalized as in ``memo_key``."""
+    return _digest(_canonical(spec))
+
+
+class EvalMemo:
+    """
+    One directory per key under ``root`` holding one JSON file per replicate evaluation
+    (``000001.json``, ``000002.json``, ...). Each file is written once and published with
+    an exclusive hard link, so concurrent recorders never lose each other's replicates.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _replicates(self, key: str) -> List[str]:
+        try:
+            names = os.listdir(self._path(key))
+        except FileNotFoundError:
+            return []
+        return sorted(n for n in names if n.endswith(".json") and not n.startswith("."))
+
+    def runs(self, key: str) -> List[Dict[str, Any]]:
+        folder = self._path(key)
+        runs = []
+        for name in self._replicates(key):
+            try:
+                runs.append(json.loads((folder / name).read_text(encoding="utf-8")))
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+        return runs
+
+    def record(self, key: str, payload: Mapping[str, Any]) -> int:
+        """Append one replicate evaluation; returns its replicate number."""
+        folder = self._path(key)
+        folder.mkdir(parents=True, exist_ok=True)
+        tmp = folder / f".{os.getpid()}.{threading.get_ident()}.partial"
+        tmp.write_text(json.dumps(dict(payload), indent=2), encoding="utf-8")
+        try:
+            n = len(self._replicates(key)) + 1
+            while True:
+                try:
+                    os.link(tmp, folder / f"{n:06d}.json")
+                    break
+                except FileExistsError:
+                    n += 1
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.release(key)
+        return n
+
+    def _claim_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.claim"
+
+    def claim(self, key: str) -> bool:
+        """Atomically reserve ``key`` for evaluation; False if someone else holds it."""
+        path = self._claim_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        os.close(fd)
+        return True
+
+    def claimed(self, key: str) -> bool:
+        return self._claim_path(key).exists()
+
+    def release(self, key: str) -> None:
+        """Drop the claim on ``key`` (recording a result does this too)."""
+        self._claim_path(key).unlink(missing_ok=True)
+
+    def clear_claims(self) -> int:
+        """Drop every claim (left behind by a crashed run); returns how many."""
+        stale = list(self.root.glob("*/*.claim"))
+        for path in stale:
+            path.unlink(missing_ok=True)
+        return len(stale)
+
+    def wait(self, key: str, timeout_s: float, poll_s: float = 0.05) -> bool:
+        """
+        Block until ``key`` has a recorded evaluation. False on timeout, or at once when
+        nobody holds a claim on it any more (the claimant failed or gave up).
+        """
+        deadline = time.monotonic() + timeout_s
+        while not self.runs(key):
+            # Recording publishes the result before dropping the claim: look once more.
+            if not self.claimed(key):
+                return bool(self.runs(key))
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_s)
+        return True
+
+    def result(self, key: str, mean: bool = False) -> Optional[Dict[str, Any]]:
+        """Latest replicate, or with ``mean`` every numeric field averaged over replicates."""
+        runs = self.runs(key)
+        if not runs:
+            return None
+        out = dict(runs[-1])
+        if mean and len(runs) > 1:
+            for name, value in out.items():
+                values = [r.get(name) for r in runs]
+                if all(_is_number(v) for v in values):
+                    out[name] = round(sum(values) / len(values), 4)
+        return out
+
+
+@dataclass
+class MemoOptions:
+    """
+    How a driver uses a memo: where it lives, the run flags and seed its keys carry, and
+    the ``plan_submission``/``attach_memo_results`` options. Picklable for process pools.
+    """
+
+    root: Path
+    run_flags: Dict[str, Any] = field(default_factory=dict)
+    seed: Optional[int] = None
+    min_replicates: int = 1
+    mean: bool = False
+    claim: bool = False
+    wait_s: float = 3600.0
+
+    def open(self) -> EvalMemo:
+        return EvalMemo(self.root)
+
+    def key_flags(self, max_rolls: Optional[int] = None) -> Dict[str, Any]:
+        """Run flags for the key; a roll budget is part of what CSC simulated."""
+        if max_rolls is None:
+            return dict(self.run_flags)
+        return {**self.run_flags, "max_rolls": max_rolls}
+
+
+def submission_dir(gen_dir: Path) -> Path:
+    """Where the pruned copy of ``gen_dir`` (and its plan) goes: ``<parent>/submit/<name>``."""
+    return gen_dir.parent / "submit" / gen_dir.name
+
+
+@dataclass
+class SubmissionPlan:
+    """Which seeds of a generation go to CSC and where every other seed's result comes from."""
+
+    gen_dir: str
+    keys: Dict[str, str] = field(default_factory=dict)  # seed_id -> memo key
+    submit: List[str] = field(default_factory=list)
+    # seed_id -> seed it duplicates in this submission (None: answered by the memo)
+    reuse: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    def write(self, path: Path) -> Path:
+        path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        return path
+
+    @classmethod
+    def read(cls, path: Path) -> "SubmissionPlan":
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+
+def plan_submission(
+    gen_dir: Path,
+    memo: EvalMemo,
+    run_flags: Mapping[str, Any],
+    seed: Optional[int],
+    out_dir: Optional[Path] = None,
+    min_replicates: int = 1,
+    claim: bool = False,
+) -> SubmissionPlan:
+    """
+    Key every ``gen_dir/seed_*`` and keep one representative per key that the memo holds
+    fewer than ``min_replicates`` evaluations of. With ``out_dir`` the pruned generation
+    folder (submitted seeds + filtered manifest) is written there for bundling. With
+    ``claim``, keys another planner has claimed are left to it (reuse from the memo), and
+    a key whose result lands between the memo check and the claim is released again.
+    """
+    plan = SubmissionPlan(gen_dir=str(gen_dir))
+    first: Dict[str, str] = {}
+    for seed_dir in sorted(p for p in gen_dir.glob("seed_*") if p.is_dir()):
+        spec = json.loads((seed_dir / "spec.json").read_text(encoding="utf-8"))
+        key = memo_key(spec, run_flags, seed)
+        plan.keys[seed_dir.name] = key
+        if key in first:
+            plan.reuse[seed_dir.name] = first[key]
+        elif len(memo.runs(key)) >= min_replicates or (claim and not memo.claim(key)):
+            plan.reuse[seed_dir.name] = None
+        elif claim and len(memo.runs(key)) >= min_replicates:
+            memo.release(key)
+            plan.reuse[seed_dir.name] = None
+        else:
+            first[key] = seed_dir.name
+            plan.submit.append(seed_dir.name)
+    if out_dir is not None:
+        _write_pruned(gen_dir, plan.submit, out_dir)
+    return plan
+
+
+def _write_pruned(gen_dir: Path, seed_ids: List[str], out_dir: Path) -> None:
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+    for sid in seed_ids:
+        shutil.copytree(gen_dir / sid, out_dir / sid)
+    manifest_path = gen_dir / "population_manifest.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        keep = set(seed_ids)
+        manifest["candidates"] = [c for c in manifest.get("candidates", []) if c["id"] in keep]
+        manifest["pop_size"] = len(manifest["candidates"])
+        (out_dir / "population_manifest.json").write_text(
+            json.dumps(manifest, indent=2), encoding="utf-8"
+        )
+
+
+def plan_folder(
+    gen_dir: Path, options: MemoOptions, max_rolls: Optional[int] = None
+) -> SubmissionPlan:
+    """
+    ``plan_submission`` under ``options``: the pruned folder and its ``PLAN_NAME`` go to
+    ``submission_dir(gen_dir)``.
+    """
+    out_dir = submission_dir(gen_dir)
+    plan = plan_submission(
+        gen_dir,
+        options.open(),
+        options.key_flags(max_rolls),
+        options.seed,
+        out_dir=out_dir,
+        min_replicates=options.min_replicates,
+        claim=options.claim,
+    )
+    plan.write(out_dir / PLAN_NAME)
+    return plan
+
+
+def attach_memo_results(
+    results_root: Path,
+    plan: SubmissionPlan,
+    memo: EvalMemo,
+    mean: bool = False,
+    wait_s: float = 0.0,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Record each submitted seed's graded ``run/<seed_id>/fitness.json`` in the memo, then
+    write fitness.json (plus the seed folder) for every reused seed so ``results_root``
+    covers the whole generation, and rewrite ``run/fitness_table.csv``. With ``mean``,
+    seeds with several replicates get the replicate mean. Reused keys still being evaluated
+    elsewhere (``claim``) are waited for up to ``wait_s`` each; a RuntimeError is raised
+    once one times out or its claimant gives up without a result. Returns rewritten payloads.
+    """
+    run_dir = results_root / "run"
+    attached: Dict[str, Dict[str, Any]] = {}
+    for sid in plan.submit:
+        path = run_dir / sid / "fitness.json"
+        if not path.exists():
+            raise FileNotFoundError(f"{path} missing; grade the results root first")
+        if memo.record(plan.keys[sid], json.loads(path.read_text(encoding="utf-8"))) > 1 and mean:
+            attached[sid] = _attach(run_dir, sid, plan.keys[sid], memo, mean)
+    gen_dir = Path(plan.gen_dir)
+    for sid in sorted(plan.reuse):
+        if wait_s > 0 and not memo.wait(plan.keys[sid], wait_s):
+            raise RuntimeError(
+                f"No evaluation of {sid} ({plan.keys[sid]}) arrived: its claimant gave up"
+                f" or {wait_s:g}s passed"
+            )
+        attached[sid] = _attach(run_dir, sid, plan.keys[sid], memo, mean)
+        if not (results_root / sid).exists() and (gen_dir / sid).exists():
+            shutil.copytree(gen_dir / sid, results_root / sid)
+    rows = [
+        json.loads(p.read_text(encoding="utf-8"))
+        for p in sorted(run_dir.glob("seed_*/fitness.json"), key=lambda p: p.parent.name)
+    ]
+    write_fitness_table(run_dir, rows)
+    return attached
+
+
+def _attach(run_dir: Path, sid: str, key: str, memo: EvalMemo, mean: bool) -> Dict[str, Any]:
+    payload = memo.result(key, mean=mean)
+    if payload is None:
+        raise KeyError(f"No memoized evaluation for {sid} ({key})")
+    payload["seed_id"] = sid
+    payload["memo"] = {"key": key, "replicates": len(memo.runs(key)), "mean": mean}
+    (run_dir / sid).mkdir(parents=True, exist_ok=True)
+    (run_dir / sid / "fitness.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return payload
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
@@ -16,9 +16,58 @@ def write_generation_folder(
     elite_ids: set[str] | None = None,
     manifest_overrides: Optional[Dict[str, Any]] = None,
 ) -> Path:
+    files = render_generation_folder(gen_id, individuals, elite_ids, manifest_overrides)
+    return write_rendered_folder(out_dir, files)
+
+
+def write_rendered_folder(out_dir: Path, files: Dict[str, bytes]) -> Path:
+    """Write ``render_generation_folder`` output (relative path -> bytes) under ``out_dir``."""
     out_dir.mkdir(parents=True, exist_ok=True)
+    for rel, data in files.items():
+        path = out_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return out_dir
+
+
+def is_trial_generation(manifest_overrides: Optional[Dict[str, Any]]) -> bool:
+    """Whether non-elite candidates of this generation belong to the grace trial cohort."""
+    return bool((manifest_overrides or {}).get("grace", {}).get("enabled"))
+
+
+def render_candidate(
+    gen_id: str, seed_name: str, ind: Individual, is_elite: bool, is_trial: bool
+) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    (spec, dna) of ``ind`` exactly as the generation folder stores them under ``seed_name``.
+    Elites are stamped in their DNA identity, offspring in their spec identity; the other
+    dict is shared with ``ind`` (copy-on-write, so never mutate either in place).
+    """
+    stamp: Dict[str, Any] = {"source": "evolver", "gen_id": gen_id, "candidate_id": seed_name}
+    if is_trial:
+        stamp["trial_cohort"] = True
+    if is_elite:
+        dna = dict(ind.dna)
+        dna["identity"] = {**dna.get("identity", {}), **stamp}
+        return ind.spec, dna
+    spec = dict(ind.spec)
+    spec["identity"] = {**spec.get("identity", {}), **stamp}
+    return spec, ind.dna
+
+
+def render_generation_folder(
+    gen_id: str,
+    individuals: Iterable[Individual],
+    elite_ids: set[str] | None = None,
+    manifest_overrides: Optional[Dict[str, Any]] = None,
+) -> Dict[str, bytes]:
+    """
+    Serialize a generation folder in memory: ``seed_NNNN/spec.json``, ``seed_NNNN/dna.json``
+    and ``population_manifest.json``, byte-identical to what ``write_generation_folder`` writes.
+    """
+    files: Dict[str, bytes] = {}
     elite_ids = elite_ids or set()
-    trial_enabled = bool((manifest_overrides or {}).get("grace", {}).get("enabled"))
+    trial_enabled = is_trial_generation(manifest_overrides)
 
     pop_manifest = {
         "pop_schema_version": "0.2",
@@ -28,40 +77,39 @@ def write_generation_folder(
         "candidates": [],
     }
     for idx, ind in enumerate(individuals, start=1):
-        seed_dir = out_dir / f"seed_{idx:04d}"
-        seed_dir.mkdir(parents=True, exist_ok=True)
+        seed_name = f"seed_{idx:04d}"
         is_elite = ind.seed_id in elite_ids
         is_trial = trial_enabled and not is_elite
-        if is_elite:
-            (seed_dir / "spec.json").write_text(json.dumps(ind.spec, indent=2), encoding="utf-8")
-            dna = dict(ind.dna)
-            dna.setdefault("identity", {})
-            dna["identity"].update(
-                {"source": "evolver", "gen_id": gen_id, "candidate_id": seed_dir.name}
-            )
-            if is_trial:
-                dna["identity"]["trial_cohort"] = True
-            (seed_dir / "dna.json").write_text(json.dumps(dna, indent=2), encoding="utf-8")
-        else:
-            spec = dict(ind.spec)
-            identity = spec.get("identity", {})
-            identity.update({"source": "evolver", "gen_id": gen_id, "candidate_id": seed_dir.name})
-            if is_trial:
-                identity["trial_cohort"] = True
-            spec["identity"] = identity
-            (seed_dir / "spec.json").write_text(json.dumps(spec, indent=2), encoding="utf-8")
-            (seed_dir / "dna.json").write_text(json.dumps(ind.dna, indent=2), encoding="utf-8")
-        pop_manifest["candidates"].append({"id": seed_dir.name, "trial_cohort": is_trial})
+        spec, dna = render_candidate(gen_id, seed_name, ind, is_elite, is_trial)
+        files[f"{seed_name}/spec.json"] = dumps_json(spec)
+        files[f"{seed_name}/dna.json"] = dumps_json(dna)
+        pop_manifest["candidates"].append({"id": seed_name, "trial_cohort": is_trial})
         pop_manifest["pop_size"] += 1
     if manifest_overrides:
         pop_manifest.update(manifest_overrides)
         if "adaptive" in manifest_overrides and "mode" in manifest_overrides["adaptive"]:
             pop_manifest["mode"] = manifest_overrides["adaptive"]["mode"]
 
-    (out_dir / "population_manifest.json").write_text(
-        json.dumps(pop_manifest, indent=2), encoding="utf-8"
-    )
-    return out_dir
+    files["population_manifest.json"] = dumps_json(pop_manifest)
+    return files
+
+
+def render_and_write_folder(
+    out_dir: Path,
+    gen_id: str,
+    individuals: Iterable[Individual],
+    elite_ids: set[str] | None = None,
+    manifest_overrides: Optional[Dict[str, Any]] = None,
+) -> Dict[str, bytes]:
+    """``write_generation_folder`` that returns the rendered files (for writer threads)."""
+    files = render_generation_folder(gen_id, individuals, elite_ids, manifest_overrides)
+    write_rendered_folder(out_dir, files)
+    return files
+
+
+def dumps_json(data: Any) -> bytes:
+    """The exact bytes a generation folder stores for ``data`` (spec.json, dna.json, ...)."""
+    return json.dumps(data, indent=2).encode("utf-8")
 
 
 def zip_generation_folder(src_dir: Path, out_zip: Path) -> Path:
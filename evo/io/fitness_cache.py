@@ -0,0 +1,214 @@
+"""
+Content-addressed, size-bounded on-disk cache of fitness.json payloads.
+
+Entries are keyed by SHA-256 of the graded inputs (journal.csv, report.json) plus the
+metric set and fitness version, so a hit never needs to open the journal.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import zipfile
+from dataclasses import dataclass
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from .bundles import read_checksums, read_contents_index
+
+CACHE_INPUTS = ("journal.csv", "report.json")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _hash_path(path: Path) -> str:
+    h = sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _size(path: Path) -> int:
+    if isinstance(path, zipfile.Path):
+        return path.root.getinfo(path.at).file_size
+    return path.stat().st_size
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    # Bundle members cannot change under an open archive; None means "always current".
+    if isinstance(path, zipfile.Path):
+        return None
+    return path.stat().st_mtime_ns
+
+
+@dataclass(frozen=True)
+class RootIndex:
+    """Parsed run/checksums.txt and run/CONTENTS.json of one results root."""
+
+    checksums: Dict[str, str]
+    contents: Dict[str, Dict]
+    checksums_mtime_ns: Optional[int] = None
+    contents_mtime_ns: Optional[int] = None
+
+    def digest(self, path: Path, rel: str) -> Optional[str]:
+        """
+        Recorded SHA-256 of ``path`` if the record still describes the file: it must not
+        have been modified after the index was written (a same-size rewrite keeps the
+        CONTENTS size), and its size must match CONTENTS where that records one.
+        """
+        mtime = _mtime_ns(path)
+        entry = self.contents.get(rel)
+        if (
+            entry is not None
+            and entry.get("bytes") == _size(path)
+            and _not_newer(mtime, self.contents_mtime_ns)
+        ):
+            return entry["sha256"]
+        if rel in self.checksums and _not_newer(mtime, self.checksums_mtime_ns):
+            return self.checksums[rel]
+        return None
+
+
+def _not_newer(mtime: Optional[int], index_mtime: Optional[int]) -> bool:
+    return mtime is None or index_mtime is None or mtime <= index_mtime
+
+
+def read_root_index(staging_dir: Path) -> RootIndex:
+    checksums_path = staging_dir / "run" / "checksums.txt"
+    contents_path = staging_dir / "run" / "CONTENTS.json"
+    return RootIndex(
+        checksums=read_checksums(staging_dir),
+        contents=read_contents_index(staging_dir),
+        checksums_mtime_ns=_mtime_ns(checksums_path) if checksums_path.exists() else None,
+        contents_mtime_ns=_mtime_ns(contents_path) if contents_path.exists() else None,
+    )
+
+
+# Per-process memo so grading N seeds of one root parses its index files once, not N times.
+_ROOT_INDEXES: Dict[Tuple[Any, ...], RootIndex] = {}
+_ROOT_INDEX_SLOTS = 8
+
+
+def _index_stamp(path: Path) -> Any:
+    if isinstance(path, zipfile.Path):
+        return path.exists()
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def root_index(staging_dir: Path) -> RootIndex:
+    """``read_root_index``, reused while run/checksums.txt and run/CONTENTS.json are unchanged."""
+    if isinstance(staging_dir, zipfile.Path):
+        where: Any = (staging_dir.root.filename, staging_dir.at)
+    else:
+        where = str(staging_dir)
+    run_dir = staging_dir / "run"
+    key = (
+        where,
+        _index_stamp(run_dir / "checksums.txt"),
+        _index_stamp(run_dir / "CONTENTS.json"),
+    )
+    index = _ROOT_INDEXES.get(key)
+    if index is None:
+        if len(_ROOT_INDEXES) >= _ROOT_INDEX_SLOTS:
+            _ROOT_INDEXES.clear()
+        index = _ROOT_INDEXES[key] = read_root_index(staging_dir)
+    return index
+
+
+def input_hashes(run_seed_dir: Path, index: Optional[RootIndex] = None) -> Dict[str, str]:
+    """
+    SHA-256 per graded input of a run/<seed_id>/ directory (``Path`` or ``zipfile.Path``).
+
+    Reuses the recorded digests of the root's ``index`` (default: ``root_index``) when they
+    still describe the file: CONTENTS sizes must match, and neither index may be older than
+    the file. Otherwise hashes the file. Missing → "absent".
+    """
+    if index is None:
+        index = root_index(run_seed_dir.parent.parent)
+    out: Dict[str, str] = {}
+    for name in CACHE_INPUTS:
+        path = run_seed_dir / name
+        rel = f"run/{run_seed_dir.name}/{name}"
+        if not path.exists():
+            out[name] = "absent"
+        else:
+            out[name] = index.digest(path, rel) or _hash_path(path)
+    return out
+
+
+def cache_key(hashes: Mapping[str, str], metrics: Iterable[str], version: str) -> str:
+    parts = [f"{k}={hashes[k]}" for k in sorted(hashes)]
+    parts.append("metrics=" + ",".join(sorted(metrics)))
+    parts.append(f"version={version}")
+    return sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class FitnessCache:
+    """LRU-by-mtime cache under ``root``; evicts oldest entries once over ``max_bytes``."""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Running estimate so puts only rescan the directory when the bound may be exceeded.
+        self._approx_bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def put(self, key: str, payload: Mapping[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.partial")
+        data = json.dumps(payload, indent=2)
+        tmp.write_text(data, encoding="utf-8")
+        os.replace(tmp, path)
+        if self._approx_bytes is None:
+            self._approx_bytes = self.size_bytes()
+        else:
+            self._approx_bytes += len(data)
+        if self._approx_bytes > self.max_bytes:
+            self.evict()
+
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.root.glob("*/*.json"))
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until under ``max_bytes``; return count removed."""
+        entries = []
+        for p in self.root.glob("*/*.json"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, p in sorted(entries, key=lambda e: (e[0], str(e[2]))):
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self._approx_bytes = total
+        return removed
@@ -0,0 +1,77 @@
+"""
+The consolidated per-generation fitness table, ``run/fitness_table.csv``.
+
+Grading writes it next to the per-seed ``fitness.json`` files; lazy loading, the runner
+and racing read it back as a seed -> score index. Its ``spec_hash`` column is each seed's
+``Individual.spec_hash``, so a lazy population can measure diversity and dedupe
+surrogate observations without opening every spec.json.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from ..population import canonical_spec_hash
+
+FITNESS_TABLE_NAME = "fitness_table.csv"
+FITNESS_TABLE_COLUMNS = [
+    "seed_id",
+    "fitness_score",
+    "roi",
+    "drawdown_max",
+    "pso_rate",
+    "hands_played",
+    "rolls_played",
+    "bankroll_final",
+    "spec_hash",
+]
+
+
+def write_fitness_table(run_dir: Path, rows: List[Dict[str, Any]]) -> Path:
+    """
+    Write the consolidated per-generation table beside the per-seed folders. Rows without
+    a ``spec_hash`` get one from ``<results root>/<seed_id>/spec.json`` when it exists.
+    """
+    path = run_dir / FITNESS_TABLE_NAME
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FITNESS_TABLE_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            if "spec_hash" not in row:
+                spec_path = run_dir.parent / str(row.get("seed_id")) / "spec.json"
+                if spec_path.exists():
+                    spec = json.loads(spec_path.read_text(encoding="utf-8"))
+                    row = {**row, "spec_hash": canonical_spec_hash(spec)}
+            writer.writerow(row)
+    return path
+
+
+def _table_rows(run_dir: Path) -> Iterator[Dict[str, str]]:
+    with (run_dir / FITNESS_TABLE_NAME).open(newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def read_fitness_table(run_dir: Path) -> Dict[str, Dict[str, float]]:
+    """``run_dir/fitness_table.csv`` as seed_id -> numeric columns (blank cells dropped)."""
+    rows: Dict[str, Dict[str, float]] = {}
+    for row in _table_rows(run_dir):
+        values: Dict[str, float] = {}
+        for key, value in row.items():
+            if key in ("seed_id", "spec_hash") or value in (None, ""):
+                continue
+            try:
+                values[key] = float(value)
+            except ValueError:
+                continue
+        rows[row["seed_id"]] = values
+    return rows
+
+
+def read_spec_hashes(run_dir: Path) -> Dict[str, str]:
+    """seed_id -> ``spec_hash`` column of ``run_dir/fitness_table.csv`` (blank cells dropped)."""
+    return {
+        row["seed_id"]: row["spec_hash"] for row in _table_rows(run_dir) if row.get("spec_hash")
+    }
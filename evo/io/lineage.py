@@ -0,0 +1,110 @@
+"""
+Append-only lineage store: one JSON line per bred individual.
+
+With a store, ``update_dna`` writes only the local ops delta into dna.json plus a
+``lineage.ref`` pointer; the record here holds the operation, parents (and their refs),
+subseed and parent hashes. ``history`` rebuilds the full ops_log on demand by walking
+first-parent links, the same chain a copied ops_log used to follow.
+"""
+
+from __future__ import annotations
+
+import json
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+LINEAGE_FILE = "lineage.jsonl"
+
+
+def record_ref(record: Mapping[str, Any]) -> str:
+    """Content address of a lineage record (its ``ref`` field excluded)."""
+    body = {k: v for k, v in record.items() if k != "ref"}
+    blob = json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return sha256(blob.encode("utf-8")).hexdigest()[:24]
+
+
+class LineageStore:
+    """
+    ``path`` is a JSONL file (or a directory holding ``lineage.jsonl``). ``append`` buffers
+    records; ``flush`` appends them to disk. Several processes may append to one file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path = Path(path)
+        self.path = path / LINEAGE_FILE if path.suffix != ".jsonl" else path
+        self._buffer: List[Dict[str, Any]] = []
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Ship only the location to worker processes; each keeps its own buffer.
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["path"])
+
+    def append(self, record: Mapping[str, Any]) -> str:
+        entry = dict(record)
+        entry["ref"] = record_ref(entry)
+        self._buffer.append(entry)
+        if self._index is not None:
+            self._index[entry["ref"]] = entry
+        return entry["ref"]
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(e, sort_keys=True) + "\n" for e in self._buffer)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(data)
+        self._buffer = []
+
+    def reload(self) -> None:
+        index: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        index[entry["ref"]] = entry
+        for entry in self._buffer:
+            index[entry["ref"]] = entry
+        self._index = index
+
+    def get(self, ref: str) -> Dict[str, Any]:
+        if self._index is None or ref not in self._index:
+            self.reload()
+        assert self._index is not None
+        try:
+            return self._index[ref]
+        except KeyError:
+            raise KeyError(f"Lineage ref {ref} not found in {self.path}") from None
+
+    def history(self, ref: str) -> List[Dict[str, Any]]:
+        """Full ops_log of ``ref`` (oldest first, ``t`` renumbered) via first-parent links."""
+        chain = []
+        seen = set()
+        node: Optional[str] = ref
+        while node is not None and node not in seen:
+            seen.add(node)
+            record = self.get(node)
+            chain.append(record)
+            parent_refs = record.get("parent_refs") or [None]
+            node = parent_refs[0]
+        ops = [dict(op) for record in reversed(chain) for op in record.get("ops", [])]
+        for t, op in enumerate(ops):
+            op["t"] = t
+        return ops
+
+    def ancestors(self, ref: str) -> Iterator[Dict[str, Any]]:
+        """Every recorded ancestor of ``ref`` (itself first), breadth-first over all parents."""
+        queue = [ref]
+        seen = {ref}
+        while queue:
+            record = self.get(queue.pop(0))
+            yield record
+            for parent in record.get("parent_refs", []):
+                if parent is not None and parent not in seen:
+                    seen.add(parent)
+                    queue.append(parent)
@@ -0,0 +1,403 @@
+"""
+Embedded SQLite index of every generation: individuals, parent edges, operators, spec
+hashes and fitness.
+
+``evolve``/``Evolution`` and the graders add their generation in one transaction when
+given a ``LineageDB``; ``import_tree`` back-fills from existing generation folders,
+results roots and bundles, parsing them in parallel. Ancestry and operator efficacy are
+then single indexed queries instead of globbing every dna.json and fitness.json.
+
+Generation ``N`` is the folder labelled ``gN`` (any zero padding); parents of its
+individuals live in generation ``N-1``. An elite copy has no DNA parents; its DNA
+``elite_of`` names the seed it was one generation back, which is its single parent edge.
+Any other parentless individual (a hand-made or imported seed) is a ``root`` with no
+edges. ``run`` namespaces independent campaigns or islands sharing a database.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .bundles import open_bundle_root
+from .eval_memo import spec_digest
+
+AnyPath = Union[Path, zipfile.Path]
+
+FITNESS_COLUMNS = (
+    "fitness_score",
+    "roi",
+    "drawdown_max",
+    "pso_rate",
+    "hands_played",
+    "rolls_played",
+    "bankroll_final",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS individuals (
+    run TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    seed_id TEXT NOT NULL,
+    gen_id TEXT,
+    spec_hash TEXT NOT NULL,
+    profile_id TEXT,
+    operator TEXT,
+    op_params TEXT,
+    rng_subseed INTEGER,
+    lineage_ref TEXT,
+    PRIMARY KEY (run, generation, seed_id)
+);
+CREATE INDEX IF NOT EXISTS individuals_generation ON individuals (generation);
+CREATE INDEX IF NOT EXISTS individuals_seed ON individuals (seed_id);
+CREATE INDEX IF NOT EXISTS individuals_spec_hash ON individuals (spec_hash);
+CREATE INDEX IF NOT EXISTS individuals_operator ON individuals (operator);
+CREATE TABLE IF NOT EXISTS parents (
+    run TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    seed_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    parent_seed_id TEXT,
+    parent_hash TEXT,
+    PRIMARY KEY (run, generation, seed_id, position)
+);
+CREATE INDEX IF NOT EXISTS parents_parent ON parents (run, generation, parent_seed_id);
+CREATE TABLE IF NOT EXISTS fitness (
+    run TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    seed_id TEXT NOT NULL,
+    fitness_score REAL,
+    roi REAL,
+    drawdown_max REAL,
+    pso_rate REAL,
+    hands_played REAL,
+    rolls_played REAL,
+    bankroll_final REAL,
+    payload TEXT,
+    PRIMARY KEY (run, generation, seed_id)
+);
+CREATE INDEX IF NOT EXISTS fitness_score ON fitness (fitness_score);
+"""
+
+IndividualRow = Tuple[Any, ...]
+EdgeRow = Tuple[Any, ...]
+FitnessRow = Tuple[Any, ...]
+
+_GEN_LABEL = re.compile(r"^g(\d+)")
+
+
+def generation_number(label: str) -> Optional[int]:
+    """``"g007"``/``"g7"``/``"g007_results"`` -> 7; None when the label is not a generation."""
+    match = _GEN_LABEL.match(label)
+    return int(match.group(1)) if match else None
+
+
+def _birth_op(dna: Mapping[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    # The producing operator is the newest structured entry; elites and roots have none.
+    if not dna.get("parents"):
+        return ("elite" if dna.get("elite_of") else "root"), None
+    for entry in reversed(dna.get("ops_log", [])):
+        if isinstance(entry, dict) and entry.get("type") not in (None, "op"):
+            params = {k: v for k, v in entry.items() if k not in ("type", "t")}
+            return entry["type"], json.dumps(params, sort_keys=True)
+    return None, None
+
+
+def generation_rows(
+    files: Mapping[str, bytes], run: str = "", gen_id: Optional[str] = None
+) -> Tuple[List[IndividualRow], List[EdgeRow]]:
+    """
+    Rows for a generation given as relative path -> bytes (``render_generation_folder``
+    output). The label comes from ``gen_id``, the manifest, or the DNA identity.
+    """
+    manifest = files.get("population_manifest.json")
+    if gen_id is None and manifest is not None:
+        gen_id = json.loads(manifest).get("gen_id")
+    individuals: List[IndividualRow] = []
+    edges: List[EdgeRow] = []
+    for rel in sorted(files):
+        seed_id, _, name = rel.partition("/")
+        if name != "spec.json":
+            continue
+        dna_bytes = files.get(f"{seed_id}/dna.json")
+        dna = json.loads(dna_bytes) if dna_bytes else {}
+        label = gen_id or dna.get("identity", {}).get("gen_id") or ""
+        generation = generation_number(label)
+        if generation is None:
+            raise ValueError(f"Cannot tell the generation of {seed_id} (label {label!r})")
+        spec = json.loads(files[rel])
+        # Identity differs per seed, so only the canonical hash finds the same spec again;
+        # DNA parent_hashes are digests of the raw bytes, and elite edges must match them.
+        spec_hash = spec_digest(spec)
+        raw_hash = sha256(files[rel]).hexdigest()
+        operator, op_params = _birth_op(dna)
+        individuals.append(
+            (
+                run,
+                generation,
+                seed_id,
+                label,
+                spec_hash,
+                spec.get("profile_id"),
+                operator,
+                op_params,
+                dna.get("rng_subseed"),
+                (dna.get("lineage") or {}).get("ref"),
+            )
+        )
+        parents = dna.get("parents") or []
+        hashes = dna.get("parent_hashes") or {}
+        for pos, pid in enumerate(parents):
+            edges.append((run, generation, seed_id, pos, pid, hashes.get(pid)))
+        if not parents and dna.get("elite_of"):
+            # Same spec bytes one generation back, under the seed id it had there.
+            edges.append((run, generation, seed_id, 0, dna["elite_of"], raw_hash))
+    return individuals, edges
+
+
+def fitness_rows(
+    payloads: Mapping[str, Mapping[str, Any]], generation: int, run: str = ""
+) -> List[FitnessRow]:
+    rows = []
+    for seed_id in sorted(payloads):
+        payload = payloads[seed_id]
+        values = [payload.get(c) for c in FITNESS_COLUMNS]
+        rows.append((run, generation, seed_id, *values, json.dumps(payload, sort_keys=True)))
+    return rows
+
+
+class LineageDB:
+    """
+    Connection to the lineage database at ``path``. Each ``add_*`` call is one
+    transaction; re-adding a generation replaces its rows.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections cannot cross processes; a worker reopens the same file.
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["path"])
+
+    def __enter__(self) -> "LineageDB":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def insert(
+        self,
+        individuals: Sequence[IndividualRow] = (),
+        edges: Sequence[EdgeRow] = (),
+        fitness: Sequence[FitnessRow] = (),
+    ) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO individuals VALUES (?,?,?,?,?,?,?,?,?,?)", individuals
+            )
+            keys = {(r[0], r[1], r[2]) for r in edges}
+            self._conn.executemany(
+                "DELETE FROM parents WHERE run=? AND generation=? AND seed_id=?", sorted(keys)
+            )
+            self._conn.executemany("INSERT OR REPLACE INTO parents VALUES (?,?,?,?,?,?)", edges)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fitness VALUES (?,?,?,?,?,?,?,?,?,?,?)", fitness
+            )
+
+    def add_generation(
+        self, files: Mapping[str, bytes], run: str = "", gen_id: Optional[str] = None
+    ) -> int:
+        """Index a rendered generation folder; returns the number of individuals."""
+        individuals, edges = generation_rows(files, run, gen_id)
+        self.insert(individuals, edges)
+        return len(individuals)
+
+    def add_results(
+        self,
+        results_root: AnyPath,
+        payloads: Mapping[str, Mapping[str, Any]],
+        run: str = "",
+        generation: Optional[int] = None,
+    ) -> int:
+        """
+        Index graded fitness payloads (seed_id -> fitness.json) of ``results_root``. The
+        generation defaults to the seeds' DNA identity, else the folder name.
+        """
+        if generation is None:
+            generation = results_generation(results_root)
+        self.insert(fitness=fitness_rows(payloads, generation, run))
+        return len(payloads)
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def ancestors(
+        self, generation: int, seed_id: str, run: str = "", max_depth: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        ``seed_id`` of ``generation`` and every recorded ancestor, with ``depth`` (0 for
+        the individual itself) and fitness where graded. Elite copies link to the seed
+        they were one generation back; roots end a walk.
+        """
+        sql = """
+        WITH RECURSIVE walk(run, generation, seed_id, depth) AS (
+            SELECT run, generation, seed_id, 0 FROM individuals
+            WHERE run = ? AND generation = ? AND seed_id = ?
+            UNION
+            SELECT p.run, p.generation, p.seed_id, a.depth + 1
+            FROM walk a
+            JOIN parents e
+              ON e.run = a.run AND e.generation = a.generation AND e.seed_id = a.seed_id
+            JOIN individuals p
+              ON p.run = e.run AND p.generation = e.generation - 1
+             AND p.seed_id = e.parent_seed_id
+            WHERE ? IS NULL OR a.depth < ?
+        ),
+        anc AS (
+            SELECT run, generation, seed_id, MIN(depth) AS depth
+            FROM walk GROUP BY run, generation, seed_id
+        )
+        SELECT a.depth, i.*, f.fitness_score
+        FROM anc a
+        JOIN individuals i USING (run, generation, seed_id)
+        LEFT JOIN fitness f USING (run, generation, seed_id)
+        ORDER BY a.depth, i.generation DESC, i.seed_id
+        """
+        return self.query(sql, (run, generation, seed_id, max_depth, max_depth))
+
+    def operator_efficacy(self, run: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per producing operator: graded children, mean and best fitness."""
+        sql = """
+        SELECT i.operator AS operator, COUNT(*) AS children,
+               AVG(f.fitness_score) AS mean_fitness, MAX(f.fitness_score) AS best_fitness
+        FROM individuals i
+        JOIN fitness f USING (run, generation, seed_id)
+        WHERE ? IS NULL OR i.run = ?
+        GROUP BY i.operator
+        ORDER BY i.operator
+        """
+        return self.query(sql, (run, run))
+
+
+def read_folder_files(root: AnyPath) -> Dict[str, bytes]:
+    """spec.json/dna.json of every ``seed_*`` plus the manifest, keyed as rendered."""
+    files: Dict[str, bytes] = {}
+    manifest = root / "population_manifest.json"
+    if manifest.exists():
+        files["population_manifest.json"] = manifest.read_bytes()
+    for seed_dir in sorted(root.iterdir(), key=lambda p: p.name):
+        if not (seed_dir.is_dir() and seed_dir.name.startswith("seed_")):
+            continue
+        for name in ("spec.json", "dna.json"):
+            path = seed_dir / name
+            if path.exists():
+                files[f"{seed_dir.name}/{name}"] = path.read_bytes()
+    return files
+
+
+def read_fitness_payloads(results_root: AnyPath) -> Dict[str, Dict[str, Any]]:
+    run_dir = results_root / "run"
+    payloads: Dict[str, Dict[str, Any]] = {}
+    if not run_dir.exists():
+        return payloads
+    for seed_dir in run_dir.iterdir():
+        path = seed_dir / "fitness.json"
+        if seed_dir.name.startswith("seed_") and path.exists():
+            payloads[seed_dir.name] = json.loads(path.read_text(encoding="utf-8"))
+    return payloads
+
+
+def results_generation(results_root: AnyPath) -> int:
+    for seed_dir in sorted(results_root.iterdir(), key=lambda p: p.name):
+        dna = seed_dir / "dna.json"
+        if seed_dir.name.startswith("seed_") and dna.exists():
+            label = json.loads(dna.read_text(encoding="utf-8")).get("identity", {}).get("gen_id")
+            if label and generation_number(label) is not None:
+                return generation_number(label)
+    name = Path(str(results_root)).stem if isinstance(results_root, zipfile.Path) else ""
+    for label in (results_root.name, name):
+        if generation_number(label) is not None:
+            return generation_number(label)
+    raise ValueError(f"Cannot tell which generation {results_root} holds")
+
+
+def _parse_source(source: Path, run: str) -> Tuple[List[IndividualRow], List[EdgeRow], List]:
+    root: AnyPath = open_bundle_root(source) if source.suffix == ".zip" else source
+    try:
+        files = read_folder_files(root)
+        individuals: List[IndividualRow] = []
+        edges: List[EdgeRow] = []
+        if any(rel.endswith("/spec.json") for rel in files):
+            try:
+                individuals, edges = generation_rows(files, run)
+            except ValueError:
+                # Unlabelled seeds (e.g. a hand-made g0): fall back to the folder name.
+                label = f"g{results_generation(root)}"
+                individuals, edges = generation_rows(files, run, label)
+        payloads = read_fitness_payloads(root)
+        fitness = fitness_rows(payloads, results_generation(root), run) if payloads else []
+        return individuals, edges, fitness
+    finally:
+        if isinstance(root, zipfile.Path):
+            root.root.close()
+
+
+def discover_sources(root: Path) -> List[Path]:
+    """Generation folders, results roots and bundles (.zip) under ``root``."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        here = Path(dirpath)
+        if "run" in dirnames or any((here / d / "spec.json").exists() for d in dirnames):
+            found.append(here)
+        found.extend(here / f for f in filenames if f.endswith(".zip"))
+        # Never descend into seed or run folders: journals can be huge.
+        dirnames[:] = sorted(d for d in dirnames if d != "run" and not d.startswith("seed_"))
+    return sorted(found)
+
+
+def import_tree(
+    db: LineageDB,
+    roots: Iterable[Path],
+    run: str = "",
+    workers: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Back-fill ``db`` from every source ``discover_sources`` finds under ``roots``. Sources
+    are parsed in a process pool; rows are inserted in one transaction. Returns counts.
+    """
+    sources = [s for root in roots for s in discover_sources(Path(root))]
+    workers = min(workers or os.cpu_count() or 1, max(len(sources), 1))
+    if workers == 1:
+        parsed = [_parse_source(s, run) for s in sources]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_source, sources, [run] * len(sources)))
+    individuals = [row for rows, _, _ in parsed for row in rows]
+    edges = [row for _, rows, _ in parsed for row in rows]
+    fitness = [row for _, _, rows in parsed for row in rows]
+    db.insert(individuals, edges, fitness)
+    return {
+        "sources": len(sources),
+        "individuals": len(individuals),
+        "edges": len(edges),
+        "fitness": len(fitness),
+    }
@@ -1,16 +1,34 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+
+from . import columnar
+
+# Typed layout for journal columns loaded as arrays; other columns load as float64.
+# hand_id is factorized to int64 codes in order of first appearance.
+JOURNAL_DTYPES: Dict[str, str] = {
+    "bankroll_after": "float64",
+    "hand_id": "int64",
+    "pso_flag": "bool",
+}
+SIDECAR_NAME = "journal.evcol"
+
+
+# Every reader takes a run directory as ``pathlib.Path`` or ``zipfile.Path`` (see
+# ``evo.io.bundles.open_bundle_root``), so bundles can be graded without extraction.
 
 
 def read_report_json(run_dir: Path) -> Dict[str, Any]:
     """Read report.json if available; return dict or empty."""
     report_path = run_dir / "report.json"
     if report_path.exists():
-        with open(report_path, "r", encoding="utf-8") as f:
+        with report_path.open("r", encoding="utf-8") as f:
             return json.load(f)
     return {}
 
@@ -20,7 +38,243 @@ def read_journal_csv(run_dir: Path) -> list[Dict[str, Any]]:
     journal_path = run_dir / "journal.csv"
     rows: list[Dict[str, Any]] = []
     if journal_path.exists():
-        with open(journal_path, newline="", encoding="utf-8") as f:
+        with journal_path.open("r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             rows = [r for r in reader]
     return rows
+
+
+def iter_journal_columns(
+    run_dir: Path,
+    columns: Sequence[str],
+    defaults: Optional[Mapping[str, Any]] = None,
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Stream journal.csv rows projected onto ``columns`` (one tuple per roll).
+
+    Columns absent from the header yield ``defaults.get(name)``; short rows yield None,
+    mirroring ``csv.DictReader`` + ``row.get(name, default)``. Yields nothing if missing.
+    """
+    journal_path = run_dir / "journal.csv"
+    if not journal_path.exists():
+        return
+    with journal_path.open("r", newline="", encoding="utf-8") as f:
+        yield from _project_rows(csv.reader(f), columns, defaults or {})
+
+
+def _project_rows(
+    reader: Iterator[list[str]],
+    columns: Sequence[str],
+    defaults: Mapping[str, Any],
+    header: Optional[Sequence[str]] = None,
+) -> Iterator[tuple[Any, ...]]:
+    if header is None:
+        header = next(reader, None)
+        if header is None:
+            return
+    index = {name: i for i, name in enumerate(header)}
+    picks = [index.get(name) for name in columns]
+    fills = tuple(defaults.get(name) for name in columns)
+    width = len(header)
+    for raw in reader:
+        if not raw:
+            continue
+        if len(raw) >= width:
+            yield tuple(raw[i] if i is not None else fill for i, fill in zip(picks, fills))
+        else:
+            yield tuple(
+                (raw[i] if i < len(raw) else None) if i is not None else fill
+                for i, fill in zip(picks, fills)
+            )
+
+
+def split_journal_ranges(
+    journal_path: Path, chunk_bytes: int
+) -> tuple[list[str], list[tuple[int, int]]]:
+    """
+    Return (header, byte ranges) covering the data rows of a journal.
+
+    Ranges are roughly ``chunk_bytes`` long and each ends just after a newline, so every
+    range holds whole rows. Assumes no quoted newlines (journals are numeric).
+    """
+    size = journal_path.stat().st_size
+    with open(journal_path, "rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode("utf-8")]), [])
+        bounds = [f.tell()]
+        while bounds[-1] < size:
+            f.seek(min(bounds[-1] + max(int(chunk_bytes), 1), size))
+            if f.tell() < size:
+                f.readline()
+            bounds.append(f.tell())
+    return header, list(zip(bounds[:-1], bounds[1:]))
+
+
+def iter_journal_range(
+    journal_path: Path,
+    start: int,
+    end: int,
+    header: Sequence[str],
+    columns: Sequence[str],
+    defaults: Optional[Mapping[str, Any]] = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Projected rows for the bytes [start, end) of a journal; see ``split_journal_ranges``."""
+    with open(journal_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""))
+    yield from _project_rows(reader, columns, defaults or {}, header=header)
+
+
+def _float_or_nan(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _factorize(values: np.ndarray) -> np.ndarray:
+    """int64 codes in order of first appearance (np.unique sorts, so re-rank by first index)."""
+    if not values.size:
+        return np.empty(0, dtype=np.int64)
+    uniq, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+    rank = np.empty(len(uniq), dtype=np.int64)
+    rank[np.argsort(first, kind="stable")] = np.arange(len(uniq))
+    return rank[inverse.reshape(-1)]
+
+
+# loadtxt field types: bool flags are compared to "1" as text (8 chars never truncate to
+# "1"); hand ids must be integers here, anything else takes the csv path.
+_LOADTXT_TYPES = {"float64": "f8", "int64": "i8", "bool": "U8"}
+
+
+def _loadtxt_columns(journal_path: Path, columns: Sequence[str]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Parse ``columns`` in C with ``np.loadtxt``; None when the journal is not plain numeric
+    CSV (missing columns, short rows, unparseable values), so the caller falls back.
+    """
+    with journal_path.open("r", newline="", encoding="utf-8") as f:
+        header = next(csv.reader([f.readline()]), [])
+        body = f.read()
+    index = {name: i for i, name in enumerate(header)}
+    if not all(name in index for name in columns) or len(set(columns)) < len(columns):
+        return None
+    dtypes = [JOURNAL_DTYPES.get(name, "float64") for name in columns]
+    if not body.strip():
+        return {name: np.empty(0, dtype=dtype) for name, dtype in zip(columns, dtypes)}
+    try:
+        table = np.loadtxt(
+            io.StringIO(body),
+            delimiter=",",
+            usecols=[index[name] for name in columns],
+            dtype=[(name, _LOADTXT_TYPES[dtype]) for name, dtype in zip(columns, dtypes)],
+            comments=None,
+            quotechar='"',
+            ndmin=1,
+        )
+    except ValueError:
+        return None
+    out: Dict[str, np.ndarray] = {}
+    for name, dtype in zip(columns, dtypes):
+        col = table[name]
+        if dtype == "bool":
+            out[name] = col == "1"
+        elif dtype == "int64":
+            out[name] = _factorize(col)
+        else:
+            out[name] = np.ascontiguousarray(col)
+    return out
+
+
+def _column_array(name: str, values: Sequence[Any]) -> np.ndarray:
+    """Convert one projected column (strings, defaults or None) to its typed array."""
+    dtype = JOURNAL_DTYPES.get(name, "float64")
+    if dtype == "bool":
+        return np.asarray([v == "1" for v in values], dtype=bool)
+    if dtype == "int64":
+        # Short rows yield None; keep them apart from any real id.
+        return _factorize(np.asarray(["\0<missing>" if v is None else str(v) for v in values]))
+    return np.fromiter((_float_or_nan(v) for v in values), np.float64, len(values))
+
+
+def read_journal_arrays(
+    run_dir: Path,
+    columns: Sequence[str],
+    defaults: Optional[Mapping[str, Any]] = None,
+    prefer_sidecar: bool = True,
+) -> Dict[str, np.ndarray]:
+    """
+    Load ``columns`` of journal.csv as typed NumPy arrays, parsed in bulk by ``np.loadtxt``
+    (journals with missing columns, short rows or unparseable values take a csv pass).
+
+    Unparseable floats become NaN; see ``JOURNAL_DTYPES`` for per-column types.
+    A fresh ``journal.evcol`` sidecar holding every requested column is memory-mapped
+    instead of parsing the CSV.
+    """
+    if prefer_sidecar:
+        mapped = read_journal_sidecar(run_dir, columns)
+        if mapped is not None:
+            return mapped
+    return _parse_journal_arrays(run_dir, columns, defaults)
+
+
+def _parse_journal_arrays(
+    run_dir: Path,
+    columns: Sequence[str],
+    defaults: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, np.ndarray]:
+    journal_path = run_dir / "journal.csv"
+    if journal_path.exists():
+        fast = _loadtxt_columns(journal_path, columns)
+        if fast is not None:
+            return fast
+    rows = list(iter_journal_columns(run_dir, columns, defaults))
+    cols = list(zip(*rows)) if rows else [()] * len(columns)
+    return {name: _column_array(name, values) for name, values in zip(columns, cols)}
+
+
+def _journal_header(journal_path: Path) -> list[str]:
+    with journal_path.open("r", newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def write_journal_sidecar(run_dir: Path, columns: Optional[Sequence[str]] = None) -> Optional[Path]:
+    """
+    Convert journal.csv once into ``journal.evcol`` beside it; return its path.
+
+    Defaults to the ``JOURNAL_DTYPES`` columns present in the header. Returns None when
+    there is no journal.
+    """
+    journal_path = run_dir / "journal.csv"
+    if not journal_path.exists():
+        return None
+    stamp = columnar.source_stamp(journal_path)
+    header = _journal_header(journal_path)
+    if columns is None:
+        columns = [name for name in JOURNAL_DTYPES if name in header]
+    else:
+        columns = [name for name in columns if name in header]
+    arrays = _parse_journal_arrays(run_dir, columns)
+    return columnar.write_columns(run_dir / SIDECAR_NAME, arrays, source=stamp)
+
+
+def read_journal_sidecar(run_dir: Path, columns: Sequence[str]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Memory-map ``columns`` from a sidecar that is fresh (journal size and mtime unchanged)
+    and holds all of them; otherwise None. Bundle members (zipfile.Path) never match.
+    """
+    if not isinstance(run_dir, Path):
+        return None
+    sidecar = run_dir / SIDECAR_NAME
+    journal_path = run_dir / "journal.csv"
+    if not (sidecar.exists() and journal_path.exists()):
+        return None
+    try:
+        header, arrays = columnar.read_columns(sidecar)
+    except (ValueError, OSError):
+        return None
+    if header.get("source") != columnar.source_stamp(journal_path):
+        return None
+    if not all(name in arrays for name in columns):
+        return None
+    return {name: arrays[name] for name in columns}
@@ -0,0 +1,245 @@
+"""
+Island-model evolution: N sub-populations in separate processes with periodic migration.
+
+Each island runs its own ``Evolution`` (and so its own ``EvolutionContext``), bundles and
+submits every generation to CSC on its own, and every ``interval`` generations sends its
+top ``migrants`` to its neighbours in the migration topology. Island folders live under
+``out_root/island_NN/gNNN``; manifests carry an ``island`` block (id and the migration
+that preceded the generation) and DNA identities an ``island`` id. Migrants are renamed
+``islandNN_<gen>_<seed_id>``, which is what offspring record as their ``parents``.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from multiprocessing import Manager
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from .evolver import load_population
+from .interop.evaluator import BundleEvaluator, evaluate_folder
+from .io.eval_memo import MemoOptions
+from .population import Individual
+from .rng import make_subseed
+from .runner import Evolution, read_spec_bytes
+
+Topology = Union[str, Mapping[int, Sequence[int]]]
+
+TOPOLOGIES = ("ring", "full", "none")
+
+
+@dataclass
+class IslandReport:
+    island_id: int
+    generations: List[str] = field(default_factory=list)
+    best_fitness: List[float] = field(default_factory=list)
+    migrations: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def migration_targets(n_islands: int, topology: Topology) -> Dict[int, List[int]]:
+    """Island -> islands it sends migrants to. ``ring`` is i -> i+1; ``full`` is all-to-all."""
+    if not isinstance(topology, str):
+        targets = {i: sorted(int(t) for t in topology.get(i, ())) for i in range(n_islands)}
+        for src, dsts in targets.items():
+            if any(d == src or not 0 <= d < n_islands for d in dsts):
+                raise ValueError(f"Invalid migration targets for island {src}: {dsts}")
+        return targets
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown migration topology {topology!r}")
+    if topology == "none" or n_islands < 2:
+        return {i: [] for i in range(n_islands)}
+    if topology == "ring":
+        return {i: [(i + 1) % n_islands] for i in range(n_islands)}
+    return {i: [j for j in range(n_islands) if j != i] for i in range(n_islands)}
+
+
+def split_population(population: Sequence[Individual], n_islands: int) -> List[List[Individual]]:
+    """Deal individuals (in seed-id order) round-robin onto ``n_islands`` islands."""
+    ordered = sorted(population, key=lambda ind: ind.seed_id)
+    return [ordered[k::n_islands] for k in range(n_islands)]
+
+
+def _as_migrant(src: int, label: str, ind: Individual, data: bytes) -> tuple[Individual, bytes]:
+    # The id names the origin, so offspring DNA ``parents`` trace back across islands.
+    migrant = ind.clone()
+    migrant.seed_id = f"island{src:02d}_{label}_{ind.seed_id}"
+    return migrant, data
+
+
+def _receive(
+    inbox: Any, sources: List[int], label: str, wait: bool, timeout_s: float
+) -> List[tuple[int, str, list]]:
+    messages = []
+    if wait:
+        pending = set(sources)
+        while pending:
+            try:
+                msg = inbox.get(timeout=timeout_s)
+            except queue.Empty:
+                raise RuntimeError(f"No migrants from islands {sorted(pending)} for {label}")
+            messages.append(msg)
+            if msg[1] == label:
+                pending.discard(msg[0])
+    else:
+        while True:
+            try:
+                messages.append(inbox.get_nowait())
+            except queue.Empty:
+                break
+    return sorted(messages, key=lambda m: (int(m[1].strip("g") or "0"), m[0]))
+
+
+def _run_island(
+    island_id: int,
+    population: List[Individual],
+    spec_bytes: Dict[str, bytes],
+    out_dir: Path,
+    gen_id: str,
+    root_seed: int,
+    generations: int,
+    evaluate: BundleEvaluator,
+    inboxes: List[Any],
+    sources: List[int],
+    targets: List[int],
+    interval: int,
+    migrants: int,
+    wait_migrants: bool,
+    migration_timeout_s: float,
+    evolve_kwargs: Dict[str, Any],
+    memo: Optional[MemoOptions] = None,
+) -> IslandReport:
+    report = IslandReport(island_id=island_id)
+    migration: Optional[Dict[str, Any]] = None
+    seed = make_subseed(f"island:{island_id}", root_seed)
+    evo = Evolution(population, out_dir, gen_id, seed, spec_bytes=spec_bytes, **evolve_kwargs)
+    with evo:
+        for step in range(generations):
+            manifest_extra = {"island": {"id": island_id, "migration_in": migration}}
+            evo.step(manifest_extra=manifest_extra, identity_extra={"island": island_id})
+            evo.flush()
+            label = evo.gen_id
+            results_root = evaluate_folder(
+                evaluate,
+                evo.generation_dir(),
+                out_dir / "bundles" / label / f"{label}.zip",
+                label,
+                job_label=f"island{island_id:02d}_{label}",
+                memo=memo,
+            )
+            evo.load_fitness(results_root)
+            report.generations.append(label)
+            report.best_fitness.append(max(ind.fitness for ind in evo.population))
+
+            migration = None
+            if (step + 1) % interval or step + 1 == generations:
+                continue
+            for dst in targets:
+                inboxes[dst].put((island_id, label, evo.top(migrants)))
+            if not sources:
+                continue
+            incoming: List[tuple[Individual, bytes]] = []
+            arrivals = []
+            for src, src_label, batch in _receive(
+                inboxes[island_id], sources, label, wait_migrants, migration_timeout_s
+            ):
+                moved = [_as_migrant(src, src_label, ind, data) for ind, data in batch]
+                incoming.extend(moved)
+                arrivals.append(
+                    {
+                        "from_island": src,
+                        "from_gen": src_label,
+                        "seed_ids": [m.seed_id for m, _ in moved],
+                    }
+                )
+            if incoming:
+                incoming = incoming[: max(0, len(evo.population) - 1)]
+                replaced = evo.immigrate(incoming)
+                migration = {"at_gen": label, "arrivals": arrivals, "replaced": replaced}
+                report.migrations.append(migration)
+    return report
+
+
+def run_islands(
+    results_root: Path,
+    out_root: Path,
+    gen_id: str,
+    root_seed: int,
+    n_islands: int,
+    generations: int,
+    evaluate: BundleEvaluator,
+    topology: Topology = "ring",
+    interval: int = 1,
+    migrants: int = 1,
+    wait_migrants: bool = False,
+    migration_timeout_s: float = 3600.0,
+    memo: Optional[MemoOptions] = None,
+    **evolve_kwargs: Any,
+) -> List[IslandReport]:
+    """
+    Split a scored generation into ``n_islands`` islands and evolve each for
+    ``generations`` steps in its own process. ``evaluate`` must be picklable (see
+    ``evo.interop.evaluator.LaneEvaluator``). With ``wait_migrants`` an island blocks at
+    each migration until its sources have sent, making runs replayable; otherwise it takes
+    whatever has arrived.
+    ``evolve_kwargs`` go to ``Evolution`` (pop_size is per island). With ``memo`` islands
+    share one evaluation memo and submit only specs it cannot answer; several islands claim
+    keys before submitting (see ``evo.io.eval_memo``). Writes ``out_root/islands.json``.
+    """
+    if n_islands < 1 or generations < 1 or interval < 1:
+        raise ValueError("n_islands, generations and interval must be >= 1")
+    targets = migration_targets(n_islands, topology)
+    sources = {i: sorted(s for s, dsts in targets.items() if i in dsts) for i in targets}
+    population = load_population(results_root, generation=int(gen_id.strip("g") or "0"))
+    spec_bytes = read_spec_bytes(results_root, population)
+    islands = split_population(population, n_islands)
+    if any(not members for members in islands):
+        raise ValueError(f"{len(population)} seeds cannot fill {n_islands} islands")
+    if memo is not None and n_islands > 1:
+        memo = replace(memo, claim=True)
+        memo.open().clear_claims()
+    with Manager() as manager:
+        inboxes = [manager.Queue() for _ in range(n_islands)]
+        with ProcessPoolExecutor(max_workers=n_islands) as pool:
+            futures = [
+                pool.submit(
+                    _run_island,
+                    k,
+                    members,
+                    {
+                        ind.seed_id: spec_bytes[ind.seed_id]
+                        for ind in members
+                        if ind.seed_id in spec_bytes
+                    },
+                    out_root / f"island_{k:02d}",
+                    gen_id,
+                    root_seed,
+                    generations,
+                    evaluate,
+                    inboxes,
+                    sources[k],
+                    targets[k],
+                    interval,
+                    migrants,
+                    wait_migrants,
+                    migration_timeout_s,
+                    evolve_kwargs,
+                    memo,
+                )
+                for k, members in enumerate(islands)
+            ]
+            reports = [f.result() for f in futures]
+    summary = {
+        "n_islands": n_islands,
+        "topology": topology if isinstance(topology, str) else "custom",
+        "targets": {str(k): v for k, v in targets.items()},
+        "interval": interval,
+        "migrants": migrants,
+        "wait_migrants": wait_migrants,
+        "islands": [asdict(r) for r in reports],
+    }
+    out_root.mkdir(parents=True, exist_ok=True)
+    (out_root / "islands.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return reports
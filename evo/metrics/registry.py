@@ -1,15 +1,62 @@
 from __future__ import annotations
 
-from typing import Callable, Dict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
 
 _METRICS: Dict[str, Callable[..., float]] = {}
+_ARRAY_METRICS: Dict[str, "ArrayMetric"] = {}
+_INTERMEDIATES: Dict[str, "ArrayMetric"] = {}
 
 
-def register(name: str):
-    """Decorator to register a metric function."""
+@dataclass(frozen=True)
+class ArrayMetric:
+    """
+    Array-native node: ``fn`` receives one keyword argument per entry of ``requires``.
+
+    A requirement names a registered intermediate, another array metric, or (otherwise)
+    a journal column loaded as a NumPy array.
+    """
+
+    name: str
+    fn: Callable[..., Any]
+    requires: tuple[str, ...]
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(dep for dep in self.requires if _node(dep) is None)
+
+    def __call__(self, values: Mapping[str, Any]) -> Any:
+        return self.fn(**{dep: values[dep] for dep in self.requires})
+
+
+def register(
+    name: str,
+    columns: Optional[Sequence[str]] = None,
+    requires: Optional[Sequence[str]] = None,
+):
+    """
+    Decorator to register a metric function.
+
+    With ``columns`` or ``requires`` the function is registered as the array-native variant
+    of ``name``; it is called with keyword arguments named after those dependencies.
+    """
 
     def _wrap(fn: Callable[..., float]):
-        _METRICS[name] = fn
+        if columns is None and requires is None:
+            _METRICS[name] = fn
+        else:
+            deps = tuple(requires if requires is not None else columns)
+            _ARRAY_METRICS[name] = ArrayMetric(name=name, fn=fn, requires=deps)
+        return fn
+
+    return _wrap
+
+
+def intermediate(name: str, requires: Sequence[str]):
+    """Decorator for a shared intermediate (e.g. bankroll series) that metrics can require."""
+
+    def _wrap(fn: Callable[..., Any]):
+        _INTERMEDIATES[name] = ArrayMetric(name=name, fn=fn, requires=tuple(requires))
         return fn
 
     return _wrap
@@ -19,5 +66,66 @@ def get(name: str) -> Callable[..., float]:
     return _METRICS[name]
 
 
+def get_array(name: str) -> Optional[ArrayMetric]:
+    """
+    Return the array-native variant of ``name`` if one is registered; call it with a mapping
+    of its requirements, or use ``evaluate``.
+    """
+    return _ARRAY_METRICS.get(name)
+
+
 def all_metrics() -> Dict[str, Callable[..., float]]:
     return dict(_METRICS)
+
+
+def _node(name: str) -> Optional[ArrayMetric]:
+    return _INTERMEDIATES.get(name) or _ARRAY_METRICS.get(name)
+
+
+def plan(names: Iterable[str]) -> List[ArrayMetric]:
+    """
+    Dependency-ordered nodes needed for ``names``; each appears once however many
+    metrics share it. Raises KeyError for unknown names and ValueError on cycles.
+    """
+    order: List[ArrayMetric] = []
+    state: Dict[str, str] = {}
+
+    def _visit(name: str, top: bool) -> None:
+        node = _node(name)
+        if node is None:
+            if top:
+                raise KeyError(f"No array-native metric or intermediate named {name!r}")
+            return
+        mark = state.get(name)
+        if mark == "done":
+            return
+        if mark == "active":
+            raise ValueError(f"Metric dependency cycle through {name!r}")
+        state[name] = "active"
+        for dep in node.requires:
+            _visit(dep, False)
+        state[name] = "done"
+        order.append(node)
+
+    for name in names:
+        _visit(name, True)
+    return order
+
+
+def columns_for(names: Iterable[str]) -> tuple[str, ...]:
+    """Journal columns needed (directly or via intermediates) by ``names``, first-seen order."""
+    seen: Dict[str, None] = {}
+    for node in plan(names):
+        seen.update(dict.fromkeys(node.columns))
+    return tuple(seen)
+
+
+def evaluate(names: Sequence[str], arrays: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Evaluate metrics/intermediates ``names`` against preloaded column arrays, materializing
+    every shared intermediate exactly once in dependency order.
+    """
+    values: Dict[str, Any] = dict(arrays)
+    for node in plan(names):
+        values[node.name] = node(values)
+    return {name: values[name] for name in names}
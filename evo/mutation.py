@@ -1,23 +1,29 @@
 from __future__ import annotations
 
-import copy
 import random
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .policy.adaptive import ADAPTIVE
+from .context import GLOBAL_CONTEXT, EvolutionContext
 from .population import Individual
 
 _NUMERIC_FIELDS = ("place_6_8", "place_5_9", "odds_multiple", "regress_pct")
 
 
-def mutate_spec(spec: Dict[str, Any], nudge_frac: float = 0.1) -> Dict[str, Any]:
-    """Return a mutated copy of spec.params/toggles (small safe nudges)."""
-    s = copy.deepcopy(spec)
-    params = s.get("params", {})
+def mutate_spec(
+    spec: Dict[str, Any], nudge_frac: float = 0.1, rng: Optional[random.Random] = None
+) -> Dict[str, Any]:
+    """
+    Return a mutated copy of spec.params/toggles (small safe nudges).
+    Only the top level and ``params`` are copied; other blocks are shared with ``spec``.
+    Draws from ``rng`` (default: the global ``random`` state).
+    """
+    rng = rng or random
+    s = dict(spec)
+    params = dict(s.get("params", {}))
     for key in _NUMERIC_FIELDS:
         if key in params and isinstance(params[key], (int, float)):
             base = float(params[key])
-            delta = base * nudge_frac * (random.random() * 2 - 1)
+            delta = base * nudge_frac * (rng.random() * 2 - 1)
             new_val = base + delta
             if key in ("place_6_8",):
                 new_val = round(new_val / 6) * 6
@@ -28,53 +34,83 @@ def mutate_spec(spec: Dict[str, Any], nudge_frac: float = 0.1) -> Dict[str, Any]
             if key == "regress_pct":
                 new_val = min(1.0, max(0.0, new_val))
             params[key] = type(params[key])(new_val)
-    s["params"] = params
+    if "params" in s:
+        # Nothing to nudge without a params block; adding {} would change the memo key.
+        s["params"] = params
     return s
 
 
-def crossover_specs(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
-    """Block-wise crossover: pick params from parent A or B, toggles likewise."""
+def crossover_specs(
+    a: Dict[str, Any], b: Dict[str, Any], rng: Optional[random.Random] = None
+) -> Dict[str, Any]:
+    """
+    Block-wise crossover: pick params from parent A or B, toggles likewise.
+    Keys are visited in A-then-B order, so the result depends only on ``rng``.
+    """
+    rng = rng or random
     child = {"schema_version": a.get("schema_version", "1.0")}
-    child["profile_id"] = random.choice([a.get("profile_id"), b.get("profile_id")])
+    child["profile_id"] = rng.choice([a.get("profile_id"), b.get("profile_id")])
     child_params: Dict[str, Any] = {}
-    for k in set(a.get("params", {})) | set(b.get("params", {})):
+    for k in _key_union(a.get("params", {}), b.get("params", {})):
         pool = []
         if k in a.get("params", {}):
             pool.append(a["params"][k])
         if k in b.get("params", {}):
             pool.append(b["params"][k])
-        child_params[k] = random.choice(pool) if pool else None
+        child_params[k] = rng.choice(pool) if pool else None
     child["params"] = child_params
     child_toggles: Dict[str, Any] = {}
-    for k in set(a.get("toggles", {})) | set(b.get("toggles", {})):
+    for k in _key_union(a.get("toggles", {}), b.get("toggles", {})):
         pool = []
         if k in a.get("toggles", {}):
             pool.append(a["toggles"][k])
         if k in b.get("toggles", {}):
             pool.append(b["toggles"][k])
-        child_toggles[k] = random.choice(pool) if pool else False
+        child_toggles[k] = rng.choice(pool) if pool else False
     child["toggles"] = child_toggles
     return child
 
 
-def record_op(dna: Dict[str, Any], op: str) -> None:
+def _key_union(a: Dict[str, Any], b: Dict[str, Any]) -> list[str]:
+    # Not a set: set order of str keys varies with PYTHONHASHSEED (and so across processes).
+    return list(dict.fromkeys([*a, *b]))
+
+
+def record_op(dna: Dict[str, Any], op: str) -> Dict[str, Any]:
+    """Return a copy of ``dna`` with ``op`` appended to its ops_log (``dna`` is left as is)."""
     # keep legacy strings for backward compat; evolver will add structured entries later
-    dna.setdefault("ops_log", []).append(op)
+    out = dict(dna)
+    out["ops_log"] = list(dna.get("ops_log", [])) + [op]
+    return out
 
 
-def mutate_individual(ind: Individual, nudge_frac: float = 0.1) -> Individual:
+def mutate_individual(
+    ind: Individual,
+    nudge_frac: float = 0.1,
+    rng: Optional[random.Random] = None,
+    mode: Optional[str] = None,
+    context: Optional[EvolutionContext] = None,
+) -> Individual:
+    """
+    Mutant of ``ind``; ``mode`` defaults to the adaptive mode of ``context`` (or of
+    ``GLOBAL_CONTEXT``). WILDCARD mode nudges 2.5x harder.
+    """
+    if mode is None:
+        mode = (GLOBAL_CONTEXT if context is None else context).adaptive.mode
     child = ind.clone()
-    actual_nudge = nudge_frac * 2.5 if ADAPTIVE.mode == "WILDCARD" else nudge_frac
-    child.spec = mutate_spec(child.spec, nudge_frac=actual_nudge)
+    actual_nudge = nudge_frac * 2.5 if mode == "WILDCARD" else nudge_frac
+    child.spec = mutate_spec(child.spec, nudge_frac=actual_nudge, rng=rng)
     child.parents = [ind.seed_id]
-    record_op(child.dna, f"mutate(nudge={actual_nudge})")
+    child.dna = record_op(child.dna, f"mutate(nudge={actual_nudge})")
     return child
 
 
-def crossover_individuals(a: Individual, b: Individual) -> Individual:
+def crossover_individuals(
+    a: Individual, b: Individual, rng: Optional[random.Random] = None
+) -> Individual:
     child = a.clone()
-    child.spec = crossover_specs(a.spec, b.spec)
+    child.spec = crossover_specs(a.spec, b.spec, rng=rng)
     # Ensure unique, ordered parent list (in case selection picked same twice)
     child.parents = list(dict.fromkeys([a.seed_id, b.seed_id]))
-    record_op(child.dna, "crossover(blocks)")
+    child.dna = record_op(child.dna, "crossover(blocks)")
     return child
@@ -1,31 +1,149 @@
 from __future__ import annotations
 
-import copy
+import hashlib
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 
 
-@dataclass
+def canonical_spec_hash(spec: Dict[str, Any]) -> str:
+    """SHA-1 of the canonical (sorted-keys) JSON of ``spec``: ``Individual.spec_hash``."""
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def numeric_fields(payload: Mapping[str, Any]) -> Dict[str, float]:
+    """The JSON numbers of a fitness payload as floats (bools are not numbers here)."""
+    return {
+        k: float(v)
+        for k, v in payload.items()
+        if isinstance(v, (int, float)) and not isinstance(v, bool)
+    }
+
+
+@dataclass(slots=True)
 class Individual:
+    """
+    One candidate. ``spec`` and ``dna`` are copy-on-write: clones share them with the
+    parent, so never mutate them in place -- assign a new dict (copying only the levels
+    you change) instead.
+    """
+
     seed_id: str
     generation: int
     spec: Dict[str, Any]
     dna: Dict[str, Any]
     fitness: float
     parents: list[str] = field(default_factory=list)
+    # Numeric fitness.json fields (roi, drawdown_max, pso_rate, ...) for multi-objective use.
+    metrics: Dict[str, float] = field(default_factory=dict)
+    _hashed: Optional[tuple[Dict[str, Any], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def clone(self) -> "Individual":
         return Individual(
             seed_id=self.seed_id,
             generation=self.generation,
-            spec=copy.deepcopy(self.spec),
-            dna=copy.deepcopy(self.dna),
+            spec=self.spec,
+            dna=self.dna,
             fitness=self.fitness,
             parents=list(self.parents),
+            metrics=self.metrics,
+        )
+
+    @property
+    def spec_hash(self) -> str:
+        """SHA-1 of the canonical (sorted-keys) spec JSON, cached until ``spec`` is replaced."""
+        if self._hashed is None or self._hashed[0] is not self.spec:
+            self._hashed = (self.spec, canonical_spec_hash(self.spec))
+        return self._hashed[1]
+
+
+_SPEC_SLOT = Individual.__dict__["spec"]
+_DNA_SLOT = Individual.__dict__["dna"]
+_LEGACY_DNA = {"evo_schema_version": "0.1"}
+
+
+class LazyIndividual(Individual):
+    """
+    Individual known by its fitness alone until ``spec`` or ``dna`` is read, at which point
+    ``seed_dir/spec.json`` / ``dna.json`` are loaded. ``spec_hash`` comes from the fitness
+    index when it carries one; otherwise an unloaded spec is read once without being kept.
+    Clones are plain, fully loaded ``Individual``s.
+    """
+
+    __slots__ = ("_seed_dir", "_lazy_hash")
+
+    def __init__(
+        self,
+        seed_id: str,
+        generation: int,
+        seed_dir: Path,
+        fitness: float,
+        metrics: Optional[Dict[str, float]] = None,
+        spec_hash: Optional[str] = None,
+    ) -> None:
+        self._seed_dir = seed_dir
+        self._lazy_hash = spec_hash
+        Individual.__init__(
+            self, seed_id, generation, None, None, fitness, metrics=dict(metrics or {})
         )
 
+    def _get_spec(self) -> Dict[str, Any]:
+        spec = _SPEC_SLOT.__get__(self)
+        if spec is None:
+            spec = json.loads((self._seed_dir / "spec.json").read_text())
+            _SPEC_SLOT.__set__(self, spec)
+        return spec
+
+    def _get_dna(self) -> Dict[str, Any]:
+        dna = _DNA_SLOT.__get__(self)
+        if dna is None:
+            path = self._seed_dir / "dna.json"
+            dna = json.loads(path.read_text()) if path.exists() else dict(_LEGACY_DNA)
+            _DNA_SLOT.__set__(self, dna)
+        return dna
+
+    spec = property(_get_spec, _SPEC_SLOT.__set__)  # type: ignore[assignment]
+    dna = property(_get_dna, _DNA_SLOT.__set__)  # type: ignore[assignment]
+
+    @property
+    def loaded(self) -> bool:
+        return _SPEC_SLOT.__get__(self) is not None or _DNA_SLOT.__get__(self) is not None
+
+    @property
+    def spec_hash(self) -> str:
+        if _SPEC_SLOT.__get__(self) is not None:
+            return Individual.spec_hash.fget(self)  # type: ignore[attr-defined]
+        if self._lazy_hash is None:
+            spec = json.loads((self._seed_dir / "spec.json").read_text())
+            self._lazy_hash = canonical_spec_hash(spec)
+        return self._lazy_hash
+
+    def __reduce__(self) -> tuple:
+        # Ship the location (and anything already loaded), not a forced full load.
+        state = (self.parents, _SPEC_SLOT.__get__(self), _DNA_SLOT.__get__(self))
+        args = (
+            self.seed_id,
+            self.generation,
+            self._seed_dir,
+            self.fitness,
+            self.metrics,
+            self._lazy_hash,
+        )
+        return (_rebuild_lazy, (args, state))
+
+
+def _rebuild_lazy(args: tuple, state: tuple) -> LazyIndividual:
+    ind = LazyIndividual(*args)
+    ind.parents, spec, dna = state
+    if spec is not None:
+        _SPEC_SLOT.__set__(ind, spec)
+    if dna is not None:
+        _DNA_SLOT.__set__(ind, dna)
+    return ind
+
 
 def load_individual_from_run(run_seed_dir: Path, generation: int) -> Individual:
     seed_id = run_seed_dir.name
@@ -34,4 +152,12 @@ def load_individual_from_run(run_seed_dir: Path, generation: int) -> Individual:
     dna = json.loads(dna_path.read_text()) if dna_path.exists() else {"evo_schema_version": "0.1"}
     fitness_json = json.loads((run_seed_dir / "fitness.json").read_text())
     fitness = float(fitness_json.get("fitness_score", 0.0))
-    return Individual(seed_id=seed_id, generation=generation, spec=spec, dna=dna, fitness=fitness)
+    metrics = numeric_fields(fitness_json)
+    return Individual(
+        seed_id=seed_id,
+        generation=generation,
+        spec=spec,
+        dna=dna,
+        fitness=fitness,
+        metrics=metrics,
+    )
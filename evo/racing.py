@@ -0,0 +1,182 @@
+"""
+Successive-halving ("racing") evaluation of a generation over the interop lanes.
+
+Every candidate is simulated at a small roll budget, graded, and only the top 1/eta are
+resubmitted at an eta-times larger budget, until the full budget is reached. The final
+ranking is written as a results root that ``evolve`` consumes unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from .interop.evaluator import evaluate_folder
+from .io.eval_memo import MemoOptions
+from .io.fitness_table import FITNESS_TABLE_NAME, read_fitness_table, write_fitness_table
+
+# evaluate(bundle_path, generation_label, max_rolls) -> results root holding run/seed_*/
+Evaluator = Callable[[Path, str, int], Path]
+
+
+@dataclass
+class RaceRung:
+    max_rolls: int
+    seed_ids: List[str]
+    scores: Dict[str, float] = field(default_factory=dict)
+    results_root: Optional[Path] = None
+
+
+@dataclass
+class RaceResult:
+    rungs: List[RaceRung]
+    ranking: List[str]
+    scores: Dict[str, float]
+
+    @property
+    def rolls_simulated(self) -> int:
+        return sum(r.max_rolls * len(r.seed_ids) for r in self.rungs)
+
+
+def budget_schedule(min_rolls: int, max_rolls: int, eta: int = 3) -> List[int]:
+    """Geometric budgets min_rolls * eta^k, capped by (and ending at) max_rolls."""
+    if min_rolls <= 0 or max_rolls < min_rolls:
+        raise ValueError("Require 0 < min_rolls <= max_rolls")
+    if eta < 2:
+        raise ValueError("eta must be >= 2")
+    budgets = [int(min_rolls)]
+    while budgets[-1] < max_rolls:
+        budgets.append(min(budgets[-1] * eta, int(max_rolls)))
+    return budgets
+
+
+def _build_rung_folder(gen_dir: Path, seed_ids: List[str], rung_dir: Path, label: str) -> Path:
+    root = rung_dir / label
+    if root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+    for sid in seed_ids:
+        shutil.copytree(gen_dir / sid, root / sid)
+    manifest = {"pop_schema_version": "0.2", "gen_id": label, "pop_size": len(seed_ids)}
+    manifest["candidates"] = [{"id": sid} for sid in seed_ids]
+    (root / "population_manifest.json").write_text(json.dumps(manifest, indent=2))
+    return root
+
+
+def _read_scores(results_root: Path, seed_ids: List[str]) -> Dict[str, float]:
+    run_dir = results_root / "run"
+    if (run_dir / FITNESS_TABLE_NAME).exists():
+        graded = {sid: row["fitness_score"] for sid, row in read_fitness_table(run_dir).items()}
+    else:
+        graded = {}
+        for sid in seed_ids:
+            path = run_dir / sid / "fitness.json"
+            if path.exists():
+                graded[sid] = float(json.loads(path.read_text(encoding="utf-8"))["fitness_score"])
+    missing = [sid for sid in seed_ids if sid not in graded]
+    if missing:
+        raise RuntimeError(f"Results root {results_root} lacks runs for {missing}")
+    return {sid: graded[sid] for sid in seed_ids}
+
+
+def race_generation(
+    gen_dir: Path,
+    evaluate: Evaluator,
+    work_dir: Path,
+    min_rolls: int,
+    max_rolls: int,
+    eta: int = 3,
+    workers: Optional[int] = None,
+    memo: Optional[MemoOptions] = None,
+) -> RaceResult:
+    """
+    Race every seed_* of ``gen_dir``: rung k simulates the survivors at budget
+    ``budget_schedule(...)[k]`` and keeps the top ceil(n / eta) (ties by seed id).
+    With ``memo`` a seed already evaluated at a rung's budget is not resubmitted (the
+    budget is part of the memo key).
+    """
+    seed_ids = sorted(p.name for p in gen_dir.glob("seed_*") if p.is_dir())
+    if not seed_ids:
+        return RaceResult(rungs=[], ranking=[], scores={})
+    budgets = budget_schedule(min_rolls, max_rolls, eta)
+    rungs: List[RaceRung] = []
+    alive = seed_ids
+    for k, budget in enumerate(budgets):
+        label = f"{gen_dir.name}_r{k}"
+        rung_dir = work_dir / f"rung_{k}"
+        folder = _build_rung_folder(gen_dir, alive, rung_dir, label)
+        results_root = evaluate_folder(
+            evaluate,
+            folder,
+            rung_dir / f"{label}.zip",
+            label,
+            max_rolls=budget,
+            workers=workers,
+            memo=memo,
+        )
+        rung = RaceRung(max_rolls=budget, seed_ids=list(alive), results_root=results_root)
+        rung.scores = _read_scores(results_root, alive)
+        rungs.append(rung)
+        if k + 1 < len(budgets):
+            ordered = sorted(alive, key=lambda sid: (-rung.scores[sid], sid))
+            alive = sorted(ordered[: max(1, math.ceil(len(alive) / eta))])
+    scores = rank_consistent_scores(rungs)
+    ranking = sorted(scores, key=lambda sid: (-scores[sid], sid))
+    return RaceResult(rungs=rungs, ranking=ranking, scores=scores)
+
+
+def rank_consistent_scores(rungs: List[RaceRung]) -> Dict[str, float]:
+    """
+    Each seed's score from the last rung it reached, capped strictly below every seed that
+    advanced further, so short-budget luck can never outrank a candidate that survived.
+    """
+    scores: Dict[str, float] = {}
+    floor = math.inf
+    for rung in reversed(rungs):
+        for sid in rung.seed_ids:
+            if sid not in scores:
+                raw = rung.scores[sid]
+                scores[sid] = (
+                    raw if floor == math.inf else min(raw, float(np.nextafter(floor, -np.inf)))
+                )
+        floor = min(scores[sid] for sid in rung.seed_ids)
+    return scores
+
+
+def write_race_results(gen_dir: Path, result: RaceResult, out_root: Path) -> Path:
+    """
+    Write a results root for ``evolve``: seed folders copied from ``gen_dir`` and
+    run/<seed_id>/fitness.json from each seed's last rung, with the rank-consistent
+    ``fitness_score`` and a ``race`` block (rung, max_rolls, raw score).
+    """
+    last_rung: Dict[str, int] = {}
+    for k, rung in enumerate(result.rungs):
+        for sid in rung.seed_ids:
+            last_rung[sid] = k
+    rank = {sid: i for i, sid in enumerate(result.ranking, start=1)}
+    rows = []
+    for sid in sorted(last_rung):
+        k = last_rung[sid]
+        rung = result.rungs[k]
+        shutil.copytree(gen_dir / sid, out_root / sid, dirs_exist_ok=True)
+        src = rung.results_root / "run" / sid / "fitness.json"
+        data = json.loads(src.read_text(encoding="utf-8")) if src.exists() else {"seed_id": sid}
+        data["fitness_score"] = result.scores[sid]
+        data["race"] = {
+            "rung": k,
+            "max_rolls": rung.max_rolls,
+            "raw_fitness_score": rung.scores[sid],
+            "rank": rank[sid],
+        }
+        run_seed_dir = out_root / "run" / sid
+        run_seed_dir.mkdir(parents=True, exist_ok=True)
+        (run_seed_dir / "fitness.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
+        rows.append(data)
+    write_fitness_table(out_root / "run", rows)
+    return out_root / "run" / FITNESS_TABLE_NAME
@@ -0,0 +1,383 @@
+"""
+Multi-generation evolution with the population resident in memory.
+
+``evolve`` performs one step and round-trips the population through disk. ``Evolution``
+keeps it in memory between generations, takes fitness from any source, and renders and
+writes each generation folder on a background writer thread: the bred individuals become
+the next population directly, so neither JSON serialization nor file I/O is on the
+critical path. Folders written this way are byte-identical to chaining ``evolve`` calls.
+
+Each runner owns an ``EvolutionContext`` (adaptive state, top-k history), so independent
+runs can share a process; ``checkpoint``/``resume`` persist a run between generations.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .context import EvolutionContext
+from .evolver import breed_generation, load_population
+from .io.export import (
+    dumps_json,
+    is_trial_generation,
+    render_and_write_folder,
+    render_candidate,
+)
+from .io.fitness_table import FITNESS_TABLE_NAME, read_fitness_table
+from .io.lineage import LineageStore
+from .io.lineage_db import LineageDB
+from .population import Individual, numeric_fields
+from .selection import DEFAULT_OBJECTIVES
+from .surrogate import Surrogate
+
+CHECKPOINT_VERSION = 1
+
+
+class Evolution:
+    """
+    Resident-population runner.
+
+    Typical loop: ``assign_fitness``/``load_fitness`` for the current generation, then
+    ``step()`` to breed and queue the next generation folder under ``out_root/<label>``.
+    Call ``flush()`` (or use the runner as a context manager) before reading folders back.
+    """
+
+    def __init__(
+        self,
+        population: List[Individual],
+        out_root: Path,
+        gen_id: str,
+        root_seed: int,
+        spec_bytes: Optional[Mapping[str, bytes]] = None,
+        pop_size: int | None = None,
+        elite_ratio: float = 0.1,
+        cx_prob: float = 0.7,
+        mut_prob: float = 0.3,
+        selection: str = "fitness",
+        objectives: Sequence[str] = DEFAULT_OBJECTIVES,
+        workers: Optional[int] = None,
+        lineage: Optional[LineageStore] = None,
+        lineage_db: Optional[LineageDB] = None,
+        parent_selection: str = "tournament",
+        context: Optional[EvolutionContext] = None,
+        tournament_size: int = 3,
+        surrogate: Optional[Surrogate] = None,
+        variation: str = "dict",
+    ) -> None:
+        self.population = population
+        self.out_root = out_root
+        self.gen_id = gen_id
+        self.root_seed = root_seed
+        self.pop_size = pop_size
+        self.elite_ratio = elite_ratio
+        self.cx_prob = cx_prob
+        self.mut_prob = mut_prob
+        self.selection = selection
+        self.objectives = tuple(objectives)
+        self.workers = workers
+        self.lineage = lineage
+        self.lineage_db = lineage_db
+        self.parent_selection = parent_selection
+        self.tournament_size = tournament_size
+        self.surrogate = surrogate
+        self.variation = variation
+        # Private by default: the process-wide GLOBAL_CONTEXT is only for bare ``evolve``.
+        self.context = context if context is not None else EvolutionContext(root_seed=root_seed)
+        # spec.json bytes of the current generation, keyed by seed id (for parent hashes).
+        # Bred generations fill this on demand, from the resident specs (see ``_spec``).
+        self._spec_bytes: Dict[str, bytes] = dict(spec_bytes or {})
+        # Set by ``from_results(lazy=True)``: spec.json bytes are read from here on demand.
+        self._spec_root: Optional[Path] = None
+        # Set by ``step``: the resident specs of a generation bred in memory.
+        self._bred_specs: Dict[str, Dict[str, Any]] = {}
+        self._scored: set[str] = {ind.seed_id for ind in population}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evo-writer")
+        self._pending: List[Future] = []
+        # Written folders not yet indexed in ``lineage_db`` (SQLite stays on this thread).
+        self._unindexed: List[Future] = []
+
+    @classmethod
+    def from_results(
+        cls,
+        results_root: Path,
+        out_root: Path,
+        gen_id: str,
+        root_seed: int,
+        lazy: bool = False,
+        **kw: Any,
+    ) -> "Evolution":
+        """
+        Load a scored generation once (as ``evolve`` would) and keep it resident. With
+        ``lazy`` only fitness is read up front (see ``load_population``).
+        """
+        generation = int(gen_id.strip("g") or "0")
+        population = load_population(results_root, generation=generation, lazy=lazy)
+        if lazy:
+            run = cls(population, out_root, gen_id, root_seed, **kw)
+            run._spec_root = results_root
+            return run
+        spec_bytes = read_spec_bytes(results_root, population)
+        return cls(population, out_root, gen_id, root_seed, spec_bytes=spec_bytes, **kw)
+
+    def __enter__(self) -> "Evolution":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def generation_dir(self, label: Optional[str] = None) -> Path:
+        return self.out_root / (label or self.gen_id)
+
+    def assign_fitness(self, results: Mapping[str, Any]) -> None:
+        """
+        Score the current generation: ``results[seed_id]`` is a fitness score or a
+        fitness.json-style mapping (``fitness_score`` plus numeric metrics).
+        """
+        by_id = {ind.seed_id: ind for ind in self.population}
+        for seed_id, value in results.items():
+            ind = by_id.get(seed_id)
+            if ind is None:
+                raise KeyError(f"{seed_id} is not in generation {self.gen_id}")
+            if isinstance(value, Mapping):
+                ind.fitness = float(value.get("fitness_score", 0.0))
+                ind.metrics = numeric_fields(value)
+            else:
+                ind.fitness = float(value)
+                ind.metrics = {"fitness_score": ind.fitness}
+            self._scored.add(seed_id)
+
+    def load_fitness(self, results_root: Path) -> None:
+        """Score from ``run/fitness_table.csv`` if present, else ``run/<seed_id>/fitness.json``."""
+        results: Dict[str, Any] = {}
+        if (results_root / "run" / FITNESS_TABLE_NAME).exists():
+            results.update(read_fitness_table(results_root / "run"))
+        else:
+            for ind in self.population:
+                path = results_root / "run" / ind.seed_id / "fitness.json"
+                if path.exists():
+                    results[ind.seed_id] = json.loads(path.read_text(encoding="utf-8"))
+        self.assign_fitness({sid: v for sid, v in results.items() if sid in self._ids()})
+
+    def immigrate(self, migrants: Sequence[tuple[Individual, bytes]]) -> List[str]:
+        """
+        Replace the lowest-fitness members of the scored population with ``migrants``
+        (individual, spec.json bytes); returns the replaced seed ids. Migrant seed ids must
+        not clash with resident ones.
+        """
+        if not migrants:
+            return []
+        ids = self._ids()
+        for ind, _ in migrants:
+            if ind.seed_id in ids:
+                raise ValueError(f"Migrant {ind.seed_id} clashes with a resident seed id")
+        ranked = sorted(self.population, key=lambda ind: (ind.fitness, ind.seed_id))
+        replaced = {ind.seed_id for ind in ranked[: len(migrants)]}
+        kept = [ind for ind in self.population if ind.seed_id not in replaced]
+        self.population = kept + [ind for ind, _ in migrants]
+        for seed_id in replaced:
+            self._spec_bytes.pop(seed_id, None)
+            self._bred_specs.pop(seed_id, None)
+            self._scored.discard(seed_id)
+        for ind, data in migrants:
+            self._spec_bytes[ind.seed_id] = data
+            self._scored.add(ind.seed_id)
+        return sorted(replaced)
+
+    def top(self, k: int) -> List[tuple[Individual, bytes]]:
+        """The ``k`` fittest scored individuals with their spec.json bytes (ties by id)."""
+        ranked = sorted(self.population, key=lambda ind: (-ind.fitness, ind.seed_id))
+        return [(ind, self._spec(ind.seed_id) or b"") for ind in ranked[:k]]
+
+    def step(
+        self,
+        manifest_extra: Optional[Mapping[str, Any]] = None,
+        identity_extra: Optional[Mapping[str, Any]] = None,
+    ) -> List[Individual]:
+        """
+        Breed the next generation from the (fully scored) resident population, queue its
+        folder for writing, and make it the current, unscored population.
+        ``manifest_extra`` is merged into population_manifest.json and ``identity_extra``
+        into every DNA ``identity`` block of the new generation.
+        """
+        missing = sorted(self._ids() - self._scored)
+        if missing:
+            raise RuntimeError(f"Generation {self.gen_id} has unscored seeds: {missing}")
+        self._index_written()
+        bred = breed_generation(
+            self.population,
+            self.gen_id,
+            self.root_seed,
+            spec_source=self._spec,
+            pop_size=self.pop_size,
+            elite_ratio=self.elite_ratio,
+            cx_prob=self.cx_prob,
+            mut_prob=self.mut_prob,
+            selection=self.selection,
+            objectives=self.objectives,
+            workers=self.workers,
+            lineage=self.lineage,
+            parent_selection=self.parent_selection,
+            context=self.context,
+            tournament_size=self.tournament_size,
+            surrogate=self.surrogate,
+            variation=self.variation,
+        )
+        if not bred.individuals:
+            return []
+        bred.manifest_overrides.update(manifest_extra or {})
+        if identity_extra:
+            for ind in bred.individuals:
+                ind.dna = {**ind.dna, "identity": {**ind.dna.get("identity", {}), **identity_extra}}
+        # Individuals are copy-on-write, so the writer may read them while breeding goes on;
+        # the overrides may hold live context state and are copied.
+        future = self._writer.submit(
+            render_and_write_folder,
+            self.generation_dir(bred.label),
+            bred.label,
+            list(bred.individuals),
+            set(bred.elite_ids),
+            copy.deepcopy(bred.manifest_overrides),
+        )
+        self._pending.append(future)
+        if self.lineage_db is not None:
+            self._unindexed.append(future)
+        self._pending = [f for f in self._pending if not f.done() or f.exception()]
+        # The next population is what ``load_population`` would read back from the folder.
+        generation = int(bred.label.strip("g") or "0")
+        trial = is_trial_generation(bred.manifest_overrides)
+        population: List[Individual] = []
+        for idx, ind in enumerate(bred.individuals, start=1):
+            seed_id = f"seed_{idx:04d}"
+            is_elite = ind.seed_id in bred.elite_ids
+            spec, dna = render_candidate(bred.label, seed_id, ind, is_elite, trial and not is_elite)
+            population.append(Individual(seed_id, generation, spec, dna, 0.0))
+        self.population = population
+        self.gen_id = bred.label
+        self._spec_bytes = {}
+        self._spec_root = None
+        self._bred_specs = {ind.seed_id: ind.spec for ind in population}
+        self._scored = set()
+        return population
+
+    def checkpoint(self, path: Path) -> Path:
+        """
+        Write the resident population (specs, DNA, scores), its spec.json bytes, the
+        settings, the context and any surrogate to ``path`` as JSON. Queued folders are
+        flushed first.
+        """
+        self.flush()
+        state = {
+            "checkpoint_version": CHECKPOINT_VERSION,
+            "out_root": str(self.out_root),
+            "gen_id": self.gen_id,
+            "root_seed": self.root_seed,
+            "settings": {
+                "pop_size": self.pop_size,
+                "elite_ratio": self.elite_ratio,
+                "cx_prob": self.cx_prob,
+                "mut_prob": self.mut_prob,
+                "selection": self.selection,
+                "objectives": list(self.objectives),
+                "parent_selection": self.parent_selection,
+                "tournament_size": self.tournament_size,
+                "variation": self.variation,
+            },
+            "context": self.context.to_dict(),
+            "surrogate": None if self.surrogate is None else self.surrogate.to_dict(),
+            "population": [
+                {
+                    "seed_id": ind.seed_id,
+                    "generation": ind.generation,
+                    "spec": ind.spec,
+                    "dna": ind.dna,
+                    "fitness": ind.fitness,
+                    "parents": list(ind.parents),
+                    "metrics": dict(ind.metrics),
+                }
+                for ind in self.population
+            ],
+            "spec_bytes": {
+                ind.seed_id: data.decode("utf-8")
+                for ind in self.population
+                if (data := self._spec(ind.seed_id)) is not None
+            },
+            "scored": sorted(self._scored),
+        }
+        # Insertion order matters: spec/dna key order is what the folders render.
+        path.write_text(json.dumps(state), encoding="utf-8")
+        return path
+
+    @classmethod
+    def resume(cls, path: Path, **kw: Any) -> "Evolution":
+        """
+        Rebuild a runner from ``checkpoint(path)``; it continues exactly where the original
+        would have. ``kw`` supplies what is not checkpointed (``workers``, ``lineage``,
+        ``lineage_db``) or overrides ``out_root``.
+        """
+        state = json.loads(path.read_text(encoding="utf-8"))
+        if state.get("checkpoint_version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint_version in {path}")
+        population = [Individual(**entry) for entry in state["population"]]
+        settings = {**state["settings"], **kw}
+        out_root = Path(settings.pop("out_root", state["out_root"]))
+        run = cls(
+            population,
+            out_root,
+            state["gen_id"],
+            state["root_seed"],
+            spec_bytes={k: v.encode("utf-8") for k, v in state["spec_bytes"].items()},
+            context=EvolutionContext.from_dict(state["context"]),
+            surrogate=Surrogate.from_dict(state["surrogate"]) if state.get("surrogate") else None,
+            **settings,
+        )
+        run._scored = set(state["scored"])
+        return run
+
+    def flush(self) -> None:
+        """Block until every queued generation folder is on disk; re-raise write errors."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+        self._index_written()
+
+    def _index_written(self) -> None:
+        # Earlier generations have had a whole evaluation to finish writing.
+        unindexed, self._unindexed = self._unindexed, []
+        for future in unindexed:
+            self.lineage_db.add_generation(future.result())
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._writer.shutdown(wait=True)
+
+    def _spec(self, seed_id: str) -> Optional[bytes]:
+        data = self._spec_bytes.get(seed_id)
+        if data is not None:
+            return data
+        if self._spec_root is not None:
+            path = self._spec_root / seed_id / "spec.json"
+            if path.exists():
+                data = self._spec_bytes[seed_id] = path.read_bytes()
+        elif seed_id in self._bred_specs:
+            # Bred in memory: render the spec.json bytes the folder holds, once per parent.
+            data = self._spec_bytes[seed_id] = dumps_json(self._bred_specs[seed_id])
+        return data
+
+    def _ids(self) -> set[str]:
+        return {ind.seed_id for ind in self.population}
+
+
+def read_spec_bytes(results_root: Path, population: Sequence[Individual]) -> Dict[str, bytes]:
+    """spec.json bytes of each individual under ``results_root/<seed_id>/``, keyed by id."""
+    spec_bytes: Dict[str, bytes] = {}
+    for ind in population:
+        path = results_root / ind.seed_id / "spec.json"
+        if path.exists():
+            spec_bytes[ind.seed_id] = path.read_bytes()
+    return spec_bytes
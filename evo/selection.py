@@ -1,16 +1,291 @@
 from __future__ import annotations
 
+import heapq
 import random
-from typing import List
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
 
 from .population import Individual
 
+# Multi-objective defaults: fitness.json fields and whether larger ("max") or smaller is better.
+DEFAULT_OBJECTIVES = ("roi", "drawdown_max", "pso_rate")
+OBJECTIVE_SENSES: Dict[str, str] = {
+    "roi": "max",
+    "drawdown_max": "max",  # stored as a non-positive bankroll drop
+    "pso_rate": "min",
+    "fitness_score": "max",
+}
+
+SortKey = Callable[[Individual], Any]
+
+
+def _by_fitness(ind: Individual) -> float:
+    return ind.fitness
+
+
+def tournament(
+    pop: List[Individual],
+    k: int = 3,
+    key: Optional[SortKey] = None,
+    rng: Optional[random.Random] = None,
+) -> Individual:
+    """Pick the best of k random individuals (largest ``key``; default fitness)."""
+    contestants = (rng or random).sample(pop, k=min(k, len(pop)))
+    return max(contestants, key=key or _by_fitness)
+
+
+def elitism(pop: List[Individual], elite_k: int, key: Optional[SortKey] = None) -> List[Individual]:
+    # Same order as a full descending stable sort, without sorting the whole population.
+    return heapq.nlargest(elite_k, pop, key=key or _by_fitness)
+
+
+# Array-based parent selection: every function takes a 1-D ``scores`` array (larger is
+# better) and a ``numpy.random.Generator`` and returns population indices.
+PARENT_SELECTIONS = ("tournament", "batch_tournament", "sus", "rank", "truncation")
+
+
+def score_array(pop: Sequence[Individual], key: Optional[SortKey] = None) -> np.ndarray:
+    """
+    ``key`` values as float64. Non-scalar keys (e.g. ``nsga2_key`` tuples) become dense
+    ranks, so the order is preserved.
+    """
+    values = [(key or _by_fitness)(ind) for ind in pop]
+    if all(isinstance(v, (int, float)) for v in values):
+        return np.asarray(values, dtype=np.float64)
+    out = np.empty(len(values))
+    rank, prev = -1, object()
+    for i in sorted(range(len(values)), key=values.__getitem__):
+        if values[i] != prev:
+            rank, prev = rank + 1, values[i]
+        out[i] = rank
+    return out
+
+
+def _nan_last(scores: np.ndarray) -> np.ndarray:
+    # NaN compares false both ways; -inf puts it below every number in argmax and sorts.
+    scores = np.asarray(scores, dtype=np.float64)
+    return np.where(np.isnan(scores), -np.inf, scores)
+
+
+def elite_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the ``k`` best scores, best first, ties by index (the ``elitism`` order).
+    O(n) partial selection via ``argpartition`` plus a sort of the ``k`` winners. NaN
+    scores rank below every number, so ``min(k, n)`` indices always come back.
+    """
+    scores = _nan_last(scores)
+    n = len(scores)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    threshold = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[: k - len(above)]
+    chosen = np.concatenate([above, ties])
+    return chosen[np.lexsort((chosen, -scores[chosen]))]
+
+
+def tournament_batch(
+    scores: np.ndarray, n: int, rng: np.random.Generator, k: int = 3
+) -> np.ndarray:
+    """
+    ``n`` tournaments of size ``k`` in one draw (contestants with replacement); each
+    winner is the best contestant, the first drawn on ties. NaN scores lose to any number.
+    """
+    scores = _nan_last(scores)
+    contestants = rng.integers(0, len(scores), size=(n, k))
+    return contestants[np.arange(n), np.argmax(scores[contestants], axis=1)]
+
+
+def sus(weights: np.ndarray, n: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Stochastic universal sampling: ``n`` evenly spaced pointers with one random offset, so
+    each index is picked ``floor`` or ``ceil`` of its expected count; picks come back
+    shuffled. Negative weights are shifted up to zero and NaN weights count as zero;
+    all-zero weights sample uniformly over the non-NaN entries (all of them if none).
+    """
+    if n <= 0:
+        return np.empty(0, dtype=np.intp)
+    w = np.asarray(weights, dtype=np.float64)
+    known = ~np.isnan(w)
+    if known.any() and w[known].min() < 0:
+        w = w - w[known].min()
+    w = np.where(known, w, 0.0)
+    total = w.sum()
+    if total <= 0:
+        w = known.astype(np.float64) if known.any() else np.ones(len(w))
+        total = w.sum()
+    step = total / n
+    pointers = (rng.random() + np.arange(n)) * step
+    picks = np.minimum(np.searchsorted(np.cumsum(w), pointers, side="right"), len(w) - 1)
+    return rng.permutation(picks)
+
+
+def rank_weights(scores: np.ndarray, pressure: float = 1.5) -> np.ndarray:
+    """
+    Linear ranking weights in [2 - pressure, pressure] (worst to best), ties by index.
+    NaN scores are left out of the ranking and get weight zero.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    ranked = np.flatnonzero(~np.isnan(scores))
+    m = len(ranked)
+    ranks = np.empty(m)
+    ranks[np.lexsort((-ranked, scores[ranked]))] = np.arange(m)
+    weights = np.zeros(len(scores))
+    weights[ranked] = (2 - pressure) + 2 * (pressure - 1) * ranks / max(m - 1, 1)
+    return weights
+
+
+def rank_select(
+    scores: np.ndarray, n: int, rng: np.random.Generator, pressure: float = 1.5
+) -> np.ndarray:
+    """SUS over linear rank weights: selection pressure independent of score scale."""
+    return sus(rank_weights(scores, pressure), n, rng)
+
+
+def truncation(
+    scores: np.ndarray, n: int, rng: np.random.Generator, frac: float = 0.5
+) -> np.ndarray:
+    """Uniform picks from the best ``frac`` of the population."""
+    pool = elite_indices(scores, max(1, int(np.ceil(len(scores) * frac))))
+    return pool[rng.integers(0, len(pool), size=n)]
+
+
+def select_parents(
+    method: str, scores: np.ndarray, n: int, rng: np.random.Generator, k: int = 3
+) -> np.ndarray:
+    """
+    ``n`` parent indices by ``method`` (any of ``PARENT_SELECTIONS`` but "tournament");
+    ``k`` is the tournament size for "batch_tournament".
+    """
+    if method == "batch_tournament":
+        return tournament_batch(scores, n, rng, k=k)
+    if method == "sus":
+        return sus(scores, n, rng)
+    if method == "rank":
+        return rank_select(scores, n, rng)
+    if method == "truncation":
+        return truncation(scores, n, rng)
+    raise ValueError(f"Unknown parent selection {method!r}")
+
+
+def objective_matrix(pop: Sequence[Individual], objectives: Sequence[str]) -> np.ndarray:
+    """(n, m) matrix to *minimize*: "max" objectives are negated, missing values are worst."""
+    out = np.empty((len(pop), len(objectives)), dtype=np.float64)
+    for j, name in enumerate(objectives):
+        sign = -1.0 if OBJECTIVE_SENSES.get(name, "max") == "max" else 1.0
+        col = np.array([ind.metrics.get(name, np.nan) for ind in pop], dtype=np.float64)
+        out[:, j] = np.where(np.isnan(col), np.inf, sign * col)
+    return out
+
+
+def _sort_2d(F: np.ndarray, order: np.ndarray) -> np.ndarray:
+    # With rows in lexicographic order a front's members have strictly falling f2, so a
+    # point joins the first front whose lowest f2 is still above its own: O(n log n).
+    ranks = np.empty(len(F), dtype=np.int64)
+    front_min: List[float] = []
+    prev, prev_i = None, -1
+    for i in order:
+        point = (F[i, 0], F[i, 1])
+        if point == prev:
+            ranks[i] = ranks[prev_i]
+            continue
+        k = bisect_right(front_min, point[1])
+        if k == len(front_min):
+            front_min.append(point[1])
+        else:
+            front_min[k] = point[1]
+        ranks[i] = k
+        prev, prev_i = point, i
+    return ranks
+
+
+def _sort_nd(F: np.ndarray, order: np.ndarray) -> np.ndarray:
+    # Efficient non-dominated sort with binary search over fronts (ENS-BS): in
+    # lexicographic order nobody is dominated by a later point, and if a front dominates p
+    # so does every earlier front. Each membership test is one vectorized comparison.
+    n, m = F.shape
+    ranks = np.empty(n, dtype=np.int64)
+    fronts: List[np.ndarray] = []
+    sizes: List[int] = []
+
+    def _dominated_by(k: int, p: np.ndarray) -> bool:
+        members = fronts[k][: sizes[k]]
+        return bool(np.any(np.all(members <= p, axis=1) & np.any(members < p, axis=1)))
+
+    for i in order:
+        p = F[i]
+        lo, hi = 0, len(fronts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _dominated_by(mid, p):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(fronts):
+            fronts.append(np.empty((16, m)))
+            sizes.append(0)
+        if sizes[lo] == len(fronts[lo]):
+            fronts[lo] = np.concatenate([fronts[lo], np.empty_like(fronts[lo])])
+        fronts[lo][sizes[lo]] = p
+        sizes[lo] += 1
+        ranks[i] = lo
+    return ranks
+
+
+def non_dominated_sort(F: np.ndarray) -> np.ndarray:
+    """
+    Pareto front index per row of a minimization matrix ``F`` (0 = non-dominated).
+    Two objectives take O(n log n); more use ENS-BS (≈ O(m n sqrt n) on typical data).
+    """
+    F = np.asarray(F, dtype=np.float64)
+    if F.ndim != 2:
+        raise ValueError("Objective matrix must be 2-D")
+    n, m = F.shape
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    order = np.lexsort(F.T[::-1])
+    if m == 1:
+        _, ranks = np.unique(F[:, 0], return_inverse=True)
+        return ranks.astype(np.int64)
+    if m == 2:
+        return _sort_2d(F, order)
+    return _sort_nd(F, order)
+
 
-def tournament(pop: List[Individual], k: int = 3) -> Individual:
-    """Pick the best of k random individuals."""
-    contestants = random.sample(pop, k=min(k, len(pop)))
-    return max(contestants, key=lambda ind: ind.fitness)
+def crowding_distance(F: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance per row, computed within each front; boundaries are inf."""
+    F = np.asarray(F, dtype=np.float64)
+    n, m = F.shape
+    dist = np.zeros(n, dtype=np.float64)
+    finite = np.where(np.isfinite(F), F, np.nan)
+    for front in np.unique(ranks):
+        idx = np.flatnonzero(ranks == front)
+        if idx.size <= 2:
+            dist[idx] = np.inf
+            continue
+        for j in range(m):
+            vals = finite[idx, j]
+            order = idx[np.argsort(vals, kind="stable")]
+            col = finite[order, j]
+            span = np.nanmax(col) - np.nanmin(col)
+            dist[order[0]] = dist[order[-1]] = np.inf
+            if not span or np.isnan(span):
+                continue
+            gaps = (col[2:] - col[:-2]) / span
+            dist[order[1:-1]] += np.nan_to_num(gaps, nan=0.0)
+    return dist
 
 
-def elitism(pop: List[Individual], elite_k: int) -> List[Individual]:
-    return sorted(pop, key=lambda ind: ind.fitness, reverse=True)[:elite_k]
+def nsga2_key(pop: Sequence[Individual], objectives: Sequence[str] = DEFAULT_OBJECTIVES) -> SortKey:
+    """
+    Sort key implementing NSGA-II's crowded comparison: lower front first, then larger
+    crowding distance. Use with ``elitism``/``tournament`` (larger key wins).
+    """
+    F = objective_matrix(pop, objectives)
+    ranks = non_dominated_sort(F)
+    crowd = crowding_distance(F, ranks)
+    table = {id(ind): (-int(r), float(c)) for ind, r, c in zip(pop, ranks, crowd)}
+    return lambda ind: table[id(ind)]
@@ -0,0 +1,294 @@
+"""
+Asynchronous steady-state evolution: no generational barrier.
+
+A bounded number of candidates is in flight on the interop lanes at any time. As soon as
+one result arrives it competes for a place in the resident population (replacing the
+weakest member if fitter) and a replacement candidate is bred and submitted. Birth ``i``
+draws only from ``make_rng_subseed(run_label, i, root_seed)``, so a run is determined by
+the order results arrive in, which ``arrivals.jsonl`` records; ``replay_steady_state``
+re-runs a logged run exactly.
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from .context import GLOBAL_CONTEXT, EvolutionContext
+from .dna import lineage_ref, make_rng_subseed, parent_hashes_from_bytes, update_dna
+from .evolver import breed_child, load_population
+from .interop.evaluator import BundleEvaluator, evaluate_folder
+from .io.eval_memo import MemoOptions
+from .io.export import write_generation_folder
+from .io.lineage import LineageStore
+from .population import Individual, numeric_fields
+from .runner import read_spec_bytes
+
+ARRIVAL_LOG = "arrivals.jsonl"
+
+
+@dataclass
+class SteadyState:
+    """
+    Deterministic core: ``birth()`` breeds the next candidate into ``out_dir/<birth_id>/``
+    and ``arrive()`` folds a result into the population. Drivers only decide the order.
+    """
+
+    population: List[Individual]
+    spec_bytes: Dict[str, bytes]
+    out_dir: Path
+    run_label: str
+    root_seed: int
+    cx_prob: float = 0.7
+    mut_prob: float = 0.3
+    mode: str = "NORMAL"
+    lineage: Optional[LineageStore] = None
+    tournament_size: int = 3
+    # Source of the per-birth RNG streams; adaptive state is read once into ``mode``.
+    context: EvolutionContext = field(default_factory=EvolutionContext)
+    births: int = 0
+    log: List[Dict[str, Any]] = field(default_factory=list)
+    _pending: Dict[str, Individual] = field(default_factory=dict)
+
+    @classmethod
+    def from_results(
+        cls,
+        results_root: Path,
+        out_dir: Path,
+        gen_id: str,
+        root_seed: int,
+        context: Optional[EvolutionContext] = None,
+        **kw: Any,
+    ) -> "SteadyState":
+        population = load_population(results_root, generation=int(gen_id.strip("g") or "0"))
+        context = GLOBAL_CONTEXT if context is None else context
+        kw.setdefault("mode", context.adaptive.mode)
+        kw.setdefault("context", context)
+        spec_bytes = read_spec_bytes(results_root, population)
+        return cls(population, spec_bytes, out_dir, f"{gen_id}ss", root_seed, **kw)
+
+    def birth(self) -> tuple[str, Path]:
+        """Breed birth ``self.births``; returns (birth_id, its one-seed generation folder)."""
+        self.births += 1
+        idx = self.births
+        birth_id = f"b{idx:06d}"
+        rng = self.context.slot_stream(self.run_label, idx, self.root_seed)
+        pop = self.population
+        child, op_entries = breed_child(
+            pop,
+            rng,
+            self.cx_prob,
+            self.mut_prob,
+            self.mode,
+            tournament_size=self.tournament_size,
+        )
+        by_id = {ind.seed_id: ind for ind in pop}
+        parent_specs = [(p, self.spec_bytes[p]) for p in child.parents[:2] if p in self.spec_bytes]
+        child.dna = update_dna(
+            child.dna,
+            gen_id=self.run_label,
+            candidate_id=birth_id,
+            parents=list(child.parents),
+            parent_hashes=parent_hashes_from_bytes(parent_specs),
+            rng_subseed=make_rng_subseed(self.run_label, idx, self.root_seed),
+            op_entries=op_entries,
+            lineage=self.lineage,
+            parent_refs=[lineage_ref(by_id[p].dna) for p in child.parents],
+        )
+        if self.lineage is not None:
+            self.lineage.flush()
+        child.seed_id = birth_id
+        child.fitness = 0.0
+        child.metrics = {}
+        folder = self.out_dir / birth_id
+        overrides = {"steady_state": {"birth_id": birth_id, "birth": idx}}
+        write_generation_folder(folder, self.run_label, [child], manifest_overrides=overrides)
+        child.spec = json.loads((folder / "seed_0001" / "spec.json").read_text(encoding="utf-8"))
+        self._pending[birth_id] = child
+        self.log.append({"event": "birth", "birth_id": birth_id, "parents": child.parents})
+        return birth_id, folder
+
+    def arrive(self, birth_id: str, payload: Mapping[str, Any]) -> Optional[str]:
+        """
+        Score ``birth_id`` from a fitness.json payload; it replaces the weakest resident
+        (ties by seed id) if strictly fitter. Returns the replaced seed id, or None.
+        """
+        child = self._pending.pop(birth_id)
+        child.fitness = float(payload.get("fitness_score", 0.0))
+        child.metrics = numeric_fields(payload)
+        worst = min(self.population, key=lambda ind: (ind.fitness, ind.seed_id), default=None)
+        replaced = None
+        if worst is None or child.fitness > worst.fitness:
+            if worst is not None:
+                self.population.remove(worst)
+                self.spec_bytes.pop(worst.seed_id, None)
+                replaced = worst.seed_id
+            self.population.append(child)
+            spec_path = self.out_dir / birth_id / "seed_0001" / "spec.json"
+            self.spec_bytes[birth_id] = spec_path.read_bytes()
+        self.log.append(
+            {
+                "event": "arrival",
+                "birth_id": birth_id,
+                "fitness_score": child.fitness,
+                "replaced": replaced,
+            }
+        )
+        return replaced
+
+    def start(self, births: int, max_in_flight: int) -> List[str]:
+        """Log the run shape and breed the initial in-flight window."""
+        self.log.append(
+            {
+                "event": "start",
+                "run_label": self.run_label,
+                "root_seed": self.root_seed,
+                "mode": self.mode,
+                "births": births,
+                "max_in_flight": max_in_flight,
+            }
+        )
+        if self.tournament_size != 3:
+            self.log[-1]["tournament_size"] = self.tournament_size
+        return [self.birth()[0] for _ in range(min(births, max_in_flight))]
+
+    def write_log(self) -> Path:
+        path = self.out_dir / ARRIVAL_LOG
+        lines = [json.dumps(entry, sort_keys=True) for entry in self.log]
+        path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        return path
+
+
+def read_arrival_log(log_path: Path) -> tuple[Dict[str, Any], List[str]]:
+    """The ``start`` entry and the birth ids in the order their results were folded in."""
+    start: Dict[str, Any] = {}
+    order: List[str] = []
+    for line in log_path.read_text(encoding="utf-8").splitlines():
+        entry = json.loads(line)
+        if entry["event"] == "start":
+            start = entry
+        elif entry["event"] == "arrival":
+            order.append(entry["birth_id"])
+    return start, order
+
+
+def _evaluate_birth(
+    evaluate: BundleEvaluator, folder: Path, label: str, memo: Optional[MemoOptions] = None
+) -> Dict[str, Any]:
+    bundle = folder.parent / "bundles" / folder.name / f"{folder.name}.zip"
+    results_root = evaluate_folder(evaluate, folder, bundle, label, memo=memo)
+    fitness_path = results_root / "run" / "seed_0001" / "fitness.json"
+    return json.loads(fitness_path.read_text(encoding="utf-8"))
+
+
+def run_steady_state(
+    results_root: Path,
+    out_dir: Path,
+    gen_id: str,
+    root_seed: int,
+    evaluate: BundleEvaluator,
+    births: int,
+    max_in_flight: int = 8,
+    cx_prob: float = 0.7,
+    mut_prob: float = 0.3,
+    lineage: Optional[LineageStore] = None,
+    context: Optional[EvolutionContext] = None,
+    memo: Optional[MemoOptions] = None,
+    tournament_size: int = 3,
+) -> SteadyState:
+    """
+    Evolve a scored generation for ``births`` evaluations with at most ``max_in_flight``
+    CSC jobs outstanding. Each birth is bundled under ``out_dir/bundles/<birth_id>/`` and
+    submitted on its own (see ``evo.interop.evaluator.LaneEvaluator``); results that land together
+    are folded in birth order. Writes ``out_dir/arrivals.jsonl``. The mutation mode is
+    fixed at start from ``context`` (default ``GLOBAL_CONTEXT``). With ``memo`` a birth
+    whose spec the memo already holds is answered without a CSC job; births in flight
+    together claim keys first (see ``evo.io.eval_memo``). ``tournament_size`` is logged
+    (when not 3) so replays use it too.
+    """
+    if births < 1 or max_in_flight < 1:
+        raise ValueError("births and max_in_flight must be >= 1")
+    if memo is not None and max_in_flight > 1:
+        memo = replace(memo, claim=True)
+        memo.open().clear_claims()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    state = SteadyState.from_results(
+        results_root,
+        out_dir,
+        gen_id,
+        root_seed,
+        context=context,
+        cx_prob=cx_prob,
+        mut_prob=mut_prob,
+        lineage=lineage,
+        tournament_size=tournament_size,
+    )
+    in_flight: Dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="evo-ss") as pool:
+
+        def _submit(birth_id: str) -> None:
+            label = f"{state.run_label}_{birth_id}"
+            future = pool.submit(_evaluate_birth, evaluate, out_dir / birth_id, label, memo)
+            in_flight[future] = birth_id
+
+        try:
+            for birth_id in state.start(births, max_in_flight):
+                _submit(birth_id)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: in_flight[f]):
+                    birth_id = in_flight.pop(future)
+                    state.arrive(birth_id, future.result())
+                    if state.births < births:
+                        _submit(state.birth()[0])
+        finally:
+            state.write_log()
+    return state
+
+
+def replay_steady_state(
+    results_root: Path,
+    out_dir: Path,
+    gen_id: str,
+    log_path: Path,
+    evaluate: BundleEvaluator,
+    cx_prob: float = 0.7,
+    mut_prob: float = 0.3,
+    lineage: Optional[LineageStore] = None,
+    memo: Optional[MemoOptions] = None,
+) -> SteadyState:
+    """
+    Re-run a logged steady-state run serially, folding results in the logged arrival
+    order. With a deterministic evaluator the births match the original run exactly.
+    ``memo`` is used as in ``run_steady_state`` (without claims: births run one at a time).
+    """
+    start, order = read_arrival_log(log_path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    state = SteadyState.from_results(
+        results_root,
+        out_dir,
+        gen_id,
+        int(start["root_seed"]),
+        cx_prob=cx_prob,
+        mut_prob=mut_prob,
+        mode=start["mode"],
+        lineage=lineage,
+        tournament_size=int(start.get("tournament_size", 3)),
+    )
+    births = int(start["births"])
+    pending = set(state.start(births, int(start["max_in_flight"])))
+    try:
+        for birth_id in order:
+            if birth_id not in pending:
+                raise ValueError(f"{birth_id} arrives before it was bred in {log_path}")
+            pending.discard(birth_id)
+            label = f"{state.run_label}_{birth_id}"
+            state.arrive(birth_id, _evaluate_birth(evaluate, out_dir / birth_id, label, memo))
+            if state.births < births:
+                pending.add(state.birth()[0])
+    finally:
+        state.write_log()
+    return state
@@ -0,0 +1,245 @@
+"""
+Surrogate pre-screening: predict offspring fitness before paying for a CSC run.
+
+``Surrogate`` is a NumPy ridge regression over spec features (numeric params, toggles,
+one-hot categories), optionally lifted by random Fourier features. It keeps only the
+sufficient statistics of every graded spec it has observed, so each generation's refit
+costs O(new rows) however long the history. With a surrogate,
+``breed_generation`` breeds ``oversample`` times the offspring slots, keeps the best
+predicted and fills an ``explore`` share of the generation at random from the rest.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .population import Individual
+
+SURROGATE_KINDS = ("ridge", "random_features")
+
+
+def spec_features(spec: Mapping[str, Any]) -> Dict[str, float]:
+    """Numeric params as-is, toggles as 0/1, other params and ``profile_id`` one-hot."""
+    out: Dict[str, float] = {}
+    for key, value in spec.get("params", {}).items():
+        if isinstance(value, bool):
+            out[key] = float(value)
+        elif isinstance(value, (int, float)):
+            out[key] = float(value)
+        else:
+            out[f"{key}={json.dumps(value, sort_keys=True)}"] = 1.0
+    for key, value in spec.get("toggles", {}).items():
+        out[f"toggle:{key}"] = 1.0 if value else 0.0
+    if "profile_id" in spec:
+        out[f"profile_id={spec['profile_id']}"] = 1.0
+    return out
+
+
+class Surrogate:
+    """
+    Incremental ridge surrogate. The feature layout (names, centring, scale and random
+    features) is frozen from the first observed batch; features first seen later are
+    ignored. Nothing is random except the projection, drawn from ``seed``.
+    """
+
+    def __init__(
+        self,
+        kind: str = "ridge",
+        alpha: float = 1.0,
+        n_random: int = 64,
+        gamma: float = 1.0,
+        seed: int = 0,
+        oversample: int = 4,
+        explore: float = 0.25,
+        min_observations: int = 16,
+    ) -> None:
+        if kind not in SURROGATE_KINDS:
+            raise ValueError(f"Unknown surrogate kind {kind!r}")
+        if oversample < 1 or not 0.0 <= explore <= 1.0:
+            raise ValueError("oversample must be >= 1 and explore within [0, 1]")
+        self.kind = kind
+        self.alpha = alpha
+        self.n_random = n_random
+        self.gamma = gamma
+        self.seed = seed
+        self.oversample = oversample
+        self.explore = explore
+        self.min_observations = min_observations
+        self.names: List[str] = []
+        self.center = np.zeros(0)
+        self.scale = np.ones(0)
+        self.proj = np.zeros((0, 0))
+        self.phase = np.zeros(0)
+        self.n = 0
+        self.sum_phi = np.zeros(0)
+        self.sum_y = 0.0
+        self.gram = np.zeros((0, 0))
+        self.xty = np.zeros(0)
+        self.seen: set[str] = set()
+        self._coef: Optional[tuple[np.ndarray, float]] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.n >= self.min_observations
+
+    def _freeze(self, rows: List[Dict[str, float]]) -> None:
+        self.names = sorted({name for row in rows for name in row})
+        X = self._raw(rows)
+        self.center = X.mean(axis=0)
+        std = X.std(axis=0)
+        self.scale = np.where(std > 0, std, 1.0)
+        d = len(self.names)
+        if self.kind == "random_features":
+            rng = np.random.default_rng(self.seed)
+            self.proj = rng.normal(0.0, self.gamma / np.sqrt(max(d, 1)), (d, self.n_random))
+            self.phase = rng.uniform(0.0, 2 * np.pi, self.n_random)
+        width = d + (self.n_random if self.kind == "random_features" else 0)
+        self.sum_phi = np.zeros(width)
+        self.gram = np.zeros((width, width))
+        self.xty = np.zeros(width)
+
+    def _raw(self, rows: Sequence[Mapping[str, float]]) -> np.ndarray:
+        col = {name: j for j, name in enumerate(self.names)}
+        X = np.zeros((len(rows), len(self.names)))
+        for i, row in enumerate(rows):
+            for name, value in row.items():
+                j = col.get(name)
+                if j is not None:
+                    X[i, j] = value
+        return X
+
+    def _phi(self, rows: Sequence[Mapping[str, float]]) -> np.ndarray:
+        Z = (self._raw(rows) - self.center) / self.scale
+        if self.kind == "random_features":
+            waves = np.sqrt(2.0 / self.n_random) * np.cos(Z @ self.proj + self.phase)
+            Z = np.hstack([Z, waves])
+        return Z
+
+    def observe(self, individuals: Iterable[Individual]) -> int:
+        """Add graded specs not seen before (by spec hash); returns how many were new."""
+        rows: List[Dict[str, float]] = []
+        y: List[float] = []
+        for ind in individuals:
+            if ind.spec_hash in self.seen:
+                continue
+            self.seen.add(ind.spec_hash)
+            rows.append(spec_features(ind.spec))
+            y.append(float(ind.fitness))
+        if not rows:
+            return 0
+        if not self.names:
+            self._freeze(rows)
+        phi = self._phi(rows)
+        target = np.asarray(y)
+        self.n += len(rows)
+        self.sum_phi += phi.sum(axis=0)
+        self.sum_y += float(target.sum())
+        self.gram += phi.T @ phi
+        self.xty += phi.T @ target
+        self._coef = None
+        return len(rows)
+
+    def _fit(self) -> tuple[np.ndarray, float]:
+        if self._coef is None:
+            # Ridge with an unpenalized intercept, from centred sufficient statistics.
+            mu = self.sum_phi / self.n
+            y_bar = self.sum_y / self.n
+            C = self.gram - self.n * np.outer(mu, mu)
+            c = self.xty - self.n * mu * y_bar
+            w = np.linalg.solve(C + self.alpha * np.eye(len(mu)), c)
+            self._coef = (w, float(y_bar - mu @ w))
+        return self._coef
+
+    def predict(self, specs: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        if not self.n:
+            raise RuntimeError("Surrogate has no observations")
+        w, b = self._fit()
+        return self._phi([spec_features(s) for s in specs]) @ w + b
+
+    def screen(self, specs: Sequence[Mapping[str, Any]], keep: int, seed: int) -> np.ndarray:
+        """
+        Indices (ascending) of ``keep`` of ``specs``: the best predicted, ties by index,
+        plus ``round(explore * keep)`` drawn uniformly from the others.
+        """
+        keep = min(keep, len(specs))
+        n_explore = min(int(round(self.explore * keep)), len(specs) - keep)
+        pred = self.predict(specs)
+        order = np.lexsort((np.arange(len(specs)), -pred))
+        chosen = order[: keep - n_explore]
+        if n_explore:
+            rest = np.sort(order[keep - n_explore :])
+            rng = np.random.default_rng(seed)
+            chosen = np.concatenate([chosen, rng.choice(rest, n_explore, replace=False)])
+        return np.sort(chosen)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Settings and history size, for manifests."""
+        return {
+            "kind": self.kind,
+            "alpha": self.alpha,
+            "oversample": self.oversample,
+            "explore": self.explore,
+            "observations": self.n,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "alpha": self.alpha,
+            "n_random": self.n_random,
+            "gamma": self.gamma,
+            "seed": self.seed,
+            "oversample": self.oversample,
+            "explore": self.explore,
+            "min_observations": self.min_observations,
+            "names": self.names,
+            "center": self.center.tolist(),
+            "scale": self.scale.tolist(),
+            "proj": self.proj.tolist(),
+            "phase": self.phase.tolist(),
+            "n": self.n,
+            "sum_phi": self.sum_phi.tolist(),
+            "sum_y": self.sum_y,
+            "gram": self.gram.tolist(),
+            "xty": self.xty.tolist(),
+            "seen": sorted(self.seen),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Surrogate":
+        model = cls(
+            kind=data["kind"],
+            alpha=data["alpha"],
+            n_random=data["n_random"],
+            gamma=data["gamma"],
+            seed=data["seed"],
+            oversample=data["oversample"],
+            explore=data["explore"],
+            min_observations=data["min_observations"],
+        )
+        model.names = list(data["names"])
+        d = len(model.names)
+        model.center = np.asarray(data["center"], dtype=np.float64)
+        model.scale = np.asarray(data["scale"], dtype=np.float64)
+        model.phase = np.asarray(data["phase"], dtype=np.float64)
+        model.proj = np.asarray(data["proj"], dtype=np.float64).reshape(d, len(model.phase))
+        model.n = int(data["n"])
+        model.sum_phi = np.asarray(data["sum_phi"], dtype=np.float64)
+        model.sum_y = float(data["sum_y"])
+        width = len(model.sum_phi)
+        model.gram = np.asarray(data["gram"], dtype=np.float64).reshape(width, width)
+        model.xty = np.asarray(data["xty"], dtype=np.float64)
+        model.seen = set(data["seen"])
+        return model
+
+    def save(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "Surrogate":
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
@@ -0,0 +1,243 @@
+"""
+Hyperparameter sweeps: many evolution configurations from one scored generation.
+
+``grid``/``random_design`` build the configurations; ``run_sweep`` runs one ``Evolution``
+arm per configuration in a process pool (each with its own ``EvolutionContext``). Arms
+share the root seed (common random numbers) and one ``EvalMemo``, so a spec evaluated by
+any arm is never sent to CSC again; concurrent arms claim keys before submitting. The
+comparison table (final fitness, convergence speed, evaluations) goes to
+``out_root/sweep.csv`` and ``sweep.json``.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .context import EvolutionContext
+from .interop.evaluator import BundleEvaluator, evaluate_memoized
+from .io.eval_memo import EvalMemo, MemoOptions
+from .policy.adaptive import AdaptiveState
+from .runner import Evolution
+
+# Configuration keys passed to ``Evolution`` and to the arm's ``AdaptiveState``.
+EVOLUTION_PARAMS = (
+    "pop_size",
+    "elite_ratio",
+    "cx_prob",
+    "mut_prob",
+    "selection",
+    "objectives",
+    "parent_selection",
+    "tournament_size",
+)
+ADAPTIVE_PARAMS = ("T_stag", "meh_band", "meh_limit")
+
+TABLE_COLUMNS = (
+    "arm",
+    "params",
+    "final_best",
+    "final_mean",
+    "best_generation",
+    "generations_to_target",
+    "evaluations",
+    "reused",
+)
+
+
+@dataclass
+class SweepArm:
+    """One configuration's run: best/mean fitness per generation and CSC usage."""
+
+    name: str
+    params: Dict[str, Any]
+    generations: List[str] = field(default_factory=list)
+    best_fitness: List[float] = field(default_factory=list)
+    mean_fitness: List[float] = field(default_factory=list)
+    evaluations: int = 0
+    reused: int = 0
+    # Filled by ``run_sweep`` once every arm is done (the target is sweep-wide).
+    generations_to_target: Optional[int] = None
+
+    def row(self) -> Dict[str, Any]:
+        best = max(self.best_fitness, default=None)
+        return {
+            "arm": self.name,
+            "params": json.dumps(self.params, sort_keys=True),
+            "final_best": self.best_fitness[-1] if self.best_fitness else None,
+            "final_mean": self.mean_fitness[-1] if self.mean_fitness else None,
+            "best_generation": None if best is None else self.best_fitness.index(best) + 1,
+            "generations_to_target": self.generations_to_target,
+            "evaluations": self.evaluations,
+            "reused": self.reused,
+        }
+
+
+def grid(axes: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of ``axes`` (name -> values), in axis order."""
+    names = list(axes)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(axes[n] for n in names))]
+
+
+def random_design(space: Mapping[str, Any], n: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    ``n`` configurations sampled from ``space``: a ``(lo, hi)`` tuple is a uniform range
+    (integers if both ends are ints), a list a set of choices, anything else a constant.
+    """
+    rng = random.Random(seed)
+    designs = []
+    for _ in range(n):
+        config: Dict[str, Any] = {}
+        for name, dom in space.items():
+            if isinstance(dom, tuple) and len(dom) == 2:
+                lo, hi = dom
+                if isinstance(lo, int) and isinstance(hi, int):
+                    config[name] = rng.randint(lo, hi)
+                else:
+                    config[name] = round(rng.uniform(lo, hi), 4)
+            elif isinstance(dom, list):
+                config[name] = rng.choice(dom)
+            else:
+                config[name] = dom
+        designs.append(config)
+    return designs
+
+
+def arm_names(configs: Sequence[Mapping[str, Any]]) -> List[str]:
+    return [f"arm_{i:03d}" for i in range(1, len(configs) + 1)]
+
+
+def _check_params(config: Mapping[str, Any]) -> None:
+    unknown = sorted(set(config) - set(EVOLUTION_PARAMS) - set(ADAPTIVE_PARAMS))
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters {unknown}")
+
+
+def _run_arm(
+    name: str,
+    params: Dict[str, Any],
+    results_root: Path,
+    out_dir: Path,
+    gen_id: str,
+    root_seed: int,
+    generations: int,
+    evaluate: BundleEvaluator,
+    memo_root: Path,
+    run_flags: Dict[str, Any],
+    seed: Optional[int],
+    wait_s: float,
+) -> SweepArm:
+    arm = SweepArm(name=name, params=dict(params))
+    adaptive = AdaptiveState(**{k: params[k] for k in ADAPTIVE_PARAMS if k in params})
+    if isinstance(adaptive.meh_band, list):
+        adaptive.meh_band = tuple(adaptive.meh_band)
+    context = EvolutionContext(adaptive=adaptive, root_seed=root_seed)
+    evo_kw = {k: params[k] for k in EVOLUTION_PARAMS if k in params}
+    memo = MemoOptions(memo_root, run_flags, seed, claim=True, wait_s=wait_s)
+    with Evolution.from_results(
+        results_root, out_dir, gen_id, root_seed, context=context, **evo_kw
+    ) as evo:
+        for _ in range(generations):
+            evo.step(manifest_extra={"sweep": {"arm": name, "params": arm.params}})
+            evo.flush()
+            label = evo.gen_id
+            scored_root, plan = evaluate_memoized(
+                evaluate,
+                evo.generation_dir(),
+                out_dir / "bundles" / label / f"{label}.zip",
+                label,
+                memo,
+                job_label=f"{name}_{label}",
+            )
+            evo.load_fitness(scored_root)
+            scores = [ind.fitness for ind in evo.population]
+            arm.generations.append(label)
+            arm.best_fitness.append(max(scores))
+            arm.mean_fitness.append(round(sum(scores) / len(scores), 6))
+            arm.evaluations += len(plan.submit)
+            arm.reused += len(plan.reuse)
+    return arm
+
+
+def run_sweep(
+    results_root: Path,
+    out_root: Path,
+    gen_id: str,
+    root_seed: int,
+    configs: Sequence[Mapping[str, Any]],
+    generations: int,
+    evaluate: BundleEvaluator,
+    run_flags: Optional[Mapping[str, Any]] = None,
+    seed: Optional[int] = None,
+    memo_root: Optional[Path] = None,
+    workers: Optional[int] = None,
+    target_frac: float = 0.95,
+    wait_s: float = 3600.0,
+) -> List[SweepArm]:
+    """
+    Evolve a scored generation for ``generations`` steps under every configuration in
+    ``configs`` (keys from ``EVOLUTION_PARAMS``/``ADAPTIVE_PARAMS``). Arm ``k`` writes
+    ``out_root/arm_00k/``; ``evaluate`` must be picklable (see
+    ``evo.interop.evaluator.LaneEvaluator``) and ``run_flags``/``seed`` key the shared memo
+    (default ``out_root/memo``, one sweep at a time). ``workers`` arms run at once (default
+    all; ``<= 1`` runs them in-process).
+    Convergence speed is the first generation whose best reaches ``target_frac`` of the
+    best fitness any arm found.
+    """
+    if generations < 1 or not configs:
+        raise ValueError("A sweep needs at least one configuration and generation")
+    for config in configs:
+        _check_params(config)
+    memo_root = memo_root or out_root / "memo"
+    EvalMemo(memo_root).clear_claims()
+    names = arm_names(configs)
+    jobs = [
+        (
+            name,
+            dict(config),
+            results_root,
+            out_root / name,
+            gen_id,
+            root_seed,
+            generations,
+            evaluate,
+            memo_root,
+            dict(run_flags or {}),
+            seed,
+            wait_s,
+        )
+        for name, config in zip(names, configs)
+    ]
+    workers = len(jobs) if workers is None else workers
+    if workers <= 1:
+        arms = [_run_arm(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            arms = [f.result() for f in [pool.submit(_run_arm, *job) for job in jobs]]
+    overall = max(max(arm.best_fitness) for arm in arms)
+    target = overall * target_frac if overall >= 0 else overall / target_frac
+    for arm in arms:
+        hits = [i for i, best in enumerate(arm.best_fitness, start=1) if best >= target]
+        arm.generations_to_target = hits[0] if hits else None
+    write_sweep_table(out_root, arms, target)
+    return arms
+
+
+def write_sweep_table(out_root: Path, arms: Sequence[SweepArm], target: float) -> Path:
+    """``sweep.csv`` (one row per arm) plus ``sweep.json`` with the full curves."""
+    out_root.mkdir(parents=True, exist_ok=True)
+    path = out_root / "sweep.csv"
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS)
+        writer.writeheader()
+        for arm in arms:
+            writer.writerow(arm.row())
+    summary = {"target_fitness": target, "arms": [asdict(arm) for arm in arms]}
+    (out_root / "sweep.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return path
@@ -1,8 +1,98 @@
 from __future__ import annotations
 
+import json
 import sys
+import zipfile
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Sequence
+
+import pytest
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
+
+from evo.context import GLOBAL_CONTEXT, EvolutionContext  # noqa: E402
+from evo.io.eval_memo import memo_key  # noqa: E402
+
+Doc = Dict[str, Any]
+
+
+def contra_spec(i: int) -> Doc:
+    """The spec of seed ``i`` in a default results root: bets grow with ``i``."""
+    return {
+        "schema_version": "1.0",
+        "profile_id": "contra_cruise",
+        "params": {"place_6_8": 6 * i, "place_5_9": 5 * i, "odds_multiple": 2},
+        "toggles": {"bubble_mode": i % 2 == 0},
+    }
+
+
+def write_results(
+    root: Path,
+    n: int = 8,
+    spec: Callable[[int], Doc] = contra_spec,
+    fitness: Callable[[int], Doc] = lambda i: {"fitness_score": i / 10},
+    dna: Callable[[int], Doc] = lambda i: {"evo_schema_version": "0.1"},
+) -> Path:
+    """
+    A graded results root for seeds 1..n: ``seed_NNNN/{spec,dna}.json`` and
+    ``run/seed_NNNN/fitness.json``, each built from the seed number.
+    """
+    for i in range(1, n + 1):
+        sid = f"seed_{i:04d}"
+        (root / sid).mkdir(parents=True)
+        (root / sid / "spec.json").write_text(json.dumps(spec(i), indent=2), encoding="utf-8")
+        (root / sid / "dna.json").write_text(json.dumps(dna(i)), encoding="utf-8")
+        (root / "run" / sid).mkdir(parents=True)
+        (root / "run" / sid / "fitness.json").write_text(json.dumps(fitness(i)), encoding="utf-8")
+    return root
+
+
+@dataclass
+class FakeCSC:
+    """
+    Stand-in for a CSC lane: scores each bundled seed as the sum of its ``bets`` / 100 and
+    records the memo key it simulated. Picklable, so island processes can use it.
+    """
+
+    root: Path
+    bets: Sequence[str] = ("place_6_8",)
+
+    def __call__(self, bundle: Path, label: str) -> Path:
+        out = self.root / label
+        with zipfile.ZipFile(bundle) as zf:
+            for name in zf.namelist():
+                if name.endswith("/spec.json"):
+                    sid = name.split("/")[0]
+                    spec = json.loads(zf.read(name))
+                    score = round(sum(spec["params"][bet] for bet in self.bets) / 100, 4)
+                    payload = {
+                        "seed_id": sid,
+                        "fitness_score": score,
+                        "simulated": memo_key(spec, {}, None),
+                    }
+                    (out / "run" / sid).mkdir(parents=True)
+                    (out / "run" / sid / "fitness.json").write_text(json.dumps(payload))
+        return out
+
+
+@pytest.fixture
+def mk_results() -> Callable[..., Path]:
+    """``write_results``: build a graded results root."""
+    return write_results
+
+
+@pytest.fixture
+def fake_csc() -> type[FakeCSC]:
+    """The ``FakeCSC`` class; call it with a results directory (and ``bets``)."""
+    return FakeCSC
+
+
+@pytest.fixture
+def fresh_context() -> Iterator[EvolutionContext]:
+    """The process-wide context, reset before and after the test; ``.reset()`` it between runs."""
+    GLOBAL_CONTEXT.reset()
+    yield GLOBAL_CONTEXT
+    GLOBAL_CONTEXT.reset()
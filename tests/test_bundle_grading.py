@@ -0,0 +1,69 @@
+import json
+import zipfile
+from pathlib import Path
+
+from evo.evolver import evolve, load_population
+from evo.grading import grade_bundle, grade_results_root
+from evo.rng import seed_global
+
+
+def _mk_results_root(root: Path, n: int = 3) -> Path:
+    for s in range(1, n + 1):
+        sid = f"seed_{s:04d}"
+        (root / sid).mkdir(parents=True)
+        spec = {"schema_version": "1.0", "params": {"place_6_8": 6 * s}, "toggles": {}}
+        (root / sid / "spec.json").write_text(json.dumps(spec, indent=2))
+        (root / sid / "dna.json").write_text(json.dumps({"evo_schema_version": "0.1"}))
+        run_dir = root / "run" / sid
+        run_dir.mkdir(parents=True)
+        rows = ["hand_id,bankroll_after,pso_flag"]
+        rows += [f"{i // 2},{1000 + s * (i - 3) * 10},{'1' if i == s else '0'}" for i in range(8)]
+        (run_dir / "journal.csv").write_text("\n".join(rows))
+        (run_dir / "report.json").write_text(json.dumps({"bankroll_start": 1000}))
+    return root
+
+
+def _zip_dir(src: Path, out: Path) -> Path:
+    with zipfile.ZipFile(out, "w") as zf:
+        for p in sorted(src.rglob("*")):
+            if p.is_file():
+                zf.write(p, p.relative_to(src).as_posix())
+    return out
+
+
+def test_grade_bundle_matches_extracted(tmp_path: Path):
+    src = _mk_results_root(tmp_path / "src")
+    bundle = _zip_dir(src, tmp_path / "bundle_out.zip")
+    out_root = tmp_path / "graded"
+
+    for workers in (1, 2):
+        table = grade_bundle(bundle, out_root, workers=workers)
+        written = sorted(p.relative_to(out_root).as_posix() for p in out_root.rglob("*.*"))
+        assert written == [
+            "run/fitness_table.csv",
+            "run/seed_0001/fitness.json",
+            "run/seed_0002/fitness.json",
+            "run/seed_0003/fitness.json",
+        ]
+
+    expected = grade_results_root(src, workers=1)
+    assert table.read_text() == expected.read_text()
+
+
+def test_load_population_and_evolve_from_bundle(tmp_path: Path):
+    src = _mk_results_root(tmp_path / "g001_results")
+    grade_results_root(src, workers=1)
+    bundle = _zip_dir(src, tmp_path / "g001_results.zip")
+
+    from_dir = load_population(src, generation=1)
+    from_zip = load_population(bundle, generation=1)
+    assert [(i.seed_id, i.spec, i.fitness) for i in from_zip] == [
+        (i.seed_id, i.spec, i.fitness) for i in from_dir
+    ]
+
+    seed_global(7)
+    evolve(src, tmp_path / "a", gen_id="g001", root_seed=7, pop_size=3)
+    seed_global(7)
+    evolve(bundle, tmp_path / "b", gen_id="g001", root_seed=7, pop_size=3)
+    for p in sorted((tmp_path / "a").rglob("*.json")):
+        assert p.read_bytes() == (tmp_path / "b" / p.relative_to(tmp_path / "a")).read_bytes()
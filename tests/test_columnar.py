@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+import numpy as np
+
+from evo import fitness
+from evo.io import columnar, report_parser
+
+
+def _mk_run(tmp_path: Path) -> Path:
+    run_dir = tmp_path / "run" / "seed_0001"
+    run_dir.mkdir(parents=True)
+    rows = ["roll,hand_id,bankroll_after,pso_flag"]
+    rows += [
+        f"{i},h{i // 4},{1000 + (i % 7) * 15 - i},{'1' if i % 9 == 0 else '0'}" for i in range(40)
+    ]
+    (run_dir / "journal.csv").write_text("\n".join(rows))
+    return run_dir
+
+
+def test_sidecar_roundtrip_matches_csv(tmp_path: Path):
+    run_dir = _mk_run(tmp_path)
+    columns = ("bankroll_after", "hand_id", "pso_flag")
+    parsed = report_parser.read_journal_arrays(run_dir, columns, prefer_sidecar=False)
+
+    sidecar = report_parser.write_journal_sidecar(run_dir)
+    header, _ = columnar.read_header(sidecar)
+    assert header["rows"] == 40
+    mapped = report_parser.read_journal_sidecar(run_dir, columns)
+    assert mapped is not None and isinstance(mapped["bankroll_after"], np.memmap)
+    for name in columns:
+        assert mapped[name].dtype == parsed[name].dtype
+        np.testing.assert_array_equal(mapped[name], parsed[name])
+    assert fitness.summarize_arrays(mapped) == fitness.scan_journal(run_dir)
+
+
+def test_stale_or_partial_sidecar_is_ignored(tmp_path: Path):
+    run_dir = _mk_run(tmp_path)
+    report_parser.write_journal_sidecar(run_dir, columns=["bankroll_after"])
+    assert report_parser.read_journal_sidecar(run_dir, ["bankroll_after", "pso_flag"]) is None
+    assert report_parser.read_journal_sidecar(run_dir, ["bankroll_after"]) is not None
+
+    journal = run_dir / "journal.csv"
+    journal.write_text(journal.read_text() + "\n40,h10,500,0")
+    st = journal.stat()
+    os.utime(journal, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert report_parser.read_journal_sidecar(run_dir, ["bankroll_after"]) is None
+    arrays = report_parser.read_journal_arrays(run_dir, ["bankroll_after"])
+    assert arrays["bankroll_after"][-1] == 500.0
+
+
+def test_empty_journal_sidecar(tmp_path: Path):
+    run_dir = tmp_path / "run" / "seed_0002"
+    run_dir.mkdir(parents=True)
+    (run_dir / "journal.csv").write_text("hand_id,bankroll_after,pso_flag\n")
+    report_parser.write_journal_sidecar(run_dir)
+    mapped = report_parser.read_journal_sidecar(run_dir, ["bankroll_after"])
+    assert mapped is not None and mapped["bankroll_after"].size == 0
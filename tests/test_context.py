@@ -0,0 +1,123 @@
+"""Tests for the re-entrant EvolutionContext and Evolution checkpoints."""
+
+from __future__ import annotations
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from evo.context import GLOBAL_CONTEXT, EvolutionContext
+from evo.dna import make_rng_subseed
+from evo.evolver import METRICS_CACHE, evolve
+from evo.policy.adaptive import ADAPTIVE, AdaptiveState
+from evo.runner import Evolution
+
+
+def _seed_fitness(i: int) -> dict:
+    return {"fitness_score": 60.0 + i, "roi": i / 10}
+
+
+def _score(sid: str, gen: int, salt: int) -> float:
+    # Flat, mid-band scores push the adaptive policy toward WILDCARD.
+    return 60.0 + (int(sid[-4:]) * salt + gen) % 5
+
+
+def _folder_files(root: Path) -> dict[str, bytes]:
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.rglob("*.json"))}
+
+
+def _run(results: Path, out: Path, seed: int, salt: int, generations: int) -> Evolution:
+    with Evolution.from_results(results, out, "g0", seed, elite_ratio=0.25) as run:
+        for gen in range(generations):
+            pop = run.step()
+            run.assign_fitness({ind.seed_id: _score(ind.seed_id, gen + 1, salt) for ind in pop})
+    return run
+
+
+def test_concurrent_runs_match_sequential(tmp_path: Path, fresh_context, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", fitness=_seed_fitness)
+    jobs = [(11, 3), (23, 7), (5, 2)]
+
+    for seed, salt in jobs:
+        _run(results, tmp_path / "seq" / str(seed), seed, salt, 10)
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [
+            pool.submit(_run, results, tmp_path / "par" / str(seed), seed, salt, 10)
+            for seed, salt in jobs
+        ]
+        runs = [f.result() for f in futures]
+
+    assert any(run.context.adaptive.mode == "WILDCARD" or run.context.metrics_cache for run in runs)
+    for seed, _ in jobs:
+        par = _folder_files(tmp_path / "par" / str(seed))
+        assert par and par == _folder_files(tmp_path / "seq" / str(seed))
+    assert ADAPTIVE == AdaptiveState() and not METRICS_CACHE
+
+
+def test_checkpoint_resume_matches_uninterrupted(tmp_path: Path, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", fitness=_seed_fitness)
+    straight = _run(results, tmp_path / "straight", 11, 3, 6)
+
+    with Evolution.from_results(results, tmp_path / "split", "g0", 11, elite_ratio=0.25) as run:
+        for gen in range(3):
+            pop = run.step()
+            run.assign_fitness({ind.seed_id: _score(ind.seed_id, gen + 1, 3) for ind in pop})
+        ckpt = run.checkpoint(tmp_path / "run.ckpt.json")
+
+    with Evolution.resume(ckpt) as resumed:
+        assert resumed.gen_id == "g3" and resumed.elite_ratio == 0.25
+        for gen in range(3, 6):
+            pop = resumed.step()
+            resumed.assign_fitness({ind.seed_id: _score(ind.seed_id, gen + 1, 3) for ind in pop})
+
+    assert _folder_files(tmp_path / "split") == _folder_files(tmp_path / "straight")
+    assert resumed.context.to_dict() == straight.context.to_dict()
+
+
+def test_checkpoint_of_unscored_generation_still_requires_scores(
+    tmp_path: Path, mk_results
+) -> None:
+    results = mk_results(tmp_path / "g0", n=4, fitness=_seed_fitness)
+    with Evolution.from_results(results, tmp_path / "out", "g0", 3) as run:
+        run.step()
+        ckpt = run.checkpoint(tmp_path / "ckpt.json")
+    with Evolution.resume(ckpt, out_root=tmp_path / "elsewhere") as resumed:
+        assert resumed.out_root == tmp_path / "elsewhere"
+        with pytest.raises(RuntimeError, match="unscored"):
+            resumed.step()
+
+
+def test_evolve_with_context_leaves_globals_alone(
+    tmp_path: Path, fresh_context, mk_results
+) -> None:
+    results = mk_results(tmp_path / "g0", fitness=_seed_fitness)
+    evolve(results, tmp_path / "global", "g0", 7)
+    expected = EvolutionContext(AdaptiveState(**vars(ADAPTIVE)), dict(METRICS_CACHE))
+    fresh_context.reset()
+
+    ctx = EvolutionContext()
+    evolve(results, tmp_path / "ctx", "g0", 7, context=ctx)
+    assert ADAPTIVE == AdaptiveState() and not METRICS_CACHE
+    assert ctx.to_dict() == expected.to_dict()
+    assert _folder_files(tmp_path / "ctx") == _folder_files(tmp_path / "global")
+
+
+def test_context_roundtrip_and_streams(tmp_path: Path) -> None:
+    ctx = EvolutionContext(root_seed=42)
+    ctx.adaptive.update([70.0], [71.0], 0.5)
+    ctx.metrics_cache["prev_topk"] = [71.0]
+    loaded = EvolutionContext.load(ctx.save(tmp_path / "ctx.json"))
+    assert loaded == ctx
+    assert isinstance(loaded.adaptive.meh_band, tuple)
+    assert loaded.stream("mutation").random() == ctx.stream("mutation").random()
+    assert ctx.stream("mutation").random() != ctx.stream("crossover").random()
+    slot = random.Random(make_rng_subseed("g3", 5, 42))
+    assert ctx.slot_stream("g3", 5).random() == slot.random()
+
+    with pytest.raises(ValueError):
+        EvolutionContext().stream("mutation")
+    with pytest.raises(ValueError, match="context_version"):
+        EvolutionContext.from_dict({"context_version": 99})
+    assert GLOBAL_CONTEXT.adaptive is ADAPTIVE and GLOBAL_CONTEXT.metrics_cache is METRICS_CACHE
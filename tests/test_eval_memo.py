@@ -0,0 +1,189 @@
+"""Tests for the spec-level evaluation memo."""
+
+from __future__ import annotations
+
+import csv
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from evo.context import EvolutionContext
+from evo.evolver import evolve
+from evo.interop.evaluator import evaluate_memoized
+from evo.io.eval_memo import (
+    PLAN_NAME,
+    EvalMemo,
+    MemoOptions,
+    SubmissionPlan,
+    attach_memo_results,
+    memo_key,
+    plan_submission,
+    submission_dir,
+)
+from evo.mutation import mutate_spec
+
+
+def _mk_gen(root: Path, bets: list[int]) -> Path:
+    for i, bet in enumerate(bets, start=1):
+        sid = f"seed_{i:04d}"
+        (root / sid).mkdir(parents=True)
+        spec = {
+            "schema_version": "1.0",
+            "params": {"place_6_8": bet},
+            "identity": {"candidate_id": sid},
+        }
+        (root / sid / "spec.json").write_text(json.dumps(spec, indent=2))
+        (root / sid / "dna.json").write_text("{}")
+    manifest = {"gen_id": "g1", "pop_size": len(bets)}
+    manifest["candidates"] = [{"id": f"seed_{i:04d}"} for i in range(1, len(bets) + 1)]
+    (root / "population_manifest.json").write_text(json.dumps(manifest))
+    return root
+
+
+def _fake_grade(pruned: Path, results_root: Path, offset: float = 0.0) -> None:
+    for seed_dir in sorted(pruned.glob("seed_*")):
+        bet = json.loads((seed_dir / "spec.json").read_text())["params"]["place_6_8"]
+        run = results_root / "run" / seed_dir.name
+        run.mkdir(parents=True)
+        payload = {"seed_id": seed_dir.name, "fitness_score": bet / 100 + offset, "roi": 0.1}
+        (run / "fitness.json").write_text(json.dumps(payload))
+
+
+def test_memo_key_ignores_identity_and_tracks_flags_and_seed() -> None:
+    spec = {"params": {"place_6_8": 24}, "identity": {"candidate_id": "seed_0001"}}
+    same = {"identity": {"candidate_id": "seed_0009"}, "params": {"place_6_8": 24}}
+    assert memo_key(spec, {"a": 1}, 7) == memo_key(same, {"a": 1}, 7)
+    assert memo_key(spec, {"a": 1}, 7) != memo_key(spec, {"a": 2}, 7)
+    assert memo_key(spec, {"a": 1}, 7) != memo_key(spec, {"a": 1}, 8)
+
+
+def test_mutating_a_spec_without_params_keeps_its_memo_key() -> None:
+    bare = {"schema_version": "1.0", "toggles": {"press": True}}
+    mutant = mutate_spec(bare, rng=random.Random(1))
+    assert "params" not in mutant and memo_key(mutant, {}, 1) == memo_key(bare, {}, 1)
+    assert "params" in mutate_spec({**bare, "params": {}}, rng=random.Random(1))
+
+
+def test_duplicates_are_skipped_and_reattached(tmp_path: Path) -> None:
+    memo = EvalMemo(tmp_path / "memo")
+    gen1 = _mk_gen(tmp_path / "g1", [24, 30, 24])
+    plan = plan_submission(gen1, memo, {}, 1, out_dir=tmp_path / "pruned1")
+    assert plan.submit == ["seed_0001", "seed_0002"]
+    assert plan.reuse == {"seed_0003": "seed_0001"}
+    pruned = json.loads((tmp_path / "pruned1" / "population_manifest.json").read_text())
+    assert pruned["pop_size"] == 2 and not (tmp_path / "pruned1" / "seed_0003").exists()
+
+    res1 = tmp_path / "res1"
+    _fake_grade(tmp_path / "pruned1", res1)
+    attach_memo_results(res1, plan, memo)
+    reused = json.loads((res1 / "run" / "seed_0003" / "fitness.json").read_text())
+    assert reused["seed_id"] == "seed_0003" and reused["fitness_score"] == 0.24
+    assert (res1 / "seed_0003" / "spec.json").exists()
+    with (res1 / "run" / "fitness_table.csv").open() as f:
+        assert [row["seed_id"] for row in csv.DictReader(f)] == [
+            "seed_0001",
+            "seed_0002",
+            "seed_0003",
+        ]
+
+    # Next generation: both specs are already memoized, a new one is not.
+    gen2 = _mk_gen(tmp_path / "g2", [30, 36])
+    plan2 = plan_submission(gen2, memo, {}, 1)
+    assert plan2.submit == ["seed_0002"] and plan2.reuse == {"seed_0001": None}
+    path = plan2.write(tmp_path / "plan.json")
+    assert SubmissionPlan.read(path) == plan2
+
+
+def test_replicates_and_running_mean(tmp_path: Path) -> None:
+    memo = EvalMemo(tmp_path / "memo")
+    gen = _mk_gen(tmp_path / "g1", [24])
+    for rep, offset in enumerate((0.0, 0.1)):
+        plan = plan_submission(gen, memo, {}, None, tmp_path / f"p{rep}", min_replicates=2)
+        assert plan.submit == ["seed_0001"]
+        res = tmp_path / f"res{rep}"
+        _fake_grade(tmp_path / f"p{rep}", res, offset)
+        attach_memo_results(res, plan, memo, mean=True)
+    payload = json.loads((tmp_path / "res1" / "run" / "seed_0001" / "fitness.json").read_text())
+    assert payload["fitness_score"] == 0.29 and payload["memo"]["replicates"] == 2
+    assert plan_submission(gen, memo, {}, None, min_replicates=2).submit == []
+
+
+def test_concurrent_records_keep_every_replicate(tmp_path: Path) -> None:
+    memo = EvalMemo(tmp_path / "memo")
+    key = memo_key({"params": {"place_6_8": 24}}, {}, None)
+
+    def _record(worker: int) -> None:
+        for i in range(10):
+            memo.record(key, {"fitness_score": worker * 10 + i})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_record, range(8)))
+    scores = sorted(run["fitness_score"] for run in memo.runs(key))
+    assert scores == list(range(80))
+
+
+def test_evolve_plans_the_written_generation(tmp_path: Path) -> None:
+    results = _mk_gen(tmp_path / "g0", [24, 30, 36, 42])
+    for i in range(1, 5):
+        run = results / "run" / f"seed_{i:04d}"
+        run.mkdir(parents=True)
+        (run / "fitness.json").write_text(json.dumps({"fitness_score": i / 10}))
+    options = MemoOptions(tmp_path / "memo", {"shoes": 2}, 3)
+    memo = options.open()
+    for i in range(1, 5):
+        spec = json.loads((results / f"seed_{i:04d}" / "spec.json").read_text())
+        memo.record(memo_key(spec, {"shoes": 2}, 3), {"fitness_score": i / 10})
+
+    out = tmp_path / "g1"
+    evolve(results, out, "g0", 5, elite_ratio=0.5, context=EvolutionContext(), memo=options)
+    plan = SubmissionPlan.read(submission_dir(out) / PLAN_NAME)
+    # Elites keep their specs, so the memo answers them; the pruned folder lacks them.
+    assert plan.reuse.get("seed_0001", "") is None and plan.reuse.get("seed_0002", "") is None
+    assert sorted(p.name for p in submission_dir(out).glob("seed_*")) == sorted(plan.submit)
+
+
+def test_claims_are_released_on_failure_and_waiters_fail_fast(tmp_path: Path) -> None:
+    gen = _mk_gen(tmp_path / "g1", [24, 30])
+    options = MemoOptions(tmp_path / "memo", {"shoes": 2}, 3, claim=True, wait_s=600.0)
+    memo = options.open()
+
+    def _lane_down(bundle_path: Path, label: str) -> Path:
+        raise RuntimeError("lane down")
+
+    with pytest.raises(RuntimeError, match="lane down"):
+        evaluate_memoized(_lane_down, gen, tmp_path / "b" / "g1.zip", "g1", options)
+    assert not list(memo.root.glob("*/*.claim"))
+
+    # Another planner claimed seed_0001's key, then gave up without recording it.
+    spec = json.loads((gen / "seed_0001" / "spec.json").read_text())
+    key = memo_key(spec, {"shoes": 2}, 3)
+    assert memo.claim(key)
+    plan = plan_submission(gen, memo, {"shoes": 2}, 3, claim=True)
+    assert plan.reuse == {"seed_0001": None} and plan.submit == ["seed_0002"]
+    _fake_grade(gen, tmp_path / "res")
+    memo.release(key)
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="seed_0001"):
+        attach_memo_results(tmp_path / "res", plan, memo, wait_s=600.0)
+    assert time.monotonic() - start < 5
+
+
+def test_claim_rechecks_the_memo(tmp_path: Path) -> None:
+    gen = _mk_gen(tmp_path / "g1", [24])
+    spec = json.loads((gen / "seed_0001" / "spec.json").read_text())
+    key = memo_key(spec, {}, None)
+
+    class _RacingMemo(EvalMemo):
+        # Another arm records the key just before our claim lands.
+        def claim(self, key: str) -> bool:
+            self.record(key, {"fitness_score": 0.5})
+            return super().claim(key)
+
+    memo = _RacingMemo(tmp_path / "memo")
+    plan = plan_submission(gen, memo, {}, None, claim=True)
+    assert plan.submit == [] and plan.reuse == {"seed_0001": None}
+    assert not memo.claimed(key)
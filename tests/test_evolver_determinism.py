@@ -61,3 +61,41 @@ def test_evolution_is_reproducible(tmp_path: Path) -> None:
     evolve(results_root, out2, gen_id="g001", root_seed=123, pop_size=2)
 
     assert _hash_tree(out1) == _hash_tree(out2)
+
+
+def _wide_spec(i: int) -> dict:
+    return {
+        "schema_version": "1.0",
+        "profile_id": f"profile_{i % 3}",
+        "params": {"place_6_8": 6 * i, "place_5_9": 5 * i, "odds_multiple": 1 + i % 4},
+        "toggles": {"bubble_mode": i % 2 == 0, f"flag_{i % 3}": True},
+    }
+
+
+def _wide_results(mk_results, root: Path) -> Path:
+    return mk_results(
+        root, n=10, spec=_wide_spec, fitness=lambda i: {"fitness_score": (i * 7 % 11) / 10}
+    )
+
+
+def test_parallel_offspring_match_serial(tmp_path: Path, fresh_context, mk_results) -> None:
+    results_root = _wide_results(mk_results, tmp_path / "g001_results")
+    evolve(results_root, tmp_path / "serial", gen_id="g001", root_seed=7, pop_size=24)
+    fresh_context.reset()
+    evolve(results_root, tmp_path / "pool", gen_id="g001", root_seed=7, pop_size=24, workers=3)
+
+    assert _hash_tree(tmp_path / "serial") == _hash_tree(tmp_path / "pool")
+
+
+def test_offspring_slots_ignore_global_rng_and_later_slots(
+    tmp_path: Path, fresh_context, mk_results
+) -> None:
+    results_root = _wide_results(mk_results, tmp_path / "g001_results")
+    seed_global(1)
+    small = evolve(results_root, tmp_path / "small", gen_id="g001", root_seed=7, pop_size=12)
+    fresh_context.reset()
+    seed_global(2)
+    large = evolve(results_root, tmp_path / "large", gen_id="g001", root_seed=7, pop_size=18)
+
+    # Same elite count (1) -> slot i depends only on its own stream.
+    assert [ind.spec for ind in small] == [ind.spec for ind in large[:12]]
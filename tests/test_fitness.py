@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 
 from evo import fitness
+from evo.io import report_parser
 
 
 def make_fake_run(tmp_path: Path, bankrolls=(1000, 1100, 950, 1200)):
@@ -31,3 +32,90 @@ def test_drawdown_and_pso_metrics(tmp_path: Path):
     data = json.loads(out_path.read_text())
     assert data["drawdown_max"] < 0
     assert 0 <= data["pso_rate"] <= 1
+
+
+def test_streaming_scan_matches_list_metrics(tmp_path: Path):
+    run_dir = tmp_path / "run" / "seed_0003"
+    run_dir.mkdir(parents=True)
+    rows = ["roll_id,hand_id,point,bankroll_after,pso_flag"]
+    bankrolls = [1000, 1010, "", 990, 1040, 1005, 1020, 980]
+    for i, bankroll in enumerate(bankrolls):
+        rows.append(f"{i},{i // 3},6,{bankroll},{'1' if i == 4 else '0'}")
+    (run_dir / "journal.csv").write_text("\n".join(rows))
+
+    journal = report_parser.read_journal_csv(run_dir)
+    parsed = [float(r["bankroll_after"]) for r in journal if r["bankroll_after"]]
+    summary = fitness.scan_journal(run_dir)
+    assert summary.rolls == len(journal)
+    assert summary.hands == len({r["hand_id"] for r in journal})
+    assert summary.drawdown == fitness.metric_drawdown(parsed)
+    assert summary.pso_rate == fitness.metric_pso_rate(journal)
+    assert (summary.bankroll_first, summary.bankroll_last) == (parsed[0], parsed[-1])
+
+    data = json.loads(fitness.compute_fitness(run_dir, "seed_0003").read_text())
+    assert data["rolls_played"] == 8 and data["hands_played"] == 3
+
+
+def test_array_path_matches_streaming(tmp_path: Path):
+    run_dir = make_fake_run(tmp_path, (1000, 1100, "oops", 950, 1200, 1180, 900))
+    arrays = fitness.load_journal_arrays(run_dir)
+    assert arrays["bankroll_after"].dtype.kind == "f" and arrays["pso_flag"].dtype == bool
+    assert fitness.summarize_arrays(arrays) == fitness.scan_journal(run_dir)
+
+    vectorized = json.loads(fitness.compute_fitness(run_dir, "seed_0001").read_text())
+    streamed = json.loads(fitness.compute_fitness(run_dir, "seed_0001", streaming=True).read_text())
+    assert vectorized == streamed
+
+
+def test_bulk_column_parse(tmp_path: Path):
+    run_dir = tmp_path / "run" / "seed_0004"
+    run_dir.mkdir(parents=True)
+    rows = ["hand_id,bankroll_after,pso_flag", "b,1000,0", "b,1e3,1", "a,,0", "c,990", "a,5,1"]
+    (run_dir / "journal.csv").write_text("\n".join(rows))
+    arrays = report_parser.read_journal_arrays(run_dir, ["hand_id", "bankroll_after", "pso_flag"])
+    assert arrays["hand_id"].tolist() == [0, 0, 1, 2, 1]
+    assert arrays["pso_flag"].tolist() == [False, True, False, False, True]
+    bankrolls = arrays["bankroll_after"]
+    assert bankrolls[[0, 1, 3, 4]].tolist() == [1000.0, 1000.0, 990.0, 5.0]
+    assert bankrolls[2] != bankrolls[2]  # NaN
+
+    assert fitness.registry.get("drawdown") is fitness.metric_drawdown
+    assert fitness.registry.get("drawdown")([1000.0, 1100.0, 950.0]) == -150.0
+    assert fitness.registry.get_array("drawdown").fn is fitness.array_drawdown
+
+
+def test_loadtxt_path_matches_csv_pass(tmp_path: Path):
+    run_dir = make_fake_run(tmp_path, (1000, 1100, 950.5, 1200, 980))
+    columns = ["hand_id", "bankroll_after", "pso_flag"]
+    journal = run_dir / "journal.csv"
+    journal.write_text(journal.read_text().replace("\n3,", "\n1,"))  # hand 1 reappears
+    fast = report_parser._loadtxt_columns(journal, columns)
+    rows = list(zip(*report_parser.iter_journal_columns(run_dir, columns)))
+    for name, values in zip(columns, rows):
+        expected = report_parser._column_array(name, values)
+        assert fast[name].dtype == expected.dtype
+        assert fast[name].tolist() == expected.tolist()
+    assert fast["hand_id"].tolist() == [0, 1, 2, 1, 3]
+
+
+def test_hands_are_distinct_ids_on_every_path(tmp_path: Path):
+    # A hand id that comes back later is one hand, as in metric_pso_rate.
+    run_dir = tmp_path / "run" / "seed_0005"
+    run_dir.mkdir(parents=True)
+    rows = ["hand_id,bankroll_after,pso_flag"]
+    rows += [f"{h},{b},{p}" for h, b, p in zip("abacc", (1000, 1002, 1004, 1006, 1008), "01010")]
+    (run_dir / "journal.csv").write_text("\n".join(rows) + "\n")
+
+    journal = report_parser.read_journal_csv(run_dir)
+    assert fitness.metric_pso_rate(journal) == 2 / 3
+    summaries = [
+        fitness.summarize_arrays(fitness.load_journal_arrays(run_dir)),
+        fitness.scan_journal(run_dir),
+        fitness.scan_journal_parallel(run_dir, workers=1, chunk_bytes=1),
+    ]
+    for summary in summaries:
+        assert (summary.hands, summary.pso_rate) == (3, 2 / 3)
+    for streaming in (False, True):
+        data = json.loads(fitness.compute_fitness(run_dir, "seed_0005", streaming).read_text())
+        assert data["hands_played"] == 3 and data["pso_rate"] == 0.6667
+        assert data["fitness_score"] == 0.0707  # baseline list-metric result
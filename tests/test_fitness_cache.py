@@ -0,0 +1,104 @@
+import json
+import os
+from pathlib import Path
+
+from evo import fitness
+from evo.grading import grade_results_root
+from evo.io import bundles, fitness_cache
+from evo.io.fitness_cache import FitnessCache, input_hashes
+
+
+def _mk_run(root: Path, seed_id: str = "seed_0001", bankrolls=(1000, 1100, 950, 1200)) -> Path:
+    run_dir = root / "run" / seed_id
+    run_dir.mkdir(parents=True)
+    rows = ["hand_id,bankroll_after,pso_flag"]
+    rows += [f"{i},{b},{'1' if i == 2 else '0'}" for i, b in enumerate(bankrolls)]
+    (run_dir / "journal.csv").write_text("\n".join(rows))
+    return run_dir
+
+
+def test_cache_hit_skips_parsing(tmp_path: Path, monkeypatch):
+    cache = FitnessCache(tmp_path / "cache")
+    run_dir = _mk_run(tmp_path / "results")
+    first = json.loads(fitness.compute_fitness(run_dir, "seed_0001", cache=cache).read_text())
+
+    def _boom(*_a, **_k):
+        raise AssertionError("journal parsed on cache hit")
+
+    monkeypatch.setattr(fitness.report_parser, "read_journal_arrays", _boom)
+    monkeypatch.setattr(fitness.report_parser, "read_report_json", _boom)
+    second = json.loads(fitness.compute_fitness(run_dir, "seed_0001", cache=cache).read_text())
+    assert first == second
+
+
+def test_changed_journal_misses(tmp_path: Path):
+    cache = FitnessCache(tmp_path / "cache")
+    a = _mk_run(tmp_path / "a")
+    b = _mk_run(tmp_path / "b", bankrolls=(1000, 900, 800, 700))
+    fa = json.loads(fitness.compute_fitness(a, "seed_0001", cache=cache).read_text())
+    fb = json.loads(fitness.compute_fitness(b, "seed_0001", cache=cache).read_text())
+    assert fa["roi"] > 0 > fb["roi"]
+
+
+def test_input_hashes_prefer_bundle_checksums(tmp_path: Path):
+    root = tmp_path / "results"
+    run_dir = _mk_run(root)
+    bundles.write_checksums(root, ["run/seed_0001/journal.csv"])
+    recorded = bundles.read_checksums(root)["run/seed_0001/journal.csv"]
+    hashes = input_hashes(run_dir)
+    assert hashes == {"journal.csv": recorded, "report.json": "absent"}
+
+
+def test_rewritten_journal_ignores_stale_checksum(tmp_path: Path):
+    root = tmp_path / "results"
+    run_dir = _mk_run(root)
+    bundles.write_checksums(root, ["run/seed_0001/journal.csv"])
+    recorded = bundles.read_checksums(root)["run/seed_0001/journal.csv"]
+    journal = run_dir / "journal.csv"
+    journal.write_text(journal.read_text().replace("1200", "1300"))
+    st = (root / "run" / "checksums.txt").stat()
+    os.utime(journal, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    hashes = input_hashes(run_dir)
+    assert hashes["journal.csv"] != recorded
+    assert hashes["journal.csv"] == fitness_cache._hash_path(journal)
+
+
+def test_same_size_rewrite_ignores_stale_contents_digest(tmp_path: Path):
+    root = tmp_path / "results"
+    run_dir = _mk_run(root)
+    bundles.write_contents_index(root)
+    rel = "run/seed_0001/journal.csv"
+    recorded = bundles.read_contents_index(root)[rel]["sha256"]
+    assert input_hashes(run_dir)["journal.csv"] == recorded
+
+    journal = run_dir / "journal.csv"
+    before = journal.stat().st_size
+    journal.write_text(journal.read_text().replace("1200", "1300"))
+    assert journal.stat().st_size == before
+    st = (root / "run" / "CONTENTS.json").stat()
+    os.utime(journal, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    fitness_cache._ROOT_INDEXES.clear()
+    hashes = input_hashes(run_dir)
+    assert hashes["journal.csv"] != recorded
+    assert hashes["journal.csv"] == fitness_cache._hash_path(journal)
+
+
+def test_root_index_parsed_once_per_root(tmp_path: Path, monkeypatch):
+    root = tmp_path / "results"
+    for i in range(1, 6):
+        _mk_run(root, f"seed_{i:04d}")
+    bundles.write_checksums(root, [f"run/seed_{i:04d}/journal.csv" for i in range(1, 6)])
+    calls = []
+    real = fitness_cache.read_checksums
+    monkeypatch.setattr(fitness_cache, "read_checksums", lambda d: calls.append(d) or real(d))
+    grade_results_root(root, workers=1, cache_dir=tmp_path / "cache")
+    assert len(calls) == 1
+
+
+def test_eviction_bounds_size(tmp_path: Path):
+    cache = FitnessCache(tmp_path / "cache", max_bytes=200)
+    for i in range(10):
+        cache.put(f"{i:064x}", {"seed_id": f"seed_{i:04d}", "fitness_score": i / 10})
+    assert cache.size_bytes() <= 200
+    assert cache.get(f"{9:064x}") is not None
+    assert cache.get(f"{0:064x}") is None
@@ -0,0 +1,93 @@
+"""Tests for the matrix genome layout and batch operators."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from evo.genome import GenomeSchema, crossover_batch, mutate_batch, vary
+
+
+def _specs() -> list[dict]:
+    return [
+        {
+            "schema_version": "1.0",
+            "profile_id": "contra_cruise",
+            "params": {"place_6_8": 24, "place_5_9": 20, "odds_multiple": 3, "regress_pct": 0.35},
+            "toggles": {"bubble_mode": False},
+        },
+        {
+            "schema_version": "1.0",
+            "profile_id": "iron_cross",
+            "params": {"place_6_8": 30, "place_5_9": 25, "odds_multiple": 2, "style": "hot"},
+            "toggles": {"bubble_mode": True, "hedge": False},
+        },
+    ]
+
+
+def test_encode_decode_round_trip() -> None:
+    specs = _specs()
+    schema = GenomeSchema.from_specs(specs)
+    batch = schema.encode(specs)
+    assert batch.params.shape == (2, 5) and batch.toggles.shape == (2, 2)
+    assert schema.decode(batch) == specs
+    kinds = {gene.name: gene.kind for gene in schema.params}
+    assert kinds == {
+        "odds_multiple": "int",
+        "place_5_9": "int",
+        "place_6_8": "int",
+        "regress_pct": "float",
+        "style": "category",
+    }
+    with pytest.raises(ValueError):
+        schema.encode([{"params": {"unknown": 1}}])
+
+
+def test_mutation_respects_steps_and_bounds() -> None:
+    specs = _specs() * 500
+    schema = GenomeSchema.from_specs(specs)
+    batch = schema.encode(specs)
+    children = schema.decode(mutate_batch(batch, 0.9, np.random.default_rng(1)))
+    for spec in children:
+        params = spec["params"]
+        assert params["place_6_8"] % 6 == 0 and params["place_5_9"] % 5 == 0
+        assert params["odds_multiple"] >= 1 and isinstance(params["odds_multiple"], int)
+        if "regress_pct" in params:
+            assert 0.0 <= params["regress_pct"] <= 1.0
+        assert params.get("style", "hot") == "hot"
+    assert len({c["params"]["place_6_8"] for c in children}) > 2
+
+
+@pytest.mark.parametrize("mode", ["uniform", "block"])
+def test_crossover_inherits_from_parents(mode: str) -> None:
+    specs = _specs()
+    schema = GenomeSchema.from_specs(specs)
+    batch = schema.encode(specs)
+    a, b = batch.take([0] * 200), batch.take([1] * 200)
+    children = schema.decode(crossover_batch(a, b, np.random.default_rng(2), mode))
+    for child in children:
+        assert child["schema_version"] == "1.0"
+        # Keys only one parent has are always inherited.
+        assert set(child["params"]) == set(specs[0]["params"]) | set(specs[1]["params"])
+        assert set(child["toggles"]) == {"bubble_mode", "hedge"}
+        for key, value in child["params"].items():
+            assert value in (specs[0]["params"].get(key), specs[1]["params"].get(key))
+        if mode == "block":
+            picks = {
+                child["params"][k] == specs[0]["params"][k] for k in ("place_6_8", "place_5_9")
+            }
+            assert len(picks) == 1
+    with pytest.raises(ValueError):
+        crossover_batch(a, b, np.random.default_rng(2), "arithmetic")
+
+
+def test_vary_is_deterministic() -> None:
+    specs = _specs()
+    schema = GenomeSchema.from_specs(specs)
+    batch = schema.encode(specs)
+    idx_a, idx_b = np.array([0, 1, 0, 1]), np.array([1, 0, 1, 0])
+    cx = np.array([True, False, True, False])
+    one = vary(batch, idx_a, idx_b, cx, 0.1, np.random.default_rng(9))
+    two = vary(batch, idx_a, idx_b, cx, 0.1, np.random.default_rng(9))
+    assert schema.decode(one) == schema.decode(two)
+    assert np.array_equal(one.params, two.params, equal_nan=True)
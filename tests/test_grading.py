@@ -0,0 +1,40 @@
+import csv
+import json
+from pathlib import Path
+
+from evo.grading import grade_results_root
+from evo.io.fitness_table import FITNESS_TABLE_NAME
+
+
+def _mk_results_root(root: Path, n: int = 5) -> Path:
+    for s in range(1, n + 1):
+        run_dir = root / "run" / f"seed_{s:04d}"
+        run_dir.mkdir(parents=True)
+        rows = ["hand_id,bankroll_after,pso_flag"]
+        for i in range(12):
+            bankroll = 1000 + ((i * 37 * s) % 200) - 100
+            rows.append(f"{i // 3},{bankroll},{'1' if (i + s) % 5 == 0 else '0'}")
+        (run_dir / "journal.csv").write_text("\n".join(rows))
+    return root
+
+
+def test_parallel_grading_matches_serial(tmp_path: Path):
+    serial_root = _mk_results_root(tmp_path / "serial")
+    pooled_root = _mk_results_root(tmp_path / "pooled")
+
+    serial_table = grade_results_root(serial_root, workers=1)
+    pooled_table = grade_results_root(pooled_root, workers=3)
+
+    assert serial_table.name == pooled_table.name == FITNESS_TABLE_NAME
+    assert serial_table.read_text() == pooled_table.read_text()
+    with pooled_table.open(newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["seed_id"] for r in rows] == [f"seed_{s:04d}" for s in range(1, 6)]
+    for r in rows:
+        fit = json.loads((pooled_root / "run" / r["seed_id"] / "fitness.json").read_text())
+        assert float(r["fitness_score"]) == fit["fitness_score"]
+
+
+def test_empty_results_root_writes_header_only(tmp_path: Path):
+    table = grade_results_root(tmp_path, workers=2)
+    assert table.read_text().strip().startswith("seed_id,fitness_score")
@@ -47,3 +47,18 @@ def test_file_lane_roundtrip(tmp_path: Path):
     rec = wait_file_done(cfg, req_id, timeout_s=5)
     assert rec["status"] == "ok"
     assert rec["request_id"] == req_id
+
+
+def test_roll_cap_gets_its_own_request_and_job_file(tmp_path: Path):
+    cfg = {"jobs_dir": tmp_path / "jobs"}
+    bundle = _mk_bundle(tmp_path)
+    bid = compute_sha256(bundle)
+    full = submit_file_job(cfg, bundle, "g010", 123, {})
+    short = submit_file_job(cfg, bundle, "g010", 123, {}, max_rolls=200)
+    longer = submit_file_job(cfg, bundle, "g010", 123, {}, max_rolls=400)
+    assert len({full, short, longer}) == 3
+    incoming = tmp_path / "jobs" / "incoming"
+    names = sorted(p.name for p in incoming.glob("*.job.json"))
+    assert names == sorted(f"{bid}{s}.job.json" for s in ("", ".rolls200", ".rolls400"))
+    job = json.loads((incoming / f"{bid}.rolls200.job.json").read_text())
+    assert job["request_id"] == short and job["max_rolls"] == 200
@@ -0,0 +1,81 @@
+"""Tests for fitness-first (lazy) population loading."""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from evo.evolver import breed_generation, evolve, load_population
+from evo.io.fitness_table import write_fitness_table
+from evo.population import LazyIndividual, canonical_spec_hash
+
+
+def _graded(mk_results, root: Path, n: int, table: bool = False) -> Path:
+    def fitness(i: int) -> dict:
+        return {"seed_id": f"seed_{i:04d}", "fitness_score": (i * 37 % 101) / 100, "roi": i / n}
+
+    mk_results(
+        root,
+        n,
+        spec=lambda i: {
+            "params": {"place_6_8": 6 * (i % 17 + 1), "odds_multiple": 2},
+            "toggles": {},
+        },
+        fitness=fitness,
+        dna=lambda i: {"evo_schema_version": "0.1", "ops_log": ["seeded"] * 50},
+    )
+    if table:
+        write_fitness_table(root / "run", [fitness(i) for i in range(1, n + 1)])
+    return root
+
+
+def _tree(out: Path) -> dict:
+    return {p.relative_to(out).as_posix(): p.read_bytes() for p in sorted(out.rglob("*.json"))}
+
+
+@pytest.mark.parametrize("table", [False, True])
+@pytest.mark.parametrize("kwargs", [{}, {"parent_selection": "sus", "workers": 2}])
+def test_lazy_evolve_matches_eager(
+    tmp_path: Path, table: bool, kwargs: dict, fresh_context, mk_results
+) -> None:
+    results = _graded(mk_results, tmp_path / "g0", 40, table=table)
+    evolve(results, tmp_path / "eager", "g0", 3, elite_ratio=0.05, **kwargs)
+    fresh_context.reset()
+    evolve(results, tmp_path / "lazy", "g0", 3, elite_ratio=0.05, lazy=True, **kwargs)
+    assert _tree(tmp_path / "lazy") == _tree(tmp_path / "eager")
+
+
+def test_lazy_population_reads_dna_only_for_chosen(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fresh_context, mk_results
+) -> None:
+    results = _graded(mk_results, tmp_path / "g0", 200, table=True)
+    pop = load_population(results, 0, lazy=True)
+    assert all(isinstance(ind, LazyIndividual) and not ind.loaded for ind in pop)
+    assert pop[0].metrics == {"fitness_score": 0.37, "roi": 0.005}
+    spec = json.loads((results / "seed_0001" / "spec.json").read_text())
+    assert pop[0].spec_hash == canonical_spec_hash(spec)
+
+    # Diversity hashes come from the table: only bred individuals open their spec.json.
+    spec_reads = []
+    read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        if self.name == "spec.json":
+            spec_reads.append(self.parent.name)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    bred = breed_generation(
+        pop, "g0", 3, spec_source=lambda sid: None, pop_size=20, parent_selection="sus"
+    )
+    assert len(bred.individuals) == 20
+    loaded = [ind for ind in pop if ind.loaded]
+    assert 0 < len(loaded) <= 40
+    assert 0 < len(set(spec_reads)) and set(spec_reads) <= {ind.seed_id for ind in loaded}
+    monkeypatch.undo()
+
+    clone = pickle.loads(pickle.dumps(pop[-1]))
+    assert not clone.loaded and clone.spec == pop[-1].spec
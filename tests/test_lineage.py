@@ -0,0 +1,62 @@
+"""Tests for the append-only lineage store and delta DNA."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from evo.context import GLOBAL_CONTEXT
+from evo.io.lineage import LineageStore
+from evo.runner import Evolution
+
+
+def _seeded_dna(i: int) -> dict:
+    return {"evo_schema_version": "0.1", "ops_log": ["seeded"]}
+
+
+def _run(results: Path, out: Path, lineage: LineageStore | None) -> list[dict]:
+    GLOBAL_CONTEXT.reset()
+    dnas = []
+    with Evolution.from_results(results, out, "g0", 11, lineage=lineage) as run:
+        for gen in range(5):
+            pop = run.step()
+            run.assign_fitness(
+                {ind.seed_id: (int(ind.seed_id[-4:]) * 7 + gen * 3) % 11 / 10 for ind in pop}
+            )
+            dnas.extend(ind.dna for ind in pop)
+    return dnas
+
+
+def test_history_reconstructs_the_full_ops_log(tmp_path: Path, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", n=6, dna=_seeded_dna)
+    full = _run(results, tmp_path / "full", None)
+    store = LineageStore(tmp_path / "lineage")
+    delta = _run(results, tmp_path / "delta", store)
+
+    assert len(full) == len(delta) == 30
+    reopened = LineageStore(tmp_path / "lineage" / "lineage.jsonl")
+    for legacy, compact in zip(full, delta):
+        assert compact["evo_schema_version"] == "0.3"
+        assert compact["parents"] == legacy["parents"]
+        assert compact["parent_hashes"] == legacy["parent_hashes"]
+        assert reopened.history(compact["lineage"]["ref"]) == legacy["ops_log"]
+
+    # Full logs grow with depth; past the first generation (which absorbs the seeded
+    # legacy log) delta DNA holds one operator's entries at most.
+    assert max(len(d["ops_log"]) for d in full[-6:]) > 5
+    assert all(len(d["ops_log"]) <= 2 for d in delta[6:])
+
+    last = delta[-1]["lineage"]["ref"]
+    ancestors = list(reopened.ancestors(last))
+    assert ancestors[0]["ref"] == last
+    assert {a["gen_id"] for a in ancestors} >= {"g1", "g5"}
+
+
+def test_dna_folders_carry_pointer_and_store_is_append_only(tmp_path: Path, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", n=6, dna=_seeded_dna)
+    store = LineageStore(tmp_path / "lineage")
+    _run(results, tmp_path / "delta", store)
+    lines = store.path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 30
+    on_disk = json.loads((tmp_path / "delta" / "g3" / "seed_0002" / "dna.json").read_text())
+    assert store.get(on_disk["lineage"]["ref"])["candidate_id"] == "seed_0002"
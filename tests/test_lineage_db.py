@@ -0,0 +1,144 @@
+"""Tests for the SQLite lineage/results database."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import zipfile
+from pathlib import Path
+
+from evo.context import GLOBAL_CONTEXT
+from evo.dna import spec_hash_from_bytes
+from evo.evolver import evolve
+from evo.grading import grade_results_root
+from evo.io.eval_memo import spec_digest
+from evo.io.lineage_db import LineageDB, import_tree, read_folder_files
+
+
+def _mk_g0(root: Path, n: int = 6) -> Path:
+    for s in range(1, n + 1):
+        sid = f"seed_{s:04d}"
+        (root / sid).mkdir(parents=True)
+        spec = {"schema_version": "1.0", "params": {"place_6_8": 6 * s}, "toggles": {}}
+        (root / sid / "spec.json").write_text(json.dumps(spec, indent=2))
+        (root / sid / "dna.json").write_text(json.dumps({"evo_schema_version": "0.1"}))
+        run_dir = root / "run" / sid
+        run_dir.mkdir(parents=True)
+        rows = ["hand_id,bankroll_after,pso_flag"]
+        rows += [f"{i // 2},{1000 + s * (i - 3) * 10},{'1' if i == s else '0'}" for i in range(8)]
+        (run_dir / "journal.csv").write_text("\n".join(rows))
+        (run_dir / "report.json").write_text(json.dumps({"bankroll_start": 1000}))
+    return root
+
+
+def _score(gen_dir: Path, results: Path) -> dict:
+    shutil.copytree(gen_dir, results)
+    payloads = {}
+    for seed_dir in sorted(gen_dir.glob("seed_*")):
+        spec = json.loads((seed_dir / "spec.json").read_text())
+        payload = {"seed_id": seed_dir.name, "fitness_score": spec["params"]["place_6_8"] / 100}
+        (results / "run" / seed_dir.name).mkdir(parents=True)
+        (results / "run" / seed_dir.name / "fitness.json").write_text(json.dumps(payload))
+        payloads[seed_dir.name] = payload
+    return payloads
+
+
+def _campaign(tmp: Path, db: LineageDB) -> Path:
+    GLOBAL_CONTEXT.reset()
+    tree = tmp / "tree"
+    src = _mk_g0(tree / "g0")
+    grade_results_root(src, workers=1, lineage_db=db)
+    db.add_generation(read_folder_files(src), gen_id="g0")
+    for gen in range(1, 4):
+        out = tree / f"g{gen:03d}"
+        evolve(src, out, f"g{gen - 1}", 7, elite_ratio=0.34, lineage_db=db)
+        src = tree / f"g{gen:03d}_results"
+        db.add_results(src, _score(out, src))
+    return tree
+
+
+def _dump(db: LineageDB) -> dict:
+    return {
+        table: db.query(f"SELECT * FROM {table} ORDER BY run, generation, seed_id")
+        for table in ("individuals", "parents", "fitness")
+    }
+
+
+def test_live_hooks_match_backfill(tmp_path: Path) -> None:
+    with LineageDB(tmp_path / "live.sqlite") as live:
+        tree = _campaign(tmp_path, live)
+        with LineageDB(tmp_path / "backfill.sqlite") as backfill:
+            counts = import_tree(backfill, [tree], workers=2)
+            assert counts["sources"] == 7
+            assert _dump(backfill) == _dump(live)
+        generations = live.query("SELECT DISTINCT generation FROM fitness ORDER BY 1")
+        assert [r["generation"] for r in generations] == [0, 1, 2, 3]
+
+
+def test_ancestors_and_operator_efficacy(tmp_path: Path) -> None:
+    with LineageDB(tmp_path / "lineage.sqlite") as db:
+        _campaign(tmp_path, db)
+        best = db.query(
+            "SELECT seed_id FROM fitness WHERE generation = 3 ORDER BY fitness_score DESC"
+        )[0]["seed_id"]
+        ancestors = db.ancestors(3, best)
+        assert ancestors[0]["depth"] == 0 and ancestors[0]["seed_id"] == best
+        assert {a["generation"] for a in ancestors} == {0, 1, 2, 3}
+        near = db.ancestors(3, best, max_depth=1)
+        assert {(a["depth"], a["generation"]) for a in near[1:]} == {(1, 2)}
+
+        efficacy = {row["operator"]: row for row in db.operator_efficacy()}
+        assert "elite" in efficacy and efficacy["root"]["children"] == 6
+        assert {"crossover", "mutation"} & set(efficacy)
+        assert sum(row["children"] for row in efficacy.values()) == 24
+
+
+def test_backfill_reads_bundles(tmp_path: Path) -> None:
+    with LineageDB(tmp_path / "live.sqlite") as live:
+        tree = _campaign(tmp_path, live)
+    results = tree / "g002_results"
+    bundles = tmp_path / "bundles"
+    bundles.mkdir()
+    with zipfile.ZipFile(bundles / "g002_results.zip", "w") as zf:
+        for p in sorted(results.rglob("*")):
+            if p.is_file():
+                zf.write(p, p.relative_to(results).as_posix())
+    with LineageDB(tmp_path / "zip.sqlite") as db:
+        assert import_tree(db, [bundles], workers=1)["fitness"] == 6
+        assert {r["generation"] for r in db.query("SELECT generation FROM individuals")} == {2}
+
+
+def test_elite_links_only_its_own_seed_and_roots_are_not_elites(tmp_path: Path) -> None:
+    spec = json.dumps({"params": {"place_6_8": 12}}).encode()
+    g0 = {f"seed_000{s}/spec.json": spec for s in (1, 2)}
+    g1 = {
+        "seed_0001/spec.json": spec,
+        "seed_0001/dna.json": json.dumps({"parents": [], "elite_of": "seed_0002"}).encode(),
+    }
+    with LineageDB(tmp_path / "lineage.sqlite") as db:
+        db.add_generation(g0, gen_id="g0")
+        db.add_generation(g1, gen_id="g1")
+        ancestors = db.ancestors(1, "seed_0001")
+        assert [(a["generation"], a["seed_id"]) for a in ancestors] == [
+            (1, "seed_0001"),
+            (0, "seed_0002"),
+        ]
+        assert [a["operator"] for a in ancestors] == ["elite", "root"]
+
+
+def test_spec_hash_ignores_identity_but_edges_keep_raw_digests(tmp_path: Path) -> None:
+    spec = {"schema_version": "1.0", "params": {"place_6_8": 12}, "toggles": {}}
+    raw = json.dumps({**spec, "identity": {"seed_id": "seed_0001"}}).encode()
+    g0 = {"seed_0001/spec.json": raw}
+    g1 = {
+        "seed_0001/spec.json": json.dumps({**spec, "identity": {"seed_id": "x"}}).encode(),
+        "seed_0001/dna.json": json.dumps({"parents": [], "elite_of": "seed_0001"}).encode(),
+        "seed_0002/spec.json": json.dumps(spec, indent=2).encode(),
+    }
+    with LineageDB(tmp_path / "lineage.sqlite") as db:
+        db.add_generation(g0, gen_id="g0")
+        db.add_generation(g1, gen_id="g1")
+        hashes = {r["spec_hash"] for r in db.query("SELECT spec_hash FROM individuals")}
+        assert hashes == {spec_digest(spec)}
+        edge = db.query("SELECT parent_hash FROM parents")[0]
+        assert edge["parent_hash"] == spec_hash_from_bytes(g1["seed_0001/spec.json"])
@@ -0,0 +1,183 @@
+"""Tests for the local dice-engine interop lane."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from evo.grading import grade_results_root
+from evo.interop import await_completion, submit_job
+from evo.interop.dice import TableRules, roll_dice, simulate
+from evo.interop.evaluator import LaneEvaluator, evaluate_folder
+from evo.io.bundles import write_bundle_zip
+
+_PAY = {4: 2.0, 5: 1.5, 6: 1.2, 8: 1.2, 9: 1.5, 10: 2.0}
+
+
+def _spec(i: int) -> dict:
+    return {
+        "schema_version": "1.0",
+        "profile_id": "contra_cruise",
+        "params": {
+            "place_6_8": 6 * (i % 4),
+            "place_5_9": 5 * (i % 3),
+            "odds_multiple": i % 3,
+            "regress_pct": 0.5 if i % 2 else 0.0,
+        },
+        "toggles": {},
+    }
+
+
+def _reference_pnl(spec: dict, totals: list[int], line: float = 10.0) -> list[float]:
+    """One spec, roll by roll over every shoe's dice back to back."""
+    p = spec["params"]
+    odds = line * p["odds_multiple"]
+    keep = 1 - p["regress_pct"]
+    small = {6: round(p["place_6_8"] * keep / 6) * 6, 5: round(p["place_5_9"] * keep / 5) * 5}
+    point, regressed, out = 0, False, []
+    for s in totals:
+        size68 = small[6] if regressed else p["place_6_8"]
+        size59 = small[5] if regressed else p["place_5_9"]
+        bets = {6: size68, 8: size68, 5: size59, 9: size59}
+        pnl = 0.0
+        if not point:
+            if s in (7, 11):
+                pnl = line
+            elif s in (2, 3, 12):
+                pnl = -line
+            else:
+                point = s
+        elif s == 7:
+            pnl = -line - odds - sum(v for n, v in bets.items() if n != point)
+            point, regressed = 0, False
+        elif s == point:
+            pnl = line + odds * _PAY[s]
+            point = 0
+        elif s in bets and bets[s] > 0:
+            pnl = bets[s] * (7 / 6 if s in (6, 8) else 7 / 5)
+            regressed = regressed or keep < 1
+        out.append(pnl)
+    return out
+
+
+def test_engine_matches_reference() -> None:
+    specs = [_spec(i) for i in range(12)]
+    run = simulate(specs, seed=3, shoes=3, rolls=60, rules=TableRules(bankroll=1e6))
+    totals = roll_dice(3, 3, 60).sum(axis=2).ravel()
+    # Both shoe boundaries fall mid-hand: the open bets settle in the next shoe.
+    assert (run.point[:, [60, 120]] == 8).all()
+    for i, spec in enumerate(specs):
+        pnl = _reference_pnl(spec, totals.tolist())
+        assert np.allclose(run.bankroll_after[i], 1e6 + np.cumsum(pnl))
+        assert run.early_stop[i] is None and run.stops[i] == 180
+    # Hand ids run across shoes and only advance on a seven-out; every spec sees the
+    # same dice. Chunking the specs changes nothing.
+    seven_out = (run.point[0] > 0) & (totals == 7)
+    assert np.array_equal(run.hand_id[0, 1:], np.cumsum(seven_out)[:-1])
+    assert np.array_equal(run.hand_id[0], run.hand_id[5])
+    chunked = simulate(specs, seed=3, shoes=3, rolls=60, rules=TableRules(1e6), chunk_specs=5)
+    for name in ("hand_id", "point", "bankroll_after", "pso_flag", "stops"):
+        assert np.array_equal(getattr(chunked, name), getattr(run, name))
+
+
+def test_bankroll_truncation_and_max_rolls() -> None:
+    specs = [_spec(3), {"params": {"place_6_8": 600}}]
+    run = simulate(specs, seed=1, shoes=4, rolls=500, rules=TableRules(bankroll=150.0))
+    assert run.early_stop[1] == "min_bet_unaffordable" and run.stops[1] == 0
+    # Spec 0 needs 10 + 2 * 18 on the table; it stops at the first come-out short of that.
+    stop = int(run.stops[0])
+    assert run.early_stop[0] == "min_bet_unaffordable" and 0 < stop < 2000
+    assert run.point[0, stop] == 0 and run.bankroll_after[0, stop - 1] < 46
+    assert (run.bankroll_after[0, : stop - 1][run.point[0, 1:stop] == 0] >= 46).all()
+    assert len(run.journal(0)["hand_id"]) == stop
+    capped = simulate(specs, seed=1, shoes=4, rolls=500, max_rolls=50)
+    assert capped.stops.max() <= 50 and len(capped.dice) == 500
+
+
+def _mk_bundle(root: Path, n: int = 6) -> Path:
+    gen = root / "g001"
+    for i in range(1, n + 1):
+        sid = f"seed_{i:04d}"
+        (gen / sid).mkdir(parents=True)
+        (gen / sid / "spec.json").write_text(json.dumps(_spec(i), indent=2))
+        (gen / sid / "dna.json").write_text(json.dumps({"evo_schema_version": "0.1"}))
+    return write_bundle_zip(gen, root / "g001.zip", deterministic=True)
+
+
+def test_local_lane_grades_like_csc(tmp_path: Path) -> None:
+    bundle = _mk_bundle(tmp_path)
+    flags = {"shoes": 3, "rolls_per_shoe": 400}
+    results = LaneEvaluator({"mode": "local", "local_dir": str(tmp_path / "a")}, 5, flags)(
+        bundle, "g001"
+    )
+    run_dir = results / "run"
+    for name in ("checksums.txt", "CONTENTS.json"):
+        assert (run_dir / name).exists()
+    assert (results / "meta" / "bundle.json").exists()
+    assert (results / "seed_0001" / "dna.json").exists()
+    report = json.loads((run_dir / "seed_0001" / "report.json").read_text())
+    assert report["bankroll_start"] == 1000.0 and "early_stop_reason" in report
+
+    grade_results_root(results)
+    fitness = json.loads((run_dir / "seed_0002" / "fitness.json").read_text())
+    report = json.loads((run_dir / "seed_0002" / "report.json").read_text())
+    assert fitness["rolls_played"] == report["rolls"] > 0
+    assert fitness["bankroll_final"] == report["bankroll_final"]
+
+    # Same bundle, seed and flags elsewhere: identical journals.
+    again = LaneEvaluator({"mode": "local", "local_dir": str(tmp_path / "b")}, 5, flags)(
+        bundle, "g001"
+    )
+    for journal in sorted(run_dir.glob("seed_*/journal.csv")):
+        twin = again / "run" / journal.parent.name / "journal.csv"
+        assert journal.read_bytes() == twin.read_bytes()
+
+
+def test_local_receipts(tmp_path: Path) -> None:
+    bundle = _mk_bundle(tmp_path, n=2)
+    cfg = {"mode": "local", "local_dir": str(tmp_path / "runs")}
+    handle = submit_job(cfg, bundle, "g001", 9, {"shoes": 1, "rolls_per_shoe": 50})
+    rec = await_completion(cfg, handle, 10)
+    assert rec["status"] == "ok" and rec["summary"]["seeds"] == 2
+    assert submit_job(cfg, bundle, "g001", 9, {"rolls_per_shoe": 50, "shoes": 1}) == handle
+
+    empty = tmp_path / "empty.zip"
+    write_bundle_zip(tmp_path / "runs" / "done", empty, deterministic=True)
+    rec = await_completion(cfg, submit_job(cfg, empty, "g001", 9, {}), 10)
+    assert rec["status"] == "error" and rec["error_code"] == "LOCAL_SIM_FAILED"
+    assert await_completion(cfg, "evo-missing", 10)["error_code"] == "UNKNOWN_REQUEST"
+
+
+def test_local_request_id_covers_roll_budget_and_knobs(tmp_path: Path) -> None:
+    bundle = _mk_bundle(tmp_path, n=2)
+    cfg = {"mode": "local", "local_dir": str(tmp_path / "runs")}
+    flags = {"shoes": 2, "rolls_per_shoe": 300}
+    short = await_completion(cfg, submit_job(cfg, bundle, "g001", 4, flags, max_rolls=50), 10)
+    long = await_completion(cfg, submit_job(cfg, bundle, "g001", 4, flags, max_rolls=200), 10)
+    assert short["request_id"] != long["request_id"]
+    assert short["results_root"] != long["results_root"]
+    assert short["summary"]["rolls"] <= 2 * 50 < long["summary"]["rolls"]
+    for sid in ("seed_0001", "seed_0002"):
+        rows = [
+            len((Path(rec["results_root"]) / "run" / sid / "journal.csv").read_text().splitlines())
+            for rec in (short, long)
+        ]
+        assert rows[0] < rows[1]
+
+    # Defaults spelled out are the same run; another table setting is not.
+    same = submit_job(cfg, bundle, "g001", 4, {**flags, "bankroll": 1000}, max_rolls=50)
+    assert same == short["request_id"]
+    assert submit_job(cfg, bundle, "g001", 4, {**flags, "line_bet": 5}, 50) != same
+
+
+def test_evaluate_folder_bundles_and_grades(tmp_path: Path) -> None:
+    _mk_bundle(tmp_path, n=3)
+    evaluate = LaneEvaluator({"mode": "local", "local_dir": str(tmp_path / "runs")}, 2)
+    bundle = tmp_path / "bundles" / "g001.zip"
+    results = evaluate_folder(evaluate, tmp_path / "g001", bundle, "g001", max_rolls=40)
+    assert bundle.exists() and (bundle.parent / "interop_manifest.json").exists()
+    for sid in ("seed_0001", "seed_0002", "seed_0003"):
+        fitness = json.loads((results / "run" / sid / "fitness.json").read_text())
+        assert 0 < fitness["rolls_played"] <= 40
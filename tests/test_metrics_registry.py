@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from evo import fitness  # noqa: F401  (registers the fitness graph)
+from evo.metrics import registry
+
+
+def test_shared_intermediate_materialized_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(registry, "_INTERMEDIATES", dict(registry._INTERMEDIATES))
+    monkeypatch.setattr(registry, "_ARRAY_METRICS", dict(registry._ARRAY_METRICS))
+
+    @registry.intermediate("t_doubled", requires=("x",))
+    def _doubled(x):
+        calls.append(1)
+        return x * 2
+
+    @registry.register("t_sum", requires=("t_doubled",))
+    def _sum(t_doubled):
+        return float(t_doubled.sum())
+
+    @registry.register("t_max", requires=("t_doubled", "t_sum"))
+    def _max(t_doubled, t_sum):
+        return float(t_doubled.max()) / t_sum
+
+    assert registry.columns_for(["t_max"]) == ("x",)
+    out = registry.evaluate(["t_sum", "t_max"], {"x": np.arange(4.0)})
+    assert out == {"t_sum": 12.0, "t_max": 0.5}
+    assert len(calls) == 1
+
+
+def test_cycle_and_unknown_names_rejected(monkeypatch):
+    monkeypatch.setattr(registry, "_INTERMEDIATES", dict(registry._INTERMEDIATES))
+    registry.intermediate("t_a", requires=("t_b",))(lambda t_b: t_b)
+    registry.intermediate("t_b", requires=("t_a",))(lambda t_a: t_a)
+    with pytest.raises(ValueError):
+        registry.plan(["t_a"])
+    with pytest.raises(KeyError):
+        registry.plan(["no_such_metric"])
+
+
+def test_fitness_graph_columns_and_hand_pnl():
+    assert set(registry.columns_for(fitness.SUMMARY_NODES)) == {
+        "bankroll_after",
+        "hand_id",
+        "pso_flag",
+    }
+    arrays = {
+        "bankroll_after": np.array([1000.0, 1010.0, np.nan, 990.0, 1040.0]),
+        "hand_id": np.array([0, 0, 1, 1, 2]),
+        "pso_flag": np.array([False, False, False, True, False]),
+    }
+    out = registry.evaluate(["hand_pnl", "pso_rate"], arrays)
+    np.testing.assert_array_equal(out["hand_pnl"], [10.0, -20.0, 50.0])
+    assert out["pso_rate"] == 1 / 3
+
+    # Rolls before the first parseable bankroll leave their hands flat, not NaN.
+    arrays["bankroll_after"] = np.array([np.nan, np.nan, np.nan, 990.0, 1040.0])
+    pnl = registry.evaluate(["hand_pnl"], arrays)["hand_pnl"]
+    np.testing.assert_array_equal(pnl, [0.0, 0.0, 50.0])
+    arrays["bankroll_after"] = np.full(5, np.nan)
+    np.testing.assert_array_equal(registry.evaluate(["hand_pnl"], arrays)["hand_pnl"], [0, 0, 0])
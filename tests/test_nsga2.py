@@ -0,0 +1,108 @@
+"""Tests for non-dominated sorting, crowding distance and NSGA-II selection."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from evo.evolver import evolve
+from evo.population import Individual
+from evo.selection import crowding_distance, non_dominated_sort, nsga2_key, objective_matrix
+
+
+def _naive_ranks(F: np.ndarray) -> np.ndarray:
+    n = len(F)
+    dominates = np.array(
+        [[bool(np.all(F[i] <= F[j]) and np.any(F[i] < F[j])) for j in range(n)] for i in range(n)]
+    )
+    ranks = np.full(n, -1)
+    remaining = set(range(n))
+    front = 0
+    while remaining:
+        current = [j for j in remaining if not any(dominates[i, j] for i in remaining)]
+        for j in current:
+            ranks[j] = front
+        remaining -= set(current)
+        front += 1
+    return ranks
+
+
+@pytest.mark.parametrize("m", [2, 3, 4])
+def test_non_dominated_sort_matches_naive(m: int) -> None:
+    rng = np.random.default_rng(m)
+    # Rounded values force ties and exact duplicates.
+    F = np.round(rng.normal(size=(120, m)), 1)
+    assert np.array_equal(non_dominated_sort(F), _naive_ranks(F))
+
+
+def test_crowding_distance_boundaries_and_interior() -> None:
+    F = np.array([[0.0, 4.0], [1.0, 2.0], [2.0, 1.0], [4.0, 0.0]])
+    ranks = non_dominated_sort(F)
+    assert ranks.tolist() == [0, 0, 0, 0]
+    dist = crowding_distance(F, ranks)
+    assert np.isinf(dist[0]) and np.isinf(dist[3])
+    assert dist[1] == pytest.approx(2 / 4 + 3 / 4)
+    assert dist[2] == pytest.approx(3 / 4 + 2 / 4)
+
+
+def test_objective_senses_and_missing_values() -> None:
+    pop = [
+        Individual("a", 0, {}, {}, 0.0, metrics={"roi": 0.1, "pso_rate": 0.2}),
+        Individual("b", 0, {}, {}, 0.0, metrics={"roi": 0.3}),
+    ]
+    F = objective_matrix(pop, ["roi", "pso_rate"])
+    assert F[:, 0].tolist() == [-0.1, -0.3]
+    assert F[0, 1] == 0.2 and np.isinf(F[1, 1])
+    key = nsga2_key(pop, ["roi", "pso_rate"])
+    assert key(pop[0])[0] == 0 and key(pop[1])[0] == 0
+
+
+# (fitness_score, roi, drawdown_max, pso_rate) of seeds 1..4.
+_METRICS = [
+    (0.9, 0.5, -50.0, 0.30),  # best scalar score, dominated
+    (0.1, 0.6, -10.0, 0.05),  # dominates seed_0001
+    (0.2, 0.2, -5.0, 0.20),
+    (0.0, -0.1, -80.0, 0.40),
+]
+
+
+def _graded(mk_results, root: Path) -> Path:
+    def fitness(i: int) -> dict:
+        score, roi, dd, pso = _METRICS[i - 1]
+        return {
+            "fitness_score": score,
+            "roi": roi,
+            "drawdown_max": dd,
+            "pso_rate": pso,
+            "seed_id": f"seed_{i:04d}",
+        }
+
+    return mk_results(
+        root,
+        len(_METRICS),
+        spec=lambda i: {"params": {"place_6_8": 24, "odds_multiple": 3, "regress_pct": 0.3}},
+        fitness=fitness,
+        dna=lambda i: {"identity": {}},
+    )
+
+
+def test_evolve_nsga2_elites_come_from_first_front(tmp_path: Path, mk_results) -> None:
+    results = _graded(mk_results, tmp_path / "results")
+    out = tmp_path / "out"
+    pop = evolve(results, out, "g0", 7, pop_size=4, elite_ratio=0.5, selection="nsga2")
+    manifest = json.loads((out / "population_manifest.json").read_text())
+    assert manifest["selection"] == {
+        "method": "nsga2",
+        "objectives": ["roi", "drawdown_max", "pso_rate"],
+    }
+    # seed_0001 has the best scalar score but is dominated by seed_0002.
+    assert {ind.seed_id for ind in pop[:2]} == {"seed_0002", "seed_0003"}
+
+
+def test_evolve_rejects_unknown_selection(tmp_path: Path, mk_results) -> None:
+    results = _graded(mk_results, tmp_path / "results")
+    with pytest.raises(ValueError):
+        evolve(results, tmp_path / "out", "g0", 7, selection="lexicase")
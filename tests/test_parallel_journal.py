@@ -0,0 +1,54 @@
+import random
+from pathlib import Path
+
+from evo import fitness
+from evo.io import report_parser
+
+
+def _mk_walk(tmp_path: Path, n: int = 600, seed: int = 11) -> Path:
+    rng = random.Random(seed)
+    run_dir = tmp_path / "run" / "seed_0001"
+    run_dir.mkdir(parents=True)
+    rows = ["roll,hand_id,bankroll_after,pso_flag"]
+    bankroll, hand = 1000.0, 0
+    for i in range(n):
+        bankroll += rng.choice((-30, -12, -6, 0, 7, 14, 35)) + rng.random()
+        value = "" if i % 97 == 5 else f"{bankroll:.3f}"
+        pso = "1" if rng.random() < 0.08 else "0"
+        rows.append(f"{i},{hand},{value},{pso}")
+        if rng.random() < 0.3:
+            hand += 1
+    (run_dir / "journal.csv").write_text("\r\n".join(rows) + "\r\n")
+    return run_dir
+
+
+def test_byte_ranges_cover_every_row(tmp_path: Path):
+    run_dir = _mk_walk(tmp_path, n=50)
+    journal = run_dir / "journal.csv"
+    header, ranges = report_parser.split_journal_ranges(journal, chunk_bytes=37)
+    assert header == ["roll", "hand_id", "bankroll_after", "pso_flag"]
+    assert ranges[-1][1] == journal.stat().st_size
+    rows = [
+        row
+        for a, b in ranges
+        for row in report_parser.iter_journal_range(journal, a, b, header, ["roll"])
+    ]
+    assert [r[0] for r in rows] == [str(i) for i in range(50)]
+
+
+def test_parallel_scan_matches_serial_for_any_chunking(tmp_path: Path):
+    run_dir = _mk_walk(tmp_path)
+    serial = fitness.scan_journal(run_dir)
+    for chunk_bytes in (1, 64, 333, 2048, 1 << 20):
+        assert fitness.scan_journal_parallel(run_dir, workers=1, chunk_bytes=chunk_bytes) == serial
+    assert fitness.scan_journal_parallel(run_dir, workers=3, chunk_bytes=500) == serial
+
+
+def test_drawdown_uses_peak_carried_from_earlier_chunk():
+    early = fitness.summarize_partial([("1200", "0", "0"), ("1100", "0", "0")])
+    late = fitness.summarize_partial([("900", "1", "0"), ("1150", "1", "0"), ("1000", "2", "0")])
+    merged = fitness.merge_partials([early, late])
+    rows = [("1200", "0", "0"), ("1100", "0", "0"), ("900", "1", "0")]
+    rows += [("1150", "1", "0"), ("1000", "2", "0")]
+    assert merged == fitness.summarize_journal(rows)
+    assert merged.drawdown == -300.0 and merged.hands == 3
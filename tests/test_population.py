@@ -0,0 +1,68 @@
+"""Tests for the copy-on-write Individual."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from evo.io.export import write_generation_folder
+from evo.mutation import crossover_individuals, mutate_individual
+from evo.population import Individual, numeric_fields
+
+
+def _ind(seed_id: str = "seed_0001") -> Individual:
+    spec = {
+        "schema_version": "1.0",
+        "profile_id": "contra_cruise",
+        "params": {"place_6_8": 24, "place_5_9": 20, "odds_multiple": 3},
+        "toggles": {"bubble_mode": False},
+        "identity": {"source": "seed"},
+    }
+    dna = {"evo_schema_version": "0.1", "ops_log": [], "identity": {"gen_id": "g0"}}
+    return Individual(seed_id=seed_id, generation=0, spec=spec, dna=dna, fitness=0.5)
+
+
+def test_individual_is_slotted_and_clone_shares_state() -> None:
+    ind = _ind()
+    assert not hasattr(ind, "__dict__")
+    twin = ind.clone()
+    assert twin.spec is ind.spec and twin.dna is ind.dna
+    assert twin.parents is not ind.parents
+
+
+def test_operators_leave_parents_untouched() -> None:
+    parent = _ind()
+    before = json.dumps([parent.spec, parent.dna], sort_keys=True)
+    child = mutate_individual(parent, nudge_frac=0.5)
+    assert child.spec is not parent.spec and child.dna is not parent.dna
+    assert child.spec["toggles"] is parent.spec["toggles"]
+    assert len(child.dna["ops_log"]) == 1
+    crossover_individuals(parent, _ind("seed_0002"))
+    assert json.dumps([parent.spec, parent.dna], sort_keys=True) == before
+
+
+def test_spec_hash_is_cached_until_spec_is_replaced() -> None:
+    ind = _ind()
+    first = ind.spec_hash
+    assert ind.spec_hash == first
+    ind.spec = {**ind.spec, "profile_id": "other"}
+    assert ind.spec_hash != first
+
+
+def test_export_does_not_write_through_shared_blocks(tmp_path: Path) -> None:
+    parent = _ind()
+    children = [parent.clone(), parent.clone()]
+    for i, child in enumerate(children, start=1):
+        child.seed_id = f"seed_{i:04d}"
+    write_generation_folder(tmp_path, "g1", children, elite_ids={"seed_0001"})
+    assert parent.spec["identity"] == {"source": "seed"}
+    assert parent.dna["identity"] == {"gen_id": "g0"}
+    spec2 = json.loads((tmp_path / "seed_0002" / "spec.json").read_text())
+    assert spec2["identity"]["candidate_id"] == "seed_0002"
+
+
+def test_numeric_fields_keeps_json_numbers_only() -> None:
+    payload = {"seed_id": "seed_0001", "roi": 1, "pso_rate": 0.25, "early": True, "x": None}
+    fields = numeric_fields(payload)
+    assert fields == {"roi": 1.0, "pso_rate": 0.25}
+    assert all(type(v) is float for v in fields.values())
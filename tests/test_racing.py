@@ -0,0 +1,98 @@
+import json
+import zipfile
+from pathlib import Path
+
+from evo.evolver import evolve, load_population
+from evo.io.eval_memo import MemoOptions
+from evo.racing import (
+    RaceRung,
+    budget_schedule,
+    race_generation,
+    rank_consistent_scores,
+    write_race_results,
+)
+from evo.rng import seed_global
+
+
+def _mk_gen(root: Path, n: int = 9) -> Path:
+    for i in range(1, n + 1):
+        sid = f"seed_{i:04d}"
+        (root / sid).mkdir(parents=True)
+        spec = {"schema_version": "1.0", "params": {"place_6_8": 6 * i}, "toggles": {}}
+        (root / sid / "spec.json").write_text(json.dumps(spec, indent=2))
+        (root / sid / "dna.json").write_text(json.dumps({"evo_schema_version": "0.1"}))
+    return root
+
+
+def _fake_csc(tmp_path: Path, calls: list):
+    """Simulate CSC: seed_i drifts by (i - 5) per roll for ``max_rolls`` rolls."""
+
+    def _evaluate(bundle: Path, label: str, max_rolls: int) -> Path:
+        calls.append((label, max_rolls))
+        out = tmp_path / "csc" / label
+        with zipfile.ZipFile(bundle) as zf:
+            seeds = sorted({n.split("/")[0] for n in zf.namelist() if n.startswith("seed_")})
+        for sid in seeds:
+            drift = int(sid[-4:]) - 5
+            run_dir = out / "run" / sid
+            run_dir.mkdir(parents=True)
+            rows = ["hand_id,bankroll_after,pso_flag"]
+            rows += [f"{r},{1000 + drift * (r + 1)},0" for r in range(max_rolls)]
+            (run_dir / "journal.csv").write_text("\n".join(rows))
+        return out
+
+    return _evaluate
+
+
+def test_budget_schedule_is_geometric_and_capped():
+    assert budget_schedule(100, 2000, eta=3) == [100, 300, 900, 2000]
+    assert budget_schedule(500, 500) == [500]
+
+
+def test_race_keeps_top_fraction_and_feeds_evolve(tmp_path: Path):
+    gen_dir = _mk_gen(tmp_path / "g001")
+    calls: list = []
+    result = race_generation(
+        gen_dir, _fake_csc(tmp_path, calls), tmp_path / "work", 10, 90, eta=3, workers=1
+    )
+    assert calls == [("g001_r0", 10), ("g001_r1", 30), ("g001_r2", 90)]
+    assert [len(r.seed_ids) for r in result.rungs] == [9, 3, 1]
+    assert result.rungs[-1].seed_ids == ["seed_0009"]
+    assert result.rolls_simulated < 9 * 90
+    assert result.ranking[:3] == ["seed_0009", "seed_0008", "seed_0007"]
+
+    out_root = tmp_path / "g001_results"
+    write_race_results(gen_dir, result, out_root)
+    pop = sorted(load_population(out_root, 1), key=lambda ind: -ind.fitness)
+    assert [ind.seed_id for ind in pop] == result.ranking
+    fit = json.loads((out_root / "run" / "seed_0001" / "fitness.json").read_text())
+    assert fit["race"]["rung"] == 0 and fit["race"]["max_rolls"] == 10
+
+    seed_global(5)
+    next_pop = evolve(out_root, tmp_path / "g002", gen_id="g001", root_seed=5, elite_ratio=0.12)
+    assert next_pop[0].spec == json.loads((gen_dir / "seed_0009" / "spec.json").read_text())
+
+
+def test_short_budget_luck_cannot_outrank_survivor():
+    rungs = [
+        RaceRung(10, ["a", "b", "c"], {"a": 0.9, "b": 0.5, "c": 0.4}),
+        RaceRung(30, ["a"], {"a": 0.1}),
+    ]
+    scores = rank_consistent_scores(rungs)
+    assert scores["a"] == 0.1
+    assert max(scores["b"], scores["c"]) < scores["a"]
+
+
+def test_race_with_memo_reuses_rung_evaluations(tmp_path: Path):
+    gen_dir = _mk_gen(tmp_path / "g001")
+    memo = MemoOptions(tmp_path / "memo", {"shoes": 1}, 5)
+    calls: list = []
+    first = race_generation(
+        gen_dir, _fake_csc(tmp_path, calls), tmp_path / "w1", 10, 90, workers=1, memo=memo
+    )
+    again: list = []
+    second = race_generation(
+        gen_dir, _fake_csc(tmp_path / "b", again), tmp_path / "w2", 10, 90, workers=1, memo=memo
+    )
+    assert len(calls) == 3 and again == []
+    assert second.scores == first.scores and second.ranking == first.ranking
@@ -0,0 +1,143 @@
+"""Tests for the resident-population Evolution runner."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from evo.evolver import evolve
+from evo.runner import Evolution
+
+
+def _fitness(score: float) -> dict:
+    return {"fitness_score": score, "roi": score / 2}
+
+
+def _seed_fitness(i: int) -> dict:
+    return _fitness(0.1 * i)
+
+
+def _write_fitness(root: Path, sid: str, score: float) -> None:
+    (root / "run" / sid).mkdir(parents=True, exist_ok=True)
+    (root / "run" / sid / "fitness.json").write_text(json.dumps(_fitness(score)), encoding="utf-8")
+
+
+def _score(sid: str, gen: int) -> float:
+    return round((int(sid[-4:]) * 7 + gen * 3) % 11 / 10, 4)
+
+
+def _folder_files(folder: Path) -> dict[str, bytes]:
+    return {
+        p.relative_to(folder).as_posix(): p.read_bytes()
+        for p in sorted(folder.rglob("*.json"))
+        if "run" not in p.relative_to(folder).parts
+    }
+
+
+def test_runner_matches_chained_evolve(tmp_path: Path, fresh_context, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", n=6, fitness=_seed_fitness)
+
+    disk = tmp_path / "disk"
+    src = results
+    for gen in range(3):
+        out = disk / f"g{gen + 1}"
+        evolve(src, out, f"g{gen}", 11, elite_ratio=0.34)
+        for seed_dir in sorted(out.glob("seed_*")):
+            _write_fitness(out, seed_dir.name, _score(seed_dir.name, gen + 1))
+        src = out
+
+    fresh_context.reset()
+    mem = tmp_path / "mem"
+    with Evolution.from_results(results, mem, "g0", 11, elite_ratio=0.34) as run:
+        for gen in range(3):
+            pop = run.step()
+            run.assign_fitness({ind.seed_id: _score(ind.seed_id, gen + 1) for ind in pop})
+
+    for gen in range(1, 4):
+        assert _folder_files(mem / f"g{gen}") == _folder_files(disk / f"g{gen}")
+
+
+def test_runner_requires_scores_and_reads_tables(tmp_path: Path, fresh_context, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", n=3, fitness=_seed_fitness)
+    with Evolution.from_results(results, tmp_path / "out", "g0", 5) as run:
+        pop = run.step()
+        with pytest.raises(RuntimeError):
+            run.step()
+        with pytest.raises(KeyError):
+            run.assign_fitness({"seed_9999": 1.0})
+        table = tmp_path / "res" / "run" / "fitness_table.csv"
+        table.parent.mkdir(parents=True)
+        rows = ["seed_id,fitness_score,roi"] + [f"{ind.seed_id},0.5,0.25" for ind in pop]
+        table.write_text("\n".join(rows) + "\n", encoding="utf-8")
+        run.load_fitness(tmp_path / "res")
+        assert all(ind.metrics == {"fitness_score": 0.5, "roi": 0.25} for ind in run.population)
+        run.step()
+        run.flush()
+        assert (tmp_path / "out" / "g2" / "population_manifest.json").exists()
+
+
+def test_step_renders_only_on_writer_thread(tmp_path: Path, monkeypatch, mk_results) -> None:
+    import threading
+
+    from evo.io import export
+
+    threads = []
+    real = export.render_generation_folder
+
+    def _render(*args, **kw):
+        threads.append(threading.current_thread().name)
+        return real(*args, **kw)
+
+    monkeypatch.setattr(export, "render_generation_folder", _render)
+    results = mk_results(tmp_path / "g0", n=6, fitness=_seed_fitness)
+    with Evolution.from_results(results, tmp_path / "out", "g0", 11) as run:
+        # Bred generations are never parsed back from their rendered JSON.
+        monkeypatch.setattr(json, "loads", lambda *_a, **_k: pytest.fail("parsed"))
+        for gen in range(1, 3):
+            pop = run.step()
+            run.assign_fitness({ind.seed_id: _score(ind.seed_id, gen) for ind in pop})
+    assert len(threads) == 2
+    assert all(name.startswith("evo-writer") for name in threads)
+
+
+def test_matrix_variation_is_byte_identical_across_runners(
+    tmp_path: Path, fresh_context, mk_results
+) -> None:
+    results = mk_results(tmp_path / "g0", n=8, fitness=_seed_fitness)
+    kw = {"elite_ratio": 0.25, "variation": "matrix"}
+
+    disk = tmp_path / "disk"
+    src = results
+    for gen in range(3):
+        out = disk / f"g{gen + 1}"
+        evolve(src, out, f"g{gen}", 5, workers=2, **kw)
+        for seed_dir in sorted(out.glob("seed_*")):
+            _write_fitness(out, seed_dir.name, _score(seed_dir.name, gen + 1))
+        src = out
+
+    fresh_context.reset()
+    mem = tmp_path / "mem"
+    with Evolution.from_results(results, mem, "g0", 5, **kw) as run:
+        for gen in range(3):
+            pop = run.step()
+            run.assign_fitness({ind.seed_id: _score(ind.seed_id, gen + 1) for ind in pop})
+    fresh_context.reset()
+
+    for gen in range(1, 4):
+        assert _folder_files(mem / f"g{gen}") == _folder_files(disk / f"g{gen}")
+    manifest = json.loads((disk / "g3" / "population_manifest.json").read_text())
+    assert manifest["variation"] == "matrix"
+    for spec_path in sorted((disk / "g3").glob("seed_*/spec.json")):
+        spec = json.loads(spec_path.read_text())
+        assert spec["params"]["place_6_8"] % 6 == 0 and spec["params"]["place_5_9"] % 5 == 0
+    dna = json.loads((disk / "g1" / "seed_0003" / "dna.json").read_text())
+    assert dna["ops_log"][-1]["type"] in ("crossover", "mutation")
+    # Elites are carried over untouched, so they render exactly as the dict path does.
+    evolve(results, tmp_path / "dict", "g0", 5, elite_ratio=0.25)
+    fresh_context.reset()
+    for rel in ("seed_0001/spec.json", "seed_0001/dna.json", "seed_0002/spec.json"):
+        assert (tmp_path / "dict" / rel).read_bytes() == (disk / "g1" / rel).read_bytes()
+    with pytest.raises(ValueError):
+        evolve(results, tmp_path / "bad", "g0", 5, variation="vector")
@@ -0,0 +1,115 @@
+"""Tests for the array-based parent selection engine."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from evo.context import GLOBAL_CONTEXT
+from evo.evolver import evolve
+from evo.population import Individual
+from evo.selection import (
+    elite_indices,
+    elitism,
+    rank_weights,
+    score_array,
+    select_parents,
+    sus,
+    tournament_batch,
+    truncation,
+)
+
+
+def test_elite_indices_match_elitism_with_ties() -> None:
+    rng = np.random.default_rng(0)
+    scores = np.round(rng.random(500), 1)  # many ties, including at the cut
+    pop = [Individual(f"s{i:04d}", 0, {}, {}, float(v)) for i, v in enumerate(scores)]
+    for k in (1, 7, 50, 500):
+        expected = [int(ind.seed_id[1:]) for ind in elitism(pop, k)]
+        assert elite_indices(scores, k).tolist() == expected
+
+
+def test_nan_scores_rank_last_and_empty_draws() -> None:
+    assert elite_indices(np.array([1.0, np.nan, 3.0]), 2).tolist() == [2, 0]
+    assert elite_indices(np.array([np.nan, 1.0, np.nan]), 3).tolist() == [1, 0, 2]
+    with np.errstate(all="raise"):
+        for method in ("sus", "rank", "batch_tournament", "truncation"):
+            picks = select_parents(method, np.arange(4.0), 0, np.random.default_rng(0))
+            assert picks.size == 0
+
+
+def test_nan_scores_lose_tournaments_and_get_no_weight() -> None:
+    scores = np.array([np.nan, 1.0, np.nan, 0.5])
+    picks = tournament_batch(scores, 2000, np.random.default_rng(4), k=2)
+    contestants = np.random.default_rng(4).integers(0, 4, size=(2000, 2))
+    # A NaN wins only when every contestant is NaN.
+    assert np.array_equal(np.isin(picks, [0, 2]), np.isin(contestants, [0, 2]).all(axis=1))
+    assert tournament_batch(np.array([np.nan, 1.0]), 1, np.random.default_rng(0), k=50)[0] == 1
+
+    assert rank_weights(scores, pressure=2.0).tolist() == [0.0, 2.0, 0.0, 0.0]
+    assert rank_weights(np.array([np.nan, 3.0, 1.0, 2.0])).tolist() == [0.0, 1.5, 0.5, 1.0]
+    with np.errstate(invalid="raise"):
+        counts = np.bincount(sus(np.array([np.nan, -1.0, 1.0]), 10, np.random.default_rng(2)))
+    assert counts.tolist() == [0, 0, 10]
+    uniform = sus(np.array([np.nan, 0.0, 0.0]), 4, np.random.default_rng(2))
+    assert np.bincount(uniform, minlength=3).tolist() == [0, 2, 2]
+    picks = select_parents("rank", scores, 50, np.random.default_rng(5))
+    assert not np.isin(picks, [0, 2]).any()
+
+
+def test_tournament_batch_is_deterministic_and_biased() -> None:
+    scores = np.arange(1000, dtype=float)
+    a = tournament_batch(scores, 5000, np.random.default_rng(3))
+    b = tournament_batch(scores, 5000, np.random.default_rng(3))
+    assert np.array_equal(a, b)
+    assert scores[a].mean() > 700  # E[max of 3 uniforms] = 0.75
+
+
+def test_sus_hits_expected_counts() -> None:
+    weights = np.array([1.0, 2.0, 3.0, 4.0, 0.0])
+    picks = sus(weights, 20, np.random.default_rng(1))
+    counts = np.bincount(picks, minlength=5)
+    assert counts.tolist() == [2, 4, 6, 8, 0]
+    uniform = sus(np.zeros(4), 8, np.random.default_rng(1))
+    assert np.bincount(uniform).tolist() == [2, 2, 2, 2]
+
+
+def test_rank_and_truncation() -> None:
+    scores = np.array([5.0, -3.0, 100.0, 5.0])
+    w = rank_weights(scores, pressure=2.0)
+    assert w.tolist() == pytest.approx([4 / 3, 0.0, 2.0, 2 / 3])
+    picks = truncation(scores, 100, np.random.default_rng(0), frac=0.5)
+    assert set(picks.tolist()) == {0, 2}
+    with pytest.raises(ValueError):
+        select_parents("roulette", scores, 3, np.random.default_rng(0))
+
+
+def test_score_array_ranks_tuple_keys() -> None:
+    pop = [Individual(s, 0, {}, {}, 0.0) for s in "abc"]
+    key = {"a": (0, 1.0), "b": (-1, 9.0), "c": (0, 1.0)}
+    assert score_array(pop, lambda ind: key[ind.seed_id]).tolist() == [1.0, 0.0, 1.0]
+
+
+def _evolve(results: Path, out: Path, method: str, workers: int | None = None) -> dict:
+    GLOBAL_CONTEXT.reset()
+    evolve(results, out, "g0", 5, parent_selection=method, workers=workers)
+    return {p.relative_to(out).as_posix(): p.read_bytes() for p in sorted(out.rglob("*.json"))}
+
+
+@pytest.mark.parametrize("method", ["batch_tournament", "sus", "rank", "truncation"])
+def test_evolve_with_array_selection_is_reproducible(
+    tmp_path: Path, method: str, mk_results
+) -> None:
+    results = mk_results(tmp_path / "g0", n=12)
+    serial = _evolve(results, tmp_path / "a", method)
+    assert _evolve(results, tmp_path / "b", method) == serial
+    assert _evolve(results, tmp_path / "c", method, workers=2) == serial
+    manifest = json.loads(serial["population_manifest.json"])
+    assert manifest["parent_selection"] == method
+    for name, data in serial.items():
+        if name.endswith("dna.json"):
+            parents = json.loads(data).get("parents", [])
+            assert all(p.startswith("seed_") for p in parents)
@@ -0,0 +1,122 @@
+"""Tests for asynchronous steady-state evolution."""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from evo.io.eval_memo import MemoOptions, memo_key
+from evo.steady_state import read_arrival_log, replay_steady_state, run_steady_state
+
+
+@dataclass
+class JitteryCSC:
+    """Scores by place_6_8 after a random delay, so results arrive out of submission order."""
+
+    root: Path
+    jitter_s: float = 0.0
+
+    def __call__(self, bundle: Path, label: str) -> Path:
+        if self.jitter_s:
+            time.sleep(random.random() * self.jitter_s)
+        out = self.root / label
+        with zipfile.ZipFile(bundle) as zf:
+            spec = json.loads(zf.read("seed_0001/spec.json"))
+        (out / "run" / "seed_0001").mkdir(parents=True)
+        score = round(spec["params"]["place_6_8"] / 100, 4)
+        (out / "run" / "seed_0001" / "fitness.json").write_text(
+            json.dumps({"fitness_score": score})
+        )
+        return out
+
+
+def _births(out: Path) -> dict:
+    return {p.parent.parent.name: p.read_bytes() for p in sorted(out.glob("b*/seed_0001/*.json"))}
+
+
+def test_steady_state_bounds_in_flight_and_logs_arrivals(
+    tmp_path: Path, fresh_context, mk_results
+) -> None:
+    results = mk_results(tmp_path / "g0", n=6)
+    out = tmp_path / "ss"
+    state = run_steady_state(
+        results, out, "g0", 7, JitteryCSC(tmp_path / "csc", 0.02), births=12, max_in_flight=3
+    )
+    start, order = read_arrival_log(out / "arrivals.jsonl")
+    assert start["max_in_flight"] == 3 and state.births == 12
+    assert sorted(order) == [f"b{i:06d}" for i in range(1, 13)]
+    assert len(state.population) == 6
+
+    # Never more than max_in_flight births outstanding.
+    outstanding = 0
+    for line in (out / "arrivals.jsonl").read_text().splitlines():
+        event = json.loads(line)["event"]
+        outstanding += {"birth": 1, "arrival": -1}.get(event, 0)
+        assert outstanding <= 3
+
+    manifest = json.loads((out / "b000001" / "population_manifest.json").read_text())
+    assert manifest["steady_state"] == {"birth_id": "b000001", "birth": 1}
+    dna = json.loads((out / "b000001" / "seed_0001" / "dna.json").read_text())
+    assert dna["identity"]["candidate_id"] == "b000001"
+
+
+def test_replay_matches_logged_arrival_order(tmp_path: Path, fresh_context, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", n=6)
+    out = tmp_path / "ss"
+    run_steady_state(
+        results, out, "g0", 7, JitteryCSC(tmp_path / "csc", 0.02), births=10, max_in_flight=4
+    )
+    fresh_context.reset()
+    replay = tmp_path / "replay"
+    state = replay_steady_state(
+        results, replay, "g0", out / "arrivals.jsonl", JitteryCSC(tmp_path / "csc2")
+    )
+    assert _births(replay) == _births(out)
+    assert (replay / "arrivals.jsonl").read_bytes() == (out / "arrivals.jsonl").read_bytes()
+    assert state.births == 10
+
+
+def test_memo_submits_each_spec_once(tmp_path: Path, fresh_context, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", n=6)
+    out = tmp_path / "ss"
+    memo = MemoOptions(tmp_path / "memo")
+    run_steady_state(
+        results,
+        out,
+        "g0",
+        7,
+        JitteryCSC(tmp_path / "csc", 0.02),
+        births=12,
+        max_in_flight=3,
+        memo=memo,
+    )
+    _, order = read_arrival_log(out / "arrivals.jsonl")
+    assert len(order) == 12
+    keys = {
+        memo_key(json.loads(p.read_text()), {}, None) for p in out.glob("b*/seed_0001/spec.json")
+    }
+    assert len(list((tmp_path / "csc").iterdir())) == len(keys)
+
+    # Every birth is memoized now: the replay reaches CSC not once.
+    fresh_context.reset()
+    replay = tmp_path / "replay"
+    replay_steady_state(
+        results, replay, "g0", out / "arrivals.jsonl", JitteryCSC(tmp_path / "csc2"), memo=memo
+    )
+    assert _births(replay) == _births(out) and not (tmp_path / "csc2").exists()
+
+
+def test_tournament_size_reaches_births(tmp_path: Path, fresh_context, mk_results) -> None:
+    results = mk_results(tmp_path / "g0", n=6)
+    out = tmp_path / "ss"
+    state = run_steady_state(
+        results, out, "g0", 7, JitteryCSC(tmp_path / "csc"), births=4, tournament_size=6
+    )
+    # A tournament over the whole population always picks its best member.
+    assert [e["parents"] for e in state.log if e["event"] == "birth"][:2] == [["seed_0006"]] * 2
+    start, _ = read_arrival_log(out / "arrivals.jsonl")
+    assert start["tournament_size"] == 6
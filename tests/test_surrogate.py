@@ -0,0 +1,116 @@
+"""Tests for surrogate pre-screening of offspring."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from evo.population import Individual
+from evo.runner import Evolution
+from evo.surrogate import Surrogate, spec_features
+
+
+def _spec(i: int) -> dict:
+    return {
+        "schema_version": "1.0",
+        "profile_id": "contra_cruise",
+        "params": {"place_6_8": 6 * (i % 9 + 1), "place_5_9": 5 * (i % 7 + 1), "odds_multiple": 2},
+        "toggles": {"bubble_mode": i % 2 == 0},
+    }
+
+
+def _truth(spec: dict) -> float:
+    p = spec["params"]
+    return round(
+        p["place_6_8"] / 10
+        - p["place_5_9"] / 20
+        + (2.0 if spec["toggles"].get("bubble_mode") else 0.0),
+        4,
+    )
+
+
+def _pop(specs: list[dict]) -> list[Individual]:
+    return [
+        Individual(f"seed_{i:04d}", 0, spec, {}, _truth(spec))
+        for i, spec in enumerate(specs, start=1)
+    ]
+
+
+def test_spec_features() -> None:
+    spec = {"params": {"a": 2, "mode": "x"}, "toggles": {"t": True}, "profile_id": "p"}
+    assert spec_features(spec) == {"a": 2.0, 'mode="x"': 1.0, "toggle:t": 1.0, "profile_id=p": 1.0}
+
+
+@pytest.mark.parametrize("kind", ["ridge", "random_features"])
+def test_incremental_fit_and_roundtrip(kind: str, tmp_path: Path) -> None:
+    specs = [_spec(i) for i in range(40)]
+    whole = Surrogate(kind=kind, alpha=1e-3)
+    assert whole.observe(_pop(specs)) == 40
+    assert whole.observe(_pop(specs)) == 0  # already seen
+    parts = Surrogate(kind=kind, alpha=1e-3)
+    parts.observe(_pop(specs[:20]))
+    parts.observe(_pop(specs[20:]))
+    probe = [_spec(i) for i in range(40, 50)]
+    # Scaling is frozen from the first batch, so batching only shifts the ridge penalty.
+    assert np.allclose(whole.predict(probe), parts.predict(probe), atol=1e-3)
+    if kind == "ridge":
+        assert np.allclose(whole.predict(probe), [_truth(s) for s in probe], atol=1e-2)
+
+    loaded = Surrogate.load(parts.save(tmp_path / "surrogate.json"))
+    assert np.array_equal(loaded.predict(probe), parts.predict(probe))
+    assert loaded.seen == parts.seen
+
+
+def test_screen_keeps_best_plus_exploration() -> None:
+    model = Surrogate(explore=0.25, alpha=1e-3)
+    model.observe(_pop([_spec(i) for i in range(30)]))
+    probe = [_spec(i) for i in range(100, 116)]
+    keep = model.screen(probe, 4, seed=7)
+    assert list(keep) == sorted(keep) and len(set(keep.tolist())) == 4
+    best = np.argsort(-model.predict(probe), kind="stable")[:3]
+    assert set(best.tolist()) <= set(keep.tolist())
+    assert np.array_equal(keep, model.screen(probe, 4, seed=7))
+
+
+def _evolve(results: Path, out: Path, surrogate: Surrogate | None) -> list[float]:
+    means = []
+    with Evolution.from_results(
+        results, out, "g0", 9, elite_ratio=0.125, surrogate=surrogate
+    ) as run:
+        for _ in range(4):
+            pop = run.step()
+            scores = {ind.seed_id: _truth(ind.spec) for ind in pop}
+            run.assign_fitness(scores)
+            means.append(sum(scores.values()) / len(scores))
+    return means
+
+
+def test_surrogate_screening_improves_offspring(tmp_path: Path, mk_results) -> None:
+    results = mk_results(
+        tmp_path / "g0", n=16, spec=_spec, fitness=lambda i: {"fitness_score": _truth(_spec(i))}
+    )
+    plain = _evolve(results, tmp_path / "plain", None)
+    screened = _evolve(results, tmp_path / "a", Surrogate(alpha=1e-2))
+    again = _evolve(results, tmp_path / "b", Surrogate(alpha=1e-2))
+
+    assert screened == again
+    assert sum(screened) > sum(plain)
+    for gen in range(1, 5):
+        a = sorted(
+            p.relative_to(tmp_path / "a") for p in (tmp_path / "a" / f"g{gen}").rglob("*.json")
+        )
+        assert all(
+            (tmp_path / "a" / p).read_bytes() == (tmp_path / "b" / p).read_bytes() for p in a
+        )
+    manifest = json.loads((tmp_path / "a" / "g2" / "population_manifest.json").read_text())
+    assert manifest["surrogate"]["screened"] and manifest["surrogate"]["bred"] == 14 * 4
+    assert manifest["surrogate"]["observations"] > 16
+    # Each kept child records the subseed of the slot it was actually bred in.
+    subseeds = {
+        json.loads(p.read_text())["rng_subseed"]
+        for p in (tmp_path / "a" / "g2").glob("seed_*/dna.json")
+    }
+    assert len(subseeds) == 16
@@ -0,0 +1,71 @@
+"""Tests for the parallel hyperparameter sweep runner."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from evo.sweep import grid, random_design, run_sweep
+
+# CSC scores each seed by both place bets.
+_BETS = ("place_6_8", "place_5_9")
+
+
+def _simulated(csc_root: Path) -> list[str]:
+    # Memo answers are written into the same results roots; they carry a ``memo`` block.
+    payloads = [json.loads(p.read_text()) for p in sorted(csc_root.rglob("fitness.json"))]
+    return [p["simulated"] for p in payloads if "memo" not in p]
+
+
+def test_grid_and_random_design() -> None:
+    configs = grid({"elite_ratio": [0.1, 0.25], "tournament_size": [2, 4]})
+    assert configs[0] == {"elite_ratio": 0.1, "tournament_size": 2}
+    assert len(configs) == 4 and configs[-1] == {"elite_ratio": 0.25, "tournament_size": 4}
+
+    space = {"cx_prob": (0.5, 0.9), "tournament_size": (2, 5), "selection": ["fitness"]}
+    designs = random_design(space, 6, seed=3)
+    assert designs == random_design(space, 6, seed=3)
+    for d in designs:
+        assert 0.5 <= d["cx_prob"] <= 0.9 and d["tournament_size"] in range(2, 6)
+        assert d["selection"] == "fitness"
+
+
+def test_sweep_shares_cache_and_writes_table(tmp_path: Path, mk_results, fake_csc) -> None:
+    results = mk_results(tmp_path / "g0")
+    configs = grid({"elite_ratio": [0.125, 0.25], "tournament_size": [2, 4]})
+    configs[-1]["meh_limit"] = 3
+
+    tables = []
+    for workers in (1, 4):
+        csc = tmp_path / f"csc_{workers}"
+        out = tmp_path / f"sweep_{workers}"
+        arms = run_sweep(results, out, "g0", 5, configs, 3, fake_csc(csc, _BETS), workers=workers)
+
+        simulated = _simulated(csc)
+        assert len(simulated) == len(set(simulated)) == sum(a.evaluations for a in arms)
+        assert all(a.evaluations + a.reused == 3 * 8 for a in arms)
+        assert sum(a.reused for a in arms) > 0
+        assert [a.name for a in arms] == ["arm_001", "arm_002", "arm_003", "arm_004"]
+        manifest = json.loads((out / "arm_002" / "g1" / "population_manifest.json").read_text())
+        assert manifest["sweep"]["params"] == {"elite_ratio": 0.125, "tournament_size": 4}
+        assert manifest["tournament_size"] == 4
+        assert not list((out / "memo").glob("*/*.claim"))
+
+        with (out / "sweep.csv").open(newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 4 and rows[0]["arm"] == "arm_001"
+        assert any(row["generations_to_target"] for row in rows)
+        tables.append(
+            [{k: v for k, v in r.items() if k not in ("evaluations", "reused")} for r in rows]
+        )
+    # Which arm simulates a shared spec can vary; the fitness curves cannot.
+    assert tables[0] == tables[1]
+
+
+def test_sweep_rejects_unknown_parameters(tmp_path: Path, mk_results, fake_csc) -> None:
+    results = mk_results(tmp_path / "g0", n=4)
+    with pytest.raises(ValueError, match="Unknown sweep parameters"):
+        run_sweep(results, tmp_path / "out", "g0", 1, [{"elite_raito": 0.2}], 1, fake_csc(tmp_path))